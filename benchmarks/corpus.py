@@ -0,0 +1,228 @@
+"""
+Generate synthetic TextGrids and TextGrid files for the benchmarks.
+
+The TextGrids are random but reproducible: the same options and seed give
+the same files. Run this module to write a corpus to a directory::
+
+    python benchmarks/corpus.py corpus --files 10 --intervals 20000
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+
+try:
+    from mytextgrid.io.builder import TextGridBuilder
+except ImportError:
+    # Older releases: the TextGrids are read from their long-format text.
+    TextGridBuilder = None
+
+# Letters of the labels. They can be encoded in UTF-8, UTF-16 and ISO 8859-1.
+ALPHABET = 'abcdefghijklmnopqrstuvwxyzáéíóúñ'
+
+ENCODINGS = ['utf-8', 'utf-16', 'latin-1']
+FORMATS = ['long', 'short', 'binary']
+
+def generate_textgrid(tiers = 5, intervals = 10000, label_length = 8, multiline = 0.0,
+                      point_tiers = 0, vocabulary = 0, alphabet = ALPHABET, seed = 0):
+    """
+    Create a TextGrid with random boundaries and labels.
+
+    Parameters
+    ----------
+    tiers : int, default 5
+        The number of interval tiers.
+    intervals : int, default 10000
+        The number of intervals of each interval tier and the number of
+        points of each point tier.
+    label_length : int, default 8
+        The mean number of characters of the labels. About one label in
+        four is empty, as silences usually are.
+    multiline : float, default 0.0
+        The proportion of labels that contain a line break and a quote.
+    point_tiers : int, default 0
+        The number of point tiers, added after the interval tiers.
+    vocabulary : int, default 0
+        If greater than 0, the labels are taken from this number of random
+        words, so they repeat as in real tiers. Otherwise, each label is new.
+    alphabet : str, default ALPHABET
+        The characters of the labels.
+    seed : int, default 0
+        The seed of the random generator.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+    """
+    rng = random.Random(seed)
+
+    def word():
+        length = max(1, round(rng.gauss(label_length, label_length / 4)))
+        return ''.join(rng.choice(alphabet) for _ in range(length))
+
+    words = [word() for _ in range(vocabulary)]
+
+    def label():
+        if rng.random() < 0.25:
+            return ''
+        text = rng.choice(words) if words else word()
+        if rng.random() < multiline:
+            middle = len(text) // 2
+            text = f'{text[:middle]}\n"{text[middle:]}"'
+        return text
+
+    def times(size, duration):
+        # Random times in increasing order, written as Praat writes doubles.
+        values = sorted(rng.uniform(0, duration) for _ in range(size))
+        return [round(value, 12) for value in values]
+
+    duration = round(intervals * 0.25, 3)
+    tiers_ = []
+    for tier_index in range(tiers):
+        boundaries = [0, *sorted(set(times(intervals - 1, duration)) - {0}), duration]
+        texts = [label() for _ in boundaries[1:]]
+        tiers_.append(('IntervalTier', f'tier{tier_index + 1}', boundaries, texts))
+    for tier_index in range(point_tiers):
+        points = sorted(set(times(intervals, duration)))
+        texts = [label() for _ in points]
+        tiers_.append(('TextTier', f'points{tier_index + 1}', points, texts))
+
+    if TextGridBuilder is None:
+        return mytextgrid.read_textgrid_from_stream(_long_text(0, duration, tiers_))
+
+    builder = TextGridBuilder()
+    builder.start_textgrid(0, duration)
+    for tier_class, name, times_, texts in tiers_:
+        builder.start_tier(tier_class, name)
+        if tier_class == 'IntervalTier':
+            for xmin, xmax, text in zip(times_, times_[1:], texts):
+                builder.add_interval(xmin, xmax, text)
+        else:
+            for time, text in zip(times_, texts):
+                builder.add_point(time, text)
+    return builder.close()
+
+def _long_text(xmin, xmax, tiers):
+    """Return a TextGrid in long text format, to be read by any release."""
+    quote = lambda text: '"{}"'.format(text.replace('"', '""'))
+    lines = [
+        'File type = "ooTextFile"', 'Object class = "TextGrid"', '',
+        f'xmin = {xmin} ', f'xmax = {xmax} ',
+        f'tiers? <{"exists" if tiers else "absent"}> ', f'size = {len(tiers)} ', 'item []: ',
+    ]
+    for tier_index, (tier_class, name, times, texts) in enumerate(tiers, 1):
+        kind = 'intervals' if tier_class == 'IntervalTier' else 'points'
+        lines += [
+            f'    item [{tier_index}]:', f'        class = "{tier_class}" ',
+            f'        name = {quote(name)} ', f'        xmin = {xmin} ', f'        xmax = {xmax} ',
+            f'        {kind}: size = {len(texts)} ',
+        ]
+        for index, text in enumerate(texts):
+            lines.append(f'        {kind} [{index + 1}]:')
+            if kind == 'intervals':
+                lines += [
+                    f'            xmin = {times[index]} ',
+                    f'            xmax = {times[index + 1]} ',
+                    f'            text = {quote(text)} ',
+                ]
+            else:
+                lines += [
+                    f'            number = {times[index]} ',
+                    f'            mark = {quote(text)} ',
+                ]
+    return '\n'.join(lines) + '\n'
+
+def write_corpus(directory, files = 1, formats = FORMATS, encodings = ENCODINGS, **options):
+    """
+    Write random TextGrids to a directory in several formats and encodings.
+
+    Each TextGrid is written once per text format and encoding and once in
+    binary, since binary files do not have an encoding.
+
+    Parameters
+    ----------
+    directory : str or :class:`pathlib.Path`
+        The directory of the files. It is created if it does not exist.
+    files : int, default 1
+        The number of different TextGrids.
+    formats : list of {'long', 'short', 'binary'}
+        The formats of the files.
+    encodings : list of str
+        The encodings of the long and short format files.
+    **options
+        The options of :func:`generate_textgrid`. The seed of each TextGrid is
+        the given seed plus its index.
+
+    Returns
+    -------
+    list of tuple of (:class:`pathlib.Path`, str, str or None)
+        The path, the format and the encoding of each file.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents = True, exist_ok = True)
+    seed = options.pop('seed', 0)
+
+    paths = []
+    for index in range(files):
+        textgrid = generate_textgrid(seed = seed + index, **options)
+        for format_ in formats:
+            for encoding in [None] if format_ == 'binary' else encodings:
+                suffix = 'bin' if encoding is None else encoding
+                path = directory / f'synthetic-{index + 1}-{format_}-{suffix}.TextGrid'
+                textgrid.write(path, format_, encoding or 'utf-8')
+                paths.append((path, format_, encoding))
+    return paths
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument('directory', help = 'the directory where the files are written')
+    parser.add_argument('--files', type = int, default = 1, help = 'the number of TextGrids')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    paths = write_corpus(args.directory, args.files, args.formats, args.encodings,
+                         **textgrid_options(args))
+    for path, _, _ in paths:
+        print(path)
+
+def add_arguments(parser):
+    """Add the corpus options to an :class:`argparse.ArgumentParser`."""
+    parser.add_argument('--tiers', type = int, default = 5,
+                        help = 'the number of interval tiers (default: 5)')
+    parser.add_argument('--point-tiers', type = int, default = 0,
+                        help = 'the number of point tiers (default: 0)')
+    parser.add_argument('--intervals', type = int, default = 10000,
+                        help = 'the number of intervals or points per tier (default: 10000)')
+    parser.add_argument('--label-length', type = int, default = 8,
+                        help = 'the mean number of characters per label (default: 8)')
+    parser.add_argument('--multiline', type = float, default = 0.0,
+                        help = 'the proportion of labels with a line break (default: 0)')
+    parser.add_argument('--vocabulary', type = int, default = 0,
+                        help = 'the number of distinct labels, or 0 for random labels (default: 0)')
+    parser.add_argument('--formats', nargs = '+', choices = FORMATS, default = FORMATS,
+                        help = 'the file formats (default: all)')
+    parser.add_argument('--encodings', nargs = '+', default = ENCODINGS,
+                        help = 'the encodings of the text formats (default: %(default)s)')
+    parser.add_argument('--seed', type = int, default = 0,
+                        help = 'the seed of the random generator (default: 0)')
+
+def textgrid_options(args):
+    """Return the options of :func:`generate_textgrid` from parsed arguments."""
+    return {
+        'tiers': args.tiers,
+        'intervals': args.intervals,
+        'label_length': args.label_length,
+        'multiline': args.multiline,
+        'point_tiers': args.point_tiers,
+        'vocabulary': args.vocabulary,
+        'seed': args.seed,
+    }
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""
+Measure how fast mytextgrid reads, writes and edits TextGrids.
+
+A synthetic corpus is generated in a temporary directory (see
+:mod:`corpus`), then each benchmark is run several times and the best time
+is reported. The memory group reports the bytes held per item by a TextGrid
+read from a file, and the peak while reading it. Save the results with
+``--output`` and compare a later run with ``--compare`` to find regressions
+between releases::
+
+    python benchmarks/run.py --intervals 20000 --output before.json
+    python benchmarks/run.py --intervals 20000 --compare before.json
+"""
+import argparse
+import gc
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import corpus
+
+import mytextgrid
+from mytextgrid.__about__ import __version__
+from mytextgrid.core.interval_tier import IntervalTier
+from mytextgrid.core.point_tier import PointTier
+
+try:
+    from mytextgrid.core.columnar_tier import ColumnarIntervalTier
+except ImportError:
+    # Older releases: the columnar benchmarks are skipped.
+    ColumnarIntervalTier = None
+
+GROUPS = ['read', 'write', 'ops', 'import', 'memory']
+
+def measure(func, repeat):
+    """Return the best time (in seconds) of `repeat` calls to `func`."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_io(directory, args):
+    """Yield the read and write results of each format and encoding."""
+    textgrid = corpus.generate_textgrid(**corpus.textgrid_options(args))
+    items = sum(len(tier) for tier in textgrid)
+    paths = corpus.write_corpus(directory, 1, args.formats, args.encodings,
+                                **corpus.textgrid_options(args))
+
+    for path, format_, encoding in paths:
+        label = format_ if encoding is None else f'{format_} {encoding}'
+        size = path.stat().st_size
+        if 'read' in args.groups:
+            seconds = measure(lambda: mytextgrid.read_textgrid(path, format_), args.repeat)
+            yield _result(f'read {label}', seconds, size, items)
+        if 'write' in args.groups:
+            dst_path = Path(directory) / 'output.TextGrid'
+            write = lambda: textgrid.write(dst_path, format_, encoding or 'utf-8')
+            seconds = measure(write, args.repeat)
+            yield _result(f'write {label}', seconds, size, items)
+
+def bench_ops(args):
+    """Yield the results of inserting and looking up items in a tier."""
+    rng = random.Random(args.seed)
+    size = args.ops
+    duration = size
+    times = [round(rng.uniform(0, duration), 6) for _ in range(size)]
+    times = list(dict.fromkeys(time_ for time_ in times if 0 < time_ < duration))
+
+    def insert_boundaries():
+        tier = IntervalTier('ops', 0, duration)
+        for time_ in times:
+            tier.insert_boundary(time_)
+        return tier
+
+    def insert_points():
+        tier = PointTier('ops', 0, duration)
+        for time_ in times:
+            tier.insert_point(time_)
+        return tier
+
+    yield _result('insert_boundary', measure(insert_boundaries, args.repeat), items = len(times))
+    yield _result('insert_point', measure(insert_points, args.repeat), items = len(times))
+
+    interval_tier = insert_boundaries()
+    point_tier = insert_points()
+    queries = [round(rng.uniform(0, duration), 6) for _ in range(size)]
+
+    def interval_lookups():
+        for time_ in queries:
+            interval_tier.get_index_at_time(time_)
+
+    def point_lookups():
+        for time_ in times:
+            point_tier.get_index_at_time(time_)
+
+    seconds = measure(interval_lookups, args.repeat)
+    yield _result('IntervalTier.get_index_at_time', seconds, items = size)
+
+    columnar_tiers = [] if ColumnarIntervalTier is None else [('columnar', None), ('ticks', '1e-9')]
+    for name, resolution in columnar_tiers:
+        columnar_tier = ColumnarIntervalTier.from_tier(interval_tier, resolution = resolution)
+
+        def columnar_lookups():
+            for time_ in queries:
+                columnar_tier.get_index_at_time(time_)
+
+        seconds = measure(columnar_lookups, args.repeat)
+        yield _result(f'{name} get_index_at_time', seconds, items = size)
+    seconds = measure(point_lookups, args.repeat)
+    yield _result('PointTier.get_index_at_time', seconds, items = len(times))
+
+def bench_import(args):
+    """Yield the time of ``import mytextgrid`` in a new interpreter."""
+    code = f'import sys; sys.path.insert(0, {str(corpus.package_dir)!r}); import mytextgrid'
+
+    def import_():
+        subprocess.run([sys.executable, '-c', code], check = True)
+
+    def startup():
+        subprocess.run([sys.executable, '-c', 'pass'], check = True)
+
+    seconds = measure(import_, args.repeat) - measure(startup, args.repeat)
+    yield _result('import mytextgrid', max(seconds, 0.0))
+
+def bench_memory(directory, args):
+    """
+    Yield the memory held by a TextGrid read from a long format file, with
+    item objects and with columnar tiers.
+    """
+    path = Path(directory) / 'memory.TextGrid'
+    textgrid = corpus.generate_textgrid(**corpus.textgrid_options(args))
+    items = sum(len(tier) for tier in textgrid)
+    textgrid.write(path)
+    del textgrid
+
+    reads = [('memory read long', {})]
+    if ColumnarIntervalTier is not None:
+        reads.append(('memory read long columnar', {'columnar': True}))
+    for name, options in reads:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            textgrid = mytextgrid.read_textgrid(path, **options)
+            seconds = time.perf_counter() - start
+            # Count only what the TextGrid holds, not the garbage left by the reading.
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del textgrid
+        yield _result(name, seconds, path.stat().st_size, items, bytes = current, peak = peak)
+
+def _result(name, seconds, size = None, items = None, **memory):
+    return {'name': name, 'seconds': seconds, 'size': size, 'items': items, **memory}
+
+def run(args):
+    """Run the selected benchmarks and return their results."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        benches = []
+        if {'read', 'write'} & set(args.groups):
+            benches.append(bench_io(directory, args))
+        if 'ops' in args.groups:
+            benches.append(bench_ops(args))
+        if 'import' in args.groups:
+            benches.append(bench_import(args))
+        if 'memory' in args.groups:
+            benches.append(bench_memory(directory, args))
+
+        for bench in benches:
+            for result in bench:
+                results.append(result)
+                print(format_result(result, args.baseline.get(result['name'])), flush = True)
+    return results
+
+def format_result(result, baseline = None):
+    """Return a line of the result table."""
+    if 'bytes' in result:
+        return _format_memory(result, baseline)
+
+    seconds = result['seconds']
+    line = f"{result['name']:<32} {seconds * 1000:>10.1f} ms"
+    if result['size']:
+        line += f"  {result['size'] / seconds / 2 ** 20:>8.1f} MiB/s"
+    else:
+        line += ' ' * 16
+    if result['items']:
+        line += f"  {result['items'] / seconds / 1000:>8.1f} k items/s"
+    else:
+        line += ' ' * 20
+    if baseline is not None and baseline['seconds'] > 0:
+        change = seconds / baseline['seconds'] - 1
+        line += f'  {change:+7.1%}'
+    return line
+
+def _format_memory(result, baseline = None):
+    # Tracing allocations slows down the reading, so the time is not shown.
+    per_item = result['bytes'] / result['items']
+    line = f"{result['name']:<32} {per_item:>10.0f} B/item"
+    line += f"  {result['peak'] / result['items']:>8.0f} B/item at peak"
+    if baseline is not None and baseline.get('bytes'):
+        change = result['bytes'] / baseline['bytes'] - 1
+        line += f'  {change:+7.1%}'
+    return line
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    corpus.add_arguments(parser)
+    parser.add_argument('--ops', type = int, default = 2000,
+                        help = 'the number of items inserted and looked up in tiers '
+                               '(default: 2000)')
+    parser.add_argument('--groups', nargs = '+', choices = GROUPS, default = GROUPS,
+                        help = 'the benchmarks to run (default: all)')
+    parser.add_argument('--repeat', type = int, default = 3,
+                        help = 'the number of runs of each benchmark (default: 3)')
+    parser.add_argument('--output', type = Path,
+                        help = 'write the results to a JSON file')
+    parser.add_argument('--compare', type = Path,
+                        help = 'show the change in time (or memory) against a JSON file '
+                               'from --output')
+    args = parser.parse_args(argv)
+
+    args.baseline = {}
+    if args.compare is not None:
+        with open(args.compare, encoding = 'utf-8') as file:
+            args.baseline = {result['name']: result for result in json.load(file)['results']}
+
+    results = run(args)
+    if args.output is not None:
+        options = {key: value for key, value in vars(args).items()
+                   if key not in ('output', 'compare', 'baseline')}
+        data = {
+            'mytextgrid': __version__,
+            'python': sys.version.split()[0],
+            'options': options,
+            'results': results,
+        }
+        with open(args.output, 'w', encoding = 'utf-8') as file:
+            json.dump(data, file, indent = 2)
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,14 @@
 from mytextgrid.io import create_textgrid
 from mytextgrid.io import read_textgrid
 from mytextgrid.io import read_textgrid_from_stream
+from mytextgrid.io import iterparse
+from mytextgrid.io import read_textgrid_info
+from mytextgrid.io import TextGridParser
 from mytextgrid.io.utils import is_textgrid_file
+
+def __getattr__(name):
+    # The functions whose modules are imported on first use.
+    from mytextgrid import io
+    if name in io._DEFERRED:
+        return getattr(io, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
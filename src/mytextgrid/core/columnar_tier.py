@@ -0,0 +1,752 @@
+"""
+Tiers that store their items in columns.
+
+A :class:`ColumnarIntervalTier` keeps its boundaries and a
+:class:`ColumnarPointTier` its times in compact arrays, and both keep their
+texts in a list. No item object is stored: indexing or iterating the tier
+returns :class:`~mytextgrid.core.interval_tier.Interval` and
+:class:`~mytextgrid.core.point_tier.Point` objects made on access, whose
+text can be set as usual. A columnar tier takes about a third of the memory
+of a regular tier, less if its labels repeat, and looks up times by binary
+search instead of scanning the items.
+
+Use :func:`to_columnar` or ``read_textgrid(..., columnar=True)`` to get
+a TextGrid with columnar tiers.
+
+Columnar tiers can also keep their times as integer ticks of a given
+resolution, e.g. ``resolution='1e-9'`` for nanoseconds. The times are then
+looked up by comparing integers, and the exact values only break the ties
+between times closer than the resolution, so the results are the same.
+"""
+import decimal
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+
+from mytextgrid.core.interval_tier import Interval, IntervalTier
+from mytextgrid.core.lazy_tier import LazyTier
+from mytextgrid.core.point_tier import Point, PointTier
+from mytextgrid.core.tier_abstract import TierAbstract
+from mytextgrid.core.utils import _share_texts, obj_to_decimal
+
+decimal.getcontext().prec = 16
+
+# Scale times without rounding them to the precision of the default context.
+_EXACT = decimal.Context(prec = decimal.MAX_PREC, Emax = decimal.MAX_EMAX, Emin = decimal.MIN_EMIN)
+
+class _DecimalArray:
+    """
+    A list of :class:`decimal.Decimal` stored as integer coefficients and
+    exponents, so that each value takes 9 bytes.
+
+    The values keep their exact digits, e.g. ``Decimal('0.50')`` is read
+    back as ``Decimal('0.50')``. If a value does not fit (more than 18
+    digits), the columns become lists of int.
+    """
+    __slots__ = ('_coefficients', '_exponents')
+
+    resolution = None
+
+    def __init__(self, values = ()):
+        coefficients, exponents = [], []
+        for value in values:
+            coefficient, exponent = _split(value)
+            coefficients.append(coefficient)
+            exponents.append(exponent)
+        try:
+            self._coefficients = array('q', coefficients)
+            self._exponents = array('b', exponents)
+        except OverflowError:
+            self._coefficients = coefficients
+            self._exponents = exponents
+
+    def __len__(self):
+        return len(self._exponents)
+
+    def __getitem__(self, index):
+        return decimal.Decimal(self._coefficients[index]).scaleb(self._exponents[index], _EXACT)
+
+    def __setitem__(self, index, value):
+        coefficient, exponent = _split(value)
+        try:
+            self._coefficients[index] = coefficient
+            self._exponents[index] = exponent
+        except OverflowError:
+            self._widen()
+            self._coefficients[index] = coefficient
+            self._exponents[index] = exponent
+
+    def __delitem__(self, index):
+        del self._coefficients[index]
+        del self._exponents[index]
+
+    def __iter__(self):
+        for coefficient, exponent in zip(self._coefficients, self._exponents):
+            yield decimal.Decimal(coefficient).scaleb(exponent, _EXACT)
+
+    def insert(self, index, value):
+        coefficient, exponent = _split(value)
+        try:
+            self._coefficients.insert(index, coefficient)
+        except OverflowError:
+            self._widen()
+            self._coefficients.insert(index, coefficient)
+        try:
+            self._exponents.insert(index, exponent)
+        except OverflowError:
+            self._widen()
+            self._exponents.insert(index, exponent)
+
+    def bisect_left(self, value):
+        """
+        Return the index where `value` would be inserted before equal values.
+        """
+        return bisect_left(self, value)
+
+    def bisect_right(self, value):
+        """
+        Return the index where `value` would be inserted after equal values.
+        """
+        return bisect_right(self, value)
+
+    def _widen(self):
+        self._coefficients = list(self._coefficients)
+        self._exponents = list(self._exponents)
+
+class _TickArray(_DecimalArray):
+    """
+    A :class:`_DecimalArray` that also keeps each value as a number of ticks
+    of `resolution` (rounded down), to search it with integer comparisons.
+    """
+    __slots__ = ('_ticks', 'resolution')
+
+    def __init__(self, values, resolution):
+        self.resolution = _check_resolution(resolution)
+        values = list(values)
+        super().__init__(values)
+        ticks = [self._to_ticks(value) for value in values]
+        try:
+            self._ticks = array('q', ticks)
+        except OverflowError:
+            self._ticks = ticks
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        ticks = self._to_ticks(value)
+        try:
+            self._ticks[index] = ticks
+        except OverflowError:
+            self._ticks = list(self._ticks)
+            self._ticks[index] = ticks
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        del self._ticks[index]
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        ticks = self._to_ticks(value)
+        try:
+            self._ticks.insert(index, ticks)
+        except OverflowError:
+            self._ticks = list(self._ticks)
+            self._ticks.insert(index, ticks)
+
+    def bisect_left(self, value):
+        ticks = self._to_ticks(value)
+        low = bisect_left(self._ticks, ticks)
+        high = bisect_right(self._ticks, ticks, low)
+        if low == high:
+            return low
+        # Only the values in the same tick are compared as Decimals.
+        return bisect_left(self, value, low, high)
+
+    def bisect_right(self, value):
+        ticks = self._to_ticks(value)
+        low = bisect_left(self._ticks, ticks)
+        high = bisect_right(self._ticks, ticks, low)
+        if low == high:
+            return low
+        return bisect_right(self, value, low, high)
+
+    def _to_ticks(self, value):
+        quotient, remainder = _EXACT.divmod(value, self.resolution)
+        if remainder < 0:
+            quotient -= 1
+        return int(quotient)
+
+def _check_resolution(resolution):
+    resolution_ = obj_to_decimal(resolution)
+    if not (resolution_.is_finite() and resolution_ > 0):
+        raise ValueError('resolution MUST BE a positive number.')
+    return resolution_
+
+def _make_times(values, resolution):
+    """
+    Return the column of the times of a tier.
+    """
+    if resolution is None:
+        return _DecimalArray(values)
+    return _TickArray(values, resolution)
+
+def _split(value):
+    """
+    Return the integer coefficient and the exponent of a Decimal.
+    """
+    if not value.is_finite():
+        raise ValueError(f'{value} is not a valid time.')
+    exponent = value.as_tuple().exponent
+    return int(value.scaleb(-exponent, _EXACT)), exponent
+
+class ColumnarIntervalTier(IntervalTier):
+    """
+    An :class:`~mytextgrid.core.interval_tier.IntervalTier` that stores its
+    boundaries and texts in columns.
+
+    The intervals returned by indexing and iteration are made on access:
+    ``tier[0] is tier[0]`` is False and the list returned by :attr:`items`
+    is a copy. Setting the text of an interval sets it in the tier, unless
+    the interval has been removed or split since it was taken.
+    """
+    __slots__ = ('_times', '_texts')
+
+    def __init__(self, name = '', xmin = 0, xmax = 1, textgrid = None, resolution = None):
+        """
+        Initialize an instance of :class:`ColumnarIntervalTier`.
+
+        Parameters
+        ----------
+        name : str, default ''
+            The name of the tier.
+        xmin : int, float str or :class:`decimal.Decimal`
+            The starting time (in seconds) of the tier.
+        xmax : int, float str or :class:`decimal.Decimal`
+            The ending time (in seconds) of the tier.
+        textgrid : :class:`mytextgrid.core.textgrid.TextGrid` or None
+            The containing TextGrid object.
+        resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+            If given, the times are also kept as integer ticks of this
+            duration (in seconds), e.g. ``'1e-9'``, to look them up faster.
+        """
+        TierAbstract.__init__(self, name, xmin, xmax, True, textgrid)
+        self._items = None
+        self._times = _make_times([self._xmin, self._xmax], resolution)
+        self._texts = ['']
+
+    @classmethod
+    def from_boundaries(cls, times, texts, name = '', textgrid = None, resolution = None):
+        """
+        Create a :class:`ColumnarIntervalTier` from all its boundaries and
+        texts at once.
+
+        See :meth:`IntervalTier.from_boundaries() <mytextgrid.core.interval_tier.IntervalTier.from_boundaries>`.
+        The `resolution` is the one of :class:`ColumnarIntervalTier`.
+        """
+        times_ = [obj_to_decimal(time) for time in times]
+        texts_ = _share_texts(texts)
+
+        if len(times_) < 2:
+            raise ValueError('times MUST INCLUDE at least the starting and ending times.')
+        if len(times_) != len(texts_) + 1:
+            raise ValueError('times MUST HAVE one item more than texts.')
+        for left_time, right_time in zip(times_, times_[1:]):
+            if not left_time < right_time:
+                raise ValueError(f'Boundaries are not in increasing order at {right_time}.')
+        for text in texts_:
+            if not isinstance(text, str):
+                raise TypeError('text MUST BE a str.')
+
+        tier = cls(name, times_[0], times_[-1], textgrid, resolution)
+        tier._times = _make_times(times_, tier.resolution)
+        tier._texts = texts_
+        return tier
+
+    @classmethod
+    def from_tier(cls, tier, textgrid = None, resolution = None):
+        """
+        Copy an :class:`~mytextgrid.core.interval_tier.IntervalTier` into a
+        :class:`ColumnarIntervalTier`.
+
+        Parameters
+        ----------
+        tier : :class:`~mytextgrid.core.interval_tier.IntervalTier`
+            The tier to copy.
+        textgrid : :class:`mytextgrid.core.textgrid.TextGrid` or None
+            The TextGrid that contains the new tier.
+        resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+            The duration of the ticks of the times, or None to keep only
+            the exact times.
+
+        Returns
+        -------
+        :class:`ColumnarIntervalTier`
+            A new tier.
+        """
+        times = [tier[0].xmin]
+        times.extend(interval.xmax for interval in tier)
+        texts = [interval.text for interval in tier]
+        return cls.from_boundaries(times, texts, tier.name, textgrid, resolution)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __iter__(self):
+        times = iter(self._times)
+        xmin = next(times)
+        for index, (xmax, text) in enumerate(zip(times, self._texts)):
+            yield self._make_interval(index, xmin, xmax, text)
+            xmin = xmax
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[index] for index in range(*key.indices(len(self)))]
+        index = _check_index(key, len(self))
+        return self._make_interval(index, self._times[index], self._times[index + 1],
+                                   self._texts[index])
+
+    @property
+    def items(self):
+        """
+        Return a list with the intervals of the tier.
+        """
+        return list(self)
+
+    @property
+    def resolution(self):
+        """
+        Return the duration of the ticks of the times, or None.
+        """
+        return self._times.resolution
+
+    def insert_boundary(self, time):
+        """
+        Insert a time boundary into the tier.
+
+        See :meth:`IntervalTier.insert_boundary() <mytextgrid.core.interval_tier.IntervalTier.insert_boundary>`.
+        """
+        time_ = obj_to_decimal(time)
+        self.eval_time_range(time_) # Raise exceptions if out of the tier range
+
+        index = self.get_index_at_time(time_)
+        if self._times[index] == time_:
+            raise ValueError(f'There is already a boundary at {time_}')
+
+        self._times.insert(index + 1, time_)
+        self._texts.insert(index + 1, '')
+        return (index, index+1)
+
+    def remove_boundary(self, time):
+        """
+        Remove a time boundary from the tier.
+
+        See :meth:`IntervalTier.remove_boundary() <mytextgrid.core.interval_tier.IntervalTier.remove_boundary>`.
+        """
+        time_ = obj_to_decimal(time)
+        self.eval_time_range(time_) # Raise exceptions if out of range
+
+        index = self.get_index_at_time_boundary(time_)
+        if index is None:
+            raise ValueError(f'No boundary to remove at {time}.')
+
+        self._texts[index-1] += self._texts[index]
+        del self._texts[index]
+        del self._times[index]
+
+    def move_boundary(self, src_time, dst_time):
+        """
+        Move a boundary to another location between the time range of the left and right intervals
+        of the source location.
+
+        See :meth:`IntervalTier.move_boundary() <mytextgrid.core.interval_tier.IntervalTier.move_boundary>`.
+        """
+        src_time_ = obj_to_decimal(src_time)
+        dst_time_ = obj_to_decimal(dst_time)
+
+        if src_time_ == dst_time_:
+            raise ValueError('src_time and dst_time MUST NOT BE equal')
+        self.eval_time_range(src_time_)
+        self.eval_time_range(dst_time_)
+
+        index = self.get_index_at_time_boundary(src_time_)
+        if index is None:
+            raise ValueError(f'No boundary found at src_time ({src_time_})')
+
+        # The boundaries must stay in increasing order.
+        if not self._times[index-1] < dst_time_ < self._times[index+1]:
+            raise ValueError('Cannot move the source boundary outside its neighbors boundaries.')
+
+        self._times[index] = dst_time_
+
+    def set_text_at_index(self, index, *text_items):
+        """
+        Set the text of one or more of intervals.
+
+        See :meth:`IntervalTier.set_text_at_index() <mytextgrid.core.interval_tier.IntervalTier.set_text_at_index>`.
+        """
+        if (index + len(text_items) - 1) > len(self._texts):
+            raise IndexError('more text items than intervals.')
+
+        for index_, text in enumerate(text_items, start = index):
+            if not isinstance(text, str):
+                raise TypeError('text MUST BE a str')
+            self._texts[index_] = text
+
+    def get_index_at_time(self, time):
+        """
+        Return the index of an interval at the given time.
+
+        See :meth:`IntervalTier.get_index_at_time() <mytextgrid.core.interval_tier.IntervalTier.get_index_at_time>`.
+        """
+        time_ = obj_to_decimal(time)
+
+        if time_ == self._xmax:
+            return len(self._texts) - 1 # Returns the last index
+
+        index = self._times.bisect_right(time_) - 1
+        if 0 <= index < len(self._texts):
+            return index
+        return None
+
+    def get_interval_at_time(self, time):
+        """
+        Return the interval at the specified time.
+
+        See :meth:`IntervalTier.get_interval_at_time() <mytextgrid.core.interval_tier.IntervalTier.get_interval_at_time>`.
+        """
+        index = self.get_index_at_time(time)
+        if index is None:
+            return None
+        return self[index]
+
+    def get_index_at_time_boundary(self, time):
+        """
+        Get the index of an interval at a given boundary.
+
+        See :meth:`IntervalTier.get_index_at_time_boundary() <mytextgrid.core.interval_tier.IntervalTier.get_index_at_time_boundary>`.
+        """
+        time_ = obj_to_decimal(time)
+
+        index = self._times.bisect_left(time_)
+        if 0 < index < len(self._texts) and self._times[index] == time_:
+            return index
+        return None
+
+    def _make_interval(self, index, xmin, xmax, text):
+        interval = _ColumnarInterval.__new__(_ColumnarInterval)
+        interval._tier = self
+        interval._xmin = xmin
+        interval._xmax = xmax
+        interval._text = text
+        interval._index = index
+        return interval
+
+    def _set_text(self, interval):
+        """
+        Copy the text of an interval taken from the tier, if it is still there.
+        """
+        index = interval._index
+        times = self._times
+        if not (index < len(self._texts) and times[index] == interval._xmin):
+            index = times.bisect_left(interval._xmin)
+        if index < len(self._texts) and times[index] == interval._xmin \
+                and times[index + 1] == interval._xmax:
+            self._texts[index] = interval._text
+            interval._index = index
+
+class ColumnarPointTier(PointTier):
+    """
+    A :class:`~mytextgrid.core.point_tier.PointTier` that stores its times
+    and texts in columns.
+
+    The points returned by indexing and iteration are made on access:
+    ``tier[0] is tier[0]`` is False and the list returned by :attr:`items`
+    is a copy. Setting the text of a point sets it in the tier, unless the
+    point has been removed since it was taken.
+    """
+    __slots__ = ('_times', '_texts')
+
+    def __init__(self, name = '', xmin = 0, xmax = 1, textgrid = None, resolution = None):
+        """
+        Initialize an instance of :class:`ColumnarPointTier`.
+
+        Parameters
+        ----------
+        name : str, default ''
+            The name of the tier.
+        xmin : int, float str or :class:`decimal.Decimal`
+            The starting time (in seconds) of the tier.
+        xmax : int, float str or :class:`decimal.Decimal`
+            The ending time (in seconds) of the tier.
+        textgrid : :class:`mytextgrid.core.textgrid.TextGrid` or None
+            The containing TextGrid object.
+        resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+            If given, the times are also kept as integer ticks of this
+            duration (in seconds), e.g. ``'1e-9'``, to look them up faster.
+        """
+        TierAbstract.__init__(self, name, xmin, xmax, False, textgrid)
+        self._items = None
+        self._times = _make_times((), resolution)
+        self._texts = []
+
+    @classmethod
+    def from_points(cls, times, marks, name = '', xmin = 0, xmax = 1, textgrid = None,
+                    resolution = None):
+        """
+        Create a :class:`ColumnarPointTier` from all its points at once.
+
+        See :meth:`PointTier.from_points() <mytextgrid.core.point_tier.PointTier.from_points>`.
+        The `resolution` is the one of :class:`ColumnarPointTier`.
+        """
+        tier = cls(name, xmin, xmax, textgrid, resolution)
+
+        times_ = [obj_to_decimal(time) for time in times]
+        marks_ = _share_texts(marks)
+
+        if len(times_) != len(marks_):
+            raise ValueError('times and marks MUST HAVE the same number of items.')
+        if times_ and not tier.xmin <= times_[0] <= times_[-1] <= tier.xmax:
+            raise ValueError(f'Points are out of range of the tier {tier.name}.')
+        for left_time, right_time in zip(times_, times_[1:]):
+            if not left_time < right_time:
+                raise ValueError(f'Points are not in increasing order at {right_time}.')
+        for mark in marks_:
+            if not isinstance(mark, str):
+                raise TypeError('text MUST BE a str.')
+
+        tier._times = _make_times(times_, tier.resolution)
+        tier._texts = marks_
+        return tier
+
+    @classmethod
+    def from_tier(cls, tier, textgrid = None, resolution = None):
+        """
+        Copy a :class:`~mytextgrid.core.point_tier.PointTier` into a
+        :class:`ColumnarPointTier`.
+
+        Parameters
+        ----------
+        tier : :class:`~mytextgrid.core.point_tier.PointTier`
+            The tier to copy.
+        textgrid : :class:`mytextgrid.core.textgrid.TextGrid` or None
+            The TextGrid that contains the new tier.
+        resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+            The duration of the ticks of the times, or None to keep only
+            the exact times.
+
+        Returns
+        -------
+        :class:`ColumnarPointTier`
+            A new tier.
+        """
+        times = [point.time for point in tier]
+        marks = [point.text for point in tier]
+        return cls.from_points(times, marks, tier.name, tier.xmin, tier.xmax, textgrid, resolution)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __iter__(self):
+        for index, (time, text) in enumerate(zip(self._times, self._texts)):
+            yield self._make_point(index, time, text)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[index] for index in range(*key.indices(len(self)))]
+        index = _check_index(key, len(self))
+        return self._make_point(index, self._times[index], self._texts[index])
+
+    @property
+    def items(self):
+        """
+        Return a list with the points of the tier.
+        """
+        return list(self)
+
+    @property
+    def resolution(self):
+        """
+        Return the duration of the ticks of the times, or None.
+        """
+        return self._times.resolution
+
+    def insert_point(self, time, text = ''):
+        """
+        Insert a point into the tier.
+
+        See :meth:`PointTier.insert_point() <mytextgrid.core.point_tier.PointTier.insert_point>`.
+        """
+        time_ = obj_to_decimal(time)
+        self.eval_time_range(time_) # Check if out of range
+        if not isinstance(text, str):
+            raise TypeError('text MUST BE a str.')
+
+        index = self._times.bisect_left(time_)
+        if index < len(self._texts) and self._times[index] == time_:
+            raise ValueError(f'Cannot insert a Point at {time}.')
+
+        self._times.insert(index, time_)
+        self._texts.insert(index, text)
+
+    def remove_point(self, index):
+        """
+        Remove a Point.
+
+        See :meth:`PointTier.remove_point() <mytextgrid.core.point_tier.PointTier.remove_point>`.
+        """
+        index = _check_index(index, len(self))
+        del self._times[index]
+        del self._texts[index]
+
+    def get_index_at_time(self, time):
+        """
+        Get the index of an existing `Point`.
+
+        See :meth:`PointTier.get_index_at_time() <mytextgrid.core.point_tier.PointTier.get_index_at_time>`.
+        """
+        time_ = obj_to_decimal(time)
+        self.eval_time_range(time_) # Check if out of range
+
+        index = self._times.bisect_left(time_)
+        if index < len(self._texts) and self._times[index] == time_:
+            return index
+        return None
+
+    def get_point_at_time(self, time):
+        """
+        Get the point at the specified time in the tier.
+
+        See :meth:`PointTier.get_point_at_time() <mytextgrid.core.point_tier.PointTier.get_point_at_time>`.
+        """
+        index = self.get_index_at_time(time)
+        if index is None:
+            return None
+        return self[index]
+
+    def _make_point(self, index, time, text):
+        point = _ColumnarPoint.__new__(_ColumnarPoint)
+        point._tier = self
+        point._time = time
+        point._text = text
+        point._index = index
+        return point
+
+    def _set_text(self, point):
+        """
+        Copy the text of a point taken from the tier, if it is still there.
+        """
+        index = point._index
+        times = self._times
+        if not (index < len(self._texts) and times[index] == point._time):
+            index = times.bisect_left(point._time)
+        if index < len(self._texts) and times[index] == point._time:
+            self._texts[index] = point._text
+            point._index = index
+
+class _ColumnarInterval(Interval):
+    """
+    An interval of a :class:`ColumnarIntervalTier`.
+    """
+    __slots__ = ('_index',)
+
+    @Interval.text.setter
+    def text(self, value):
+        Interval.text.fset(self, value)
+        self._tier._set_text(self)
+
+class _ColumnarPoint(Point):
+    """
+    A point of a :class:`ColumnarPointTier`.
+    """
+    __slots__ = ('_index',)
+
+    @Point.text.setter
+    def text(self, value):
+        Point.text.fset(self, value)
+        self._tier._set_text(self)
+
+def _check_index(index, size):
+    """
+    Return a non-negative index, or raise IndexError if it is out of range.
+    """
+    index = operator.index(index)
+    if index < 0:
+        index += size
+    if not 0 <= index < size:
+        raise IndexError('tier index out of range')
+    return index
+
+def to_columnar(textgrid, resolution = None):
+    """
+    Return a copy of a TextGrid whose tiers store their items in columns.
+
+    Tiers that are read on first access (see ``read_textgrid(..., lazy=True)``)
+    are still read on first access, and are then copied.
+
+    Parameters
+    ----------
+    textgrid : :class:`mytextgrid.TextGrid`
+        A TextGrid object. It is not modified.
+    resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+        If given, the times are also kept as integer ticks of this duration
+        (in seconds), e.g. ``'1e-9'``, to look them up faster.
+
+    Returns
+    -------
+    :class:`mytextgrid.TextGrid`
+        A new TextGrid with :class:`ColumnarIntervalTier` and
+        :class:`ColumnarPointTier` tiers.
+
+    Examples
+    --------
+    >>> from mytextgrid.core.columnar_tier import to_columnar
+    >>> textgrid = to_columnar(mytextgrid.read_textgrid('corpus.TextGrid'))
+    >>> textgrid = to_columnar(mytextgrid.read_textgrid('corpus.TextGrid'), resolution = '1e-9')
+    """
+    if resolution is not None:
+        resolution = _check_resolution(resolution)
+
+    copy = type(textgrid)(textgrid.xmin, textgrid.xmax)
+    for tier in textgrid._tiers:
+        if isinstance(tier, LazyTier):
+            tier = LazyTier(tier.name, tier.is_interval(), len(tier),
+                            lambda copy_, tier = tier: _to_columnar_tier(tier.load(copy_), copy_,
+                                                                         resolution))
+        else:
+            tier = _to_columnar_tier(tier, copy, resolution)
+        copy._tiers.append(tier)
+    return copy
+
+def columnar_tier_factory(resolution = None):
+    """
+    Return a tier factory that builds columnar tiers while a file is read.
+
+    Pass it to :class:`~mytextgrid.io.builder.TextGridBuilder`, so that
+    the times and texts of each tier go into the columns without making
+    item objects first.
+
+    Parameters
+    ----------
+    resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+        If given, the times are also kept as integer ticks of this duration
+        (in seconds).
+
+    Returns
+    -------
+    callable
+        A function with the parameters of
+        :func:`~mytextgrid.io.builder.build_tier` that returns a
+        :class:`ColumnarIntervalTier` or a :class:`ColumnarPointTier`.
+    """
+    if resolution is not None:
+        resolution = _check_resolution(resolution)
+
+    def build_tier(tier_class, times, texts, name, xmin, xmax, textgrid = None):
+        if tier_class == 'IntervalTier':
+            return ColumnarIntervalTier.from_boundaries(times, texts, name, textgrid, resolution)
+        return ColumnarPointTier.from_points(times, texts, name, xmin, xmax, textgrid, resolution)
+    return build_tier
+
+def _to_columnar_tier(tier, textgrid, resolution):
+    if tier.is_interval():
+        return ColumnarIntervalTier.from_tier(tier, textgrid, resolution)
+    return ColumnarPointTier.from_tier(tier, textgrid, resolution)
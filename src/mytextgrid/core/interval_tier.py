@@ -2,7 +2,7 @@
 import decimal
 
 from mytextgrid.core.tier_abstract import TierAbstract
-from mytextgrid.core.utils import obj_to_decimal
+from mytextgrid.core.utils import _share_texts, obj_to_decimal
 
 decimal.getcontext().prec = 16
 
@@ -10,6 +10,8 @@ class IntervalTier(TierAbstract):
     """
     A class representation for an interval tier.
     """
+    __slots__ = ()
+
     def __init__(self, name = '', xmin = 0, xmax = 1, textgrid = None):
         """
         Initialize an instance of :class:`~mytextgrid.core.interval_tier.IntervalTier`.
@@ -27,6 +29,63 @@ class IntervalTier(TierAbstract):
         super().__init__(name, xmin, xmax, is_interval, textgrid)
         self._items = [Interval(self._xmin, self._xmax, '', self)]
 
+    @classmethod
+    def from_boundaries(cls, times, texts, name = '', textgrid = None):
+        """
+        Create an :class:`~mytextgrid.core.interval_tier.IntervalTier` from
+        all its boundaries and texts at once.
+
+        The boundaries are checked in a single pass, so building a tier this way
+        takes linear time, while inserting the same boundaries one by one with
+        :meth:`insert_boundary` takes quadratic time.
+
+        Parameters
+        ----------
+        times : iterable of int, float, str or :class:`decimal.Decimal`
+            The boundaries (in seconds) in increasing order, including the
+            starting and ending times of the tier.
+        texts : iterable of str
+            The text of each interval. It must contain one item less than `times`.
+        name : str, default ''
+            The name of the tier.
+        textgrid : :class:`mytextgrid.core.textgrid.TextGrid` or None
+            The containing TextGrid object.
+
+        Returns
+        -------
+        :class:`~mytextgrid.core.interval_tier.IntervalTier`
+            A new tier.
+
+        Raises
+        ------
+        ValueError
+            If the boundaries are not in increasing order or if the number
+            of texts does not match the number of intervals.
+
+        Examples
+        --------
+        >>> tier = IntervalTier.from_boundaries([0, 0.23, 0.42, 1], ['', 'el', ''], 'word')
+        >>> len(tier)
+            3
+        """
+        times_ = [obj_to_decimal(time) for time in times]
+        texts_ = _share_texts(texts)
+
+        if len(times_) < 2:
+            raise ValueError('times MUST INCLUDE at least the starting and ending times.')
+        if len(times_) != len(texts_) + 1:
+            raise ValueError('times MUST HAVE one item more than texts.')
+        for left_time, right_time in zip(times_, times_[1:]):
+            if not left_time < right_time:
+                raise ValueError(f'Boundaries are not in increasing order at {right_time}.')
+
+        tier = cls(name, times_[0], times_[-1], textgrid)
+        tier._items = [
+            Interval(xmin, xmax, text, tier)
+            for xmin, xmax, text in zip(times_, times_[1:], texts_)
+        ]
+        return tier
+
     def insert_boundaries(self, *times):
         """
         Insert one or more time boundaries into a
@@ -263,6 +322,10 @@ class Interval:
     """
     A class representation for an interval.
     """
+    # A corpus holds millions of intervals: without an instance dict, each
+    # one takes 40 to 100 bytes less, depending on the Python version.
+    __slots__ = ('_tier', '_xmin', '_xmax', '_text')
+
     def __init__(self, xmin, xmax, text = '', tier = None):
         """
         Init an object representing a Praat interval.
@@ -0,0 +1,61 @@
+"""Placeholders for tiers that are read from a file on first access."""
+
+class LazyTier:
+    """
+    Stand in for a tier whose items have not been read yet.
+
+    A :class:`~mytextgrid.core.textgrid_abstract.TextGridAbstract` replaces a
+    :class:`LazyTier` with the real tier the first time the tier is reached
+    through indexing, iteration, :meth:`get_tier_by_name` or ``tiers``.
+    Until then, only the name, class and declared size of the tier are known.
+    """
+    def __init__(self, name, is_interval, size, loader):
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the tier.
+        is_interval : bool
+            True if it is an interval tier. False if it is a point tier.
+        size : int
+            The number of items of the tier.
+        loader : callable
+            A function that takes the containing TextGrid and returns the tier
+            with its items.
+        """
+        self._name = name
+        self._is_interval = is_interval
+        self._size = size
+        self._loader = loader
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def name(self):
+        """
+        Return the `self._name` attribute.
+        """
+        return self._name
+
+    def is_interval(self):
+        """
+        Return True if the tier contains intervals. Otherwise, return False.
+        """
+        return self._is_interval
+
+    def load(self, textgrid):
+        """
+        Read the tier.
+
+        Parameters
+        ----------
+        textgrid : :class:`mytextgrid.core.textgrid_abstract.TextGridAbstract`
+            The containing TextGrid.
+
+        Returns
+        -------
+        :class:`~mytextgrid.core.interval_tier.IntervalTier` or :class:`~mytextgrid.core.point_tier.PointTier`
+            The tier with all its items.
+        """
+        return self._loader(textgrid)
@@ -2,7 +2,7 @@
 import decimal
 
 from mytextgrid.core.tier_abstract import TierAbstract
-from mytextgrid.core.utils import obj_to_decimal
+from mytextgrid.core.utils import _share_texts, obj_to_decimal
 
 decimal.getcontext().prec = 16
 
@@ -10,10 +10,64 @@ class PointTier(TierAbstract):
     """
     Represent a tier that contains Point objects.
     """
+    __slots__ = ()
+
     def __init__(self, name = '', xmin = 0, xmax = 1, textgrid = None):
         is_interval = False
         super().__init__(name, xmin, xmax, is_interval, textgrid)
 
+    @classmethod
+    def from_points(cls, times, marks, name = '', xmin = 0, xmax = 1, textgrid = None):
+        """
+        Create a :class:`~mytextgrid.core.point_tier.PointTier` from all its
+        points at once.
+
+        The times are checked in a single pass, so building a tier this way
+        takes linear time, while :meth:`insert_point` sorts the tier after
+        each insertion.
+
+        Parameters
+        ----------
+        times : iterable of int, float, str or :class:`decimal.Decimal`
+            The times (in seconds) of the points in increasing order.
+        marks : iterable of str
+            The text of each point. It must contain as many items as `times`.
+        name : str, default ''
+            The name of the tier.
+        xmin : int, float str or :class:`decimal.Decimal`
+            The starting time (in seconds) of the tier.
+        xmax : int, float str or :class:`decimal.Decimal`
+            The ending time (in seconds) of the tier.
+        textgrid : :class:`mytextgrid.core.textgrid.TextGrid` or None
+            The containing TextGrid object.
+
+        Returns
+        -------
+        :class:`~mytextgrid.core.point_tier.PointTier`
+            A new tier.
+
+        Raises
+        ------
+        ValueError
+            If the times are not in increasing order, if they are out of the
+            tier range or if the number of marks does not match the number of times.
+        """
+        tier = cls(name, xmin, xmax, textgrid)
+
+        times_ = [obj_to_decimal(time) for time in times]
+        marks_ = _share_texts(marks)
+
+        if len(times_) != len(marks_):
+            raise ValueError('times and marks MUST HAVE the same number of items.')
+        if times_ and not tier.xmin <= times_[0] <= times_[-1] <= tier.xmax:
+            raise ValueError(f'Points are out of range of the tier {tier.name}.')
+        for left_time, right_time in zip(times_, times_[1:]):
+            if not left_time < right_time:
+                raise ValueError(f'Points are not in increasing order at {right_time}.')
+
+        tier._items = [Point(time, mark, tier) for time, mark in zip(times_, marks_)]
+        return tier
+
     def insert_point(self, time, text = ''):
         """
         Insert a Point into PointTier.
@@ -101,6 +155,7 @@ class PointTier(TierAbstract):
 
 class Point:
     """Represent a Point object which is the minimal unit of a PointTier object"""
+    __slots__ = ('_tier', '_time', '_text')
 
     def __init__(self, time, text = '', tier = None):
         """
@@ -4,6 +4,7 @@ Create and manipulate TextGrid objects.
 import decimal
 
 from mytextgrid.core.interval_tier import IntervalTier
+from mytextgrid.core.lazy_tier import LazyTier
 from mytextgrid.core.point_tier import PointTier
 from mytextgrid.core.utils import obj_to_decimal
 
@@ -47,16 +48,32 @@ class TextGridAbstract:
         """
         Return the `_tiers` attribute.
         """
+        for index in range(len(self._tiers)):
+            self._load_tier(index)
         return self._tiers
 
     def __len__(self):
         return len(self._tiers)
 
     def __iter__(self):
-        return iter(self._tiers)
+        for index in range(len(self._tiers)):
+            yield self._load_tier(index)
 
     def __getitem__(self, key):
-        return self._tiers[key]
+        if isinstance(key, slice):
+            return [self._load_tier(index) for index in range(*key.indices(len(self._tiers)))]
+        return self._load_tier(key)
+
+    def _load_tier(self, index):
+        """
+        Return the tier at `index`, reading it first if it is a
+        :class:`~mytextgrid.core.lazy_tier.LazyTier`.
+        """
+        tier = self._tiers[index]
+        if isinstance(tier, LazyTier):
+            tier = tier.load(self)
+            self._tiers[index] = tier
+        return tier
 
     def describe(self):
         """
@@ -174,7 +191,7 @@ class TextGridAbstract:
             tier = IntervalTier(name, self._xmin, self._xmax, self)
         else:
             tier = PointTier(name, self._xmin, self._xmax, self)
-        self.tiers.insert(index, tier)
+        self._tiers.insert(index, tier)
 
         return tier
 
@@ -192,6 +209,7 @@ class TextGridAbstract:
         :class:`IntervalTier` or :class:`PointTier`
             The removed tier.
         """
+        self._load_tier(index)
         return self._tiers.pop(index)
 
     def get_tier_by_name(self, tier_name):
@@ -211,7 +229,10 @@ class TextGridAbstract:
         if not isinstance(tier_name, str):
             raise TypeError('tier MUST BE a str')
 
-        list_ = [tier for tier in self._tiers if tier.name == tier_name]
+        list_ = [
+            self._load_tier(index)
+            for index, tier in enumerate(self._tiers) if tier.name == tier_name
+        ]
         return list_
 
     def to_dict(self):
@@ -219,7 +240,7 @@ class TextGridAbstract:
         Convert a TextGrid into a dict.
         """
         tiers_list = []
-        for tier in self._tiers:
+        for tier in self:
             # Collect Intervals or points into a list
             items_list = []
             for item in tier:
@@ -10,6 +10,8 @@ class TierAbstract:
     This is a base class for :class:`IntervalTier` and
     :class:`PointTier classes`. It represents an item's container.
     """
+    __slots__ = ('_name', '_xmin', '_xmax', '_is_interval', '_textgrid', '_items')
+
     def __init__(self, name = '', xmin = 0, xmax = 1, is_interval = True, textgrid = None):
         """
         A base class to build a Interval or Point tier.
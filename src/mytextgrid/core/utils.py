@@ -28,3 +28,12 @@ def obj_to_decimal(time, message=None):
         message = 'time parameter must be int, float, str or decimal.Decimal'
         raise TypeError(message)
 
+def _share_texts(texts):
+    """
+    Return the texts in a list where equal texts are the same object.
+
+    Labels repeat a lot in a tier (e.g., phones), so keeping one copy of
+    each saves memory in large corpora.
+    """
+    shared = {}
+    return [shared.setdefault(text, text) for text in texts]
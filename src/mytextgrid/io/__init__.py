@@ -1,3 +1,25 @@
+import importlib
+
 from mytextgrid.io.textgrid import create_textgrid
 from mytextgrid.io.reader import read_textgrid
 from mytextgrid.io.reader import read_textgrid_from_stream
+from mytextgrid.io.reader import iterparse
+from mytextgrid.io.reader import read_textgrid_info
+from mytextgrid.io.text_parser import TextGridParser
+
+# These functions are imported on first use: their modules load
+# multiprocessing, asyncio, zipfile and tarfile, which take longer to import
+# than the rest of the package.
+_DEFERRED = {
+    'read_textgrids': 'mytextgrid.io.batch',
+    'aread_textgrid': 'mytextgrid.io.aio',
+    'aread_textgrids': 'mytextgrid.io.aio',
+    'iter_textgrids_from_archive': 'mytextgrid.io.archive',
+    'ArchiveWriter': 'mytextgrid.io.archive',
+}
+
+def __getattr__(name):
+    if name in _DEFERRED:
+        module = importlib.import_module(_DEFERRED[name])
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
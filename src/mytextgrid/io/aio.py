@@ -0,0 +1,136 @@
+"""
+Read and write TextGrid files from asyncio code.
+
+The functions run :func:`~mytextgrid.io.reader.read_textgrid` and
+:func:`~mytextgrid.io.writer.write_textgrid` in an executor, so the event
+loop keeps running while a file is read, parsed or written. By default,
+the loop's thread pool is used: the file I/O of several calls overlaps, but
+parsing is bound by the GIL. Pass a :class:`concurrent.futures.ProcessPoolExecutor`
+to parse on several cores.
+"""
+import asyncio
+from collections import deque
+from functools import partial
+
+from mytextgrid.io.batch import _read
+from mytextgrid.io.reader import read_textgrid
+from mytextgrid.io.utils import _freeze_tiers
+from mytextgrid.io.writer import write_textgrid
+
+async def aread_textgrid(filepath, format_ = 'long', encoding = None, lazy = False, tiers = None,
+                         memory_map = False, executor = None):
+    """
+    Read a TextGrid file without blocking the event loop.
+
+    Parameters
+    ----------
+    filepath : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    format_, encoding, lazy, tiers, memory_map
+        See :func:`mytextgrid.read_textgrid`.
+    executor : :class:`concurrent.futures.Executor` or None, default None
+        The executor that reads the file. If None, the default executor of
+        the event loop.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+
+    Examples
+    --------
+    >>> textgrid = await mytextgrid.aread_textgrid('corpus.TextGrid', format_ = 'auto')
+    """
+    loop = asyncio.get_running_loop()
+    # A generator of tiers cannot be sent to a process pool.
+    tiers = _freeze_tiers(tiers)
+    read = partial(read_textgrid, filepath, format_, encoding, lazy, tiers, memory_map)
+    return await loop.run_in_executor(executor, read)
+
+def aread_textgrids(paths, format_ = 'long', encoding = None, tiers = None,
+                    concurrency = 4, ordered = True, executor = None):
+    """
+    Read many TextGrid files without blocking the event loop.
+
+    At most `concurrency` files are read at a time. An error while reading
+    a file does not stop the others: it is returned in the result of that
+    file.
+
+    Parameters
+    ----------
+    paths : iterable of str or :class:`pathlib.Path`
+        The paths of the TextGrid files. They are taken as reading goes, so
+        it may be a generator.
+    format_, encoding, tiers
+        See :func:`mytextgrid.read_textgrid`.
+    concurrency : int, default 4
+        The maximum number of files read at the same time.
+    ordered : bool, default True
+        If True, the results are yielded in the order of `paths`. If False,
+        they are yielded as soon as each file is read.
+    executor : :class:`concurrent.futures.Executor` or None, default None
+        The executor that reads the files. If None, the default executor of
+        the event loop.
+
+    Returns
+    -------
+    asynchronous iterator of :class:`~mytextgrid.io.batch.ReadResult`
+        The path, the TextGrid (or None) and the error (or None) of each file.
+
+    Examples
+    --------
+    >>> async for path, textgrid, error in mytextgrid.aread_textgrids(paths, concurrency = 8):
+    ...     if error is None:
+    ...         print(path, len(textgrid))
+    """
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be at least 1, not {concurrency}.')
+
+    # The tiers are used for every file.
+    options = {'format_': format_, 'encoding': encoding, 'tiers': _freeze_tiers(tiers)}
+    return _aiter_results(iter(paths), options, concurrency, ordered, executor)
+
+async def _aiter_results(paths, options, concurrency, ordered, executor):
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    try:
+        while True:
+            for path in paths:
+                pending.append(loop.run_in_executor(executor, _read, path, options))
+                if len(pending) == concurrency:
+                    break
+
+            if not pending:
+                break
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        # Do not read the remaining files if the caller stops early.
+        for future in pending:
+            future.cancel()
+
+async def awrite_textgrid(textgrid_obj, filepath, format_ = 'long', encoding = 'utf-8',
+                          executor = None):
+    """
+    Write a TextGrid object to a file without blocking the event loop.
+
+    Parameters
+    ----------
+    textgrid_obj : :class:`mytextgrid.TextGrid`
+        A TextGrid object. It must not be modified until the file is written.
+    filepath : str or :class:`pathlib.Path`
+        The path where the TextGrid file will be written.
+    format_, encoding
+        See :func:`mytextgrid.io.writer.write_textgrid`.
+    executor : :class:`concurrent.futures.Executor` or None, default None
+        The executor that writes the file. If None, the default executor of
+        the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    write = partial(write_textgrid, textgrid_obj, filepath, format_, encoding)
+    await loop.run_in_executor(executor, write)
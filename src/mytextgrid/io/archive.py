@@ -0,0 +1,201 @@
+"""
+Read and write TextGrids inside zip and tar archives.
+
+The members are read from the archive into memory and parsed, and the
+TextGrids are written to the archive from memory, so no file is extracted
+or written to disk. Tar archives may be compressed with gzip, bzip2 or xz.
+"""
+import tarfile
+import time
+import zipfile
+from fnmatch import fnmatchcase
+from functools import partial
+from io import BytesIO
+
+from mytextgrid.io.batch import ReadResult
+from mytextgrid.io.reader import _read_source
+from mytextgrid.io.source import decode_source
+from mytextgrid.io.utils import _freeze_tiers
+from mytextgrid.io.writer import _to_bytes
+
+# The tarfile modes of the archive writer, by extension.
+_TAR_MODES = {
+    '.tar': 'w',
+    '.tar.gz': 'w:gz',
+    '.tgz': 'w:gz',
+    '.tar.bz2': 'w:bz2',
+    '.tbz2': 'w:bz2',
+    '.tar.xz': 'w:xz',
+    '.txz': 'w:xz',
+}
+
+def iter_textgrids_from_archive(path, pattern = '*.TextGrid', format_ = 'auto', encoding = None,
+                                tiers = None):
+    """
+    Read the TextGrids of a zip or tar archive without extracting it.
+
+    The members are read in the order of the archive. Tar archives are read
+    as a stream, so compressed tar archives are decompressed only once. An
+    error while reading a member does not stop the others: it is returned
+    in the result of that member.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of a zip or tar archive. Tar archives may be compressed.
+    pattern : str or None, default '*.TextGrid'
+        A shell-style pattern (see :mod:`fnmatch`) that the names of the
+        members to read must match, including their directories. Matching is
+        case-sensitive. If None, all the files of the archive are read.
+    format_ : {'auto', 'long', 'short', 'binary'}, default 'auto'
+        The TextGrid format. If 'auto', it is detected from the header of
+        each member.
+    encoding : str, default None, detect automatically the encoding.
+        The name of the encoding used to decode the members. See
+        :func:`~mytextgrid.io.utils.detect_textgrid_encoding`.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+
+    Yields
+    ------
+    :class:`~mytextgrid.io.batch.ReadResult`
+        The name of the member, the TextGrid (or None) and the error (or None).
+
+    Raises
+    ------
+    ValueError
+        If the file is neither a zip nor a tar archive.
+
+    Examples
+    --------
+    >>> for name, textgrid, error in mytextgrid.iter_textgrids_from_archive('corpus.zip'):
+    ...     if error is None:
+    ...         print(name, len(textgrid))
+    """
+    if format_ not in ('auto', 'long', 'short', 'binary'):
+        raise ValueError(f'Cannot read {path}: unsupported format {format_!r}.')
+
+    if zipfile.is_zipfile(path):
+        members = _iter_zip_members(path, pattern)
+    elif tarfile.is_tarfile(path):
+        members = _iter_tar_members(path, pattern)
+    else:
+        raise ValueError(f'{path} is neither a zip nor a tar archive.')
+
+    # The tiers are used for every member.
+    tiers = _freeze_tiers(tiers)
+    for name, read in members:
+        try:
+            source = decode_source(read(), encoding, name)
+            if format_ != 'auto' and source.format != format_:
+                raise OSError(f'{name} is not a TextGrid file in {format_} format.')
+            yield ReadResult(name, _read_source(source, tiers), None)
+        except Exception as error:
+            yield ReadResult(name, None, error)
+
+# The member generators yield the name of each member and a function that
+# reads it, so that an error while reading a member (a bad CRC, an
+# unsupported compression method or an encrypted member) is the error of
+# that member and does not stop the iteration.
+
+def _iter_zip_members(path, pattern):
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not (pattern is None or fnmatchcase(info.filename, pattern)):
+                continue
+            yield info.filename, partial(archive.read, info)
+
+def _iter_tar_members(path, pattern):
+    with tarfile.open(path, 'r|*') as archive:
+        for info in archive:
+            if not info.isfile() or not (pattern is None or fnmatchcase(info.name, pattern)):
+                continue
+            # A member of a stream must be read before the next one.
+            yield info.name, partial(_read_tar_member, archive, info)
+
+def _read_tar_member(archive, info):
+    with archive.extractfile(info) as member:
+        return member.read()
+
+class ArchiveWriter:
+    """
+    Write TextGrids as members of a zip or tar archive.
+
+    Each TextGrid is written to memory and added to the archive, so no
+    temporary file is used. Use it as a context manager, or call
+    :meth:`close` when done.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the archive. Its extension gives the archive type:
+        ``.zip``, ``.tar``, ``.tar.gz`` (or ``.tgz``), ``.tar.bz2`` (or
+        ``.tbz2``) or ``.tar.xz`` (or ``.txz``).
+    mode : {'w', 'a'}, default 'w'
+        Create the archive (replacing an existing file) or append members to
+        an existing one. Compressed tar archives cannot be appended to.
+    format_ : {'long', 'short', 'binary'}, default 'long'
+        The format of the TextGrid files.
+    encoding : str, default 'utf-8'
+        The encoding of the TextGrid files. Ignored for binary files.
+
+    Examples
+    --------
+    >>> with mytextgrid.ArchiveWriter('corpus.zip') as archive:
+    ...     for name, textgrid in textgrids.items():
+    ...         archive.add(textgrid, f'{name}.TextGrid')
+    """
+    def __init__(self, path, mode = 'w', format_ = 'long', encoding = 'utf-8'):
+        if mode not in ('w', 'a'):
+            raise ValueError(f'Unsupported mode: {mode!r}.')
+        if format_ not in ('long', 'short', 'binary'):
+            raise ValueError(f'Unsupported TextGrid format: {format_!r}.')
+        self.format_ = format_
+        self.encoding = encoding
+
+        name = str(path).lower()
+        if name.endswith('.zip'):
+            self._archive = zipfile.ZipFile(path, mode, zipfile.ZIP_DEFLATED)
+            return
+        for extension, tar_mode in _TAR_MODES.items():
+            if name.endswith(extension):
+                break
+        else:
+            raise ValueError(f'Unknown archive extension: {path}')
+        if mode == 'a':
+            if tar_mode != 'w':
+                raise ValueError(f'Cannot append to a compressed tar archive: {path}')
+            tar_mode = 'a'
+        self._archive = tarfile.open(path, tar_mode)
+
+    def add(self, textgrid, name):
+        """
+        Write a TextGrid as a member of the archive.
+
+        Parameters
+        ----------
+        textgrid : :class:`mytextgrid.TextGrid`
+            A TextGrid object.
+        name : str
+            The name of the member, e.g. ``'speaker1/session1.TextGrid'``.
+        """
+        data = _to_bytes(textgrid, self.format_, self.encoding)
+        if isinstance(self._archive, zipfile.ZipFile):
+            self._archive.writestr(name, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = time.time()
+            self._archive.addfile(info, BytesIO(data))
+
+    def close(self):
+        """
+        Finish writing the archive.
+        """
+        self._archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
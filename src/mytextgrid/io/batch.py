@@ -0,0 +1,129 @@
+"""Read many TextGrid files in parallel."""
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from mytextgrid.io.reader import read_textgrid
+from mytextgrid.io.utils import _freeze_tiers
+
+ReadResult = namedtuple('ReadResult', ['path', 'textgrid', 'error'])
+ReadResult.__doc__ = (
+    'The path of a TextGrid file and either the TextGrid read from it (and '
+    'None as error) or None and the exception raised while reading it.'
+)
+
+# The number of chunks given to each worker when chunksize is not set.
+_CHUNKS_PER_WORKER = 4
+_MAX_CHUNK_SIZE = 64
+
+# The number of chunks per worker sent ahead of the results that are read,
+# so that workers do not wait for the caller and unread TextGrids do not
+# pile up.
+_CHUNKS_IN_FLIGHT = 2
+
+def read_textgrids(paths, format_ = 'long', encoding = None, tiers = None, workers = None,
+                   ordered = True, chunksize = None):
+    """
+    Read many TextGrid files in a pool of processes.
+
+    The paths are sent to the workers in chunks, so that the cost of
+    sending the files and the TextGrids between processes is shared by
+    several files. Only two chunks per worker are read ahead of the results
+    taken by the caller. An error while reading a file does not stop the others:
+    it is returned in the result of that file.
+
+    Parameters
+    ----------
+    paths : iterable of str or :class:`pathlib.Path`
+        The paths of the TextGrid files.
+    format_ : {'long', 'short', 'binary', 'auto'}, default 'long'
+        The TextGrid format. See :func:`mytextgrid.read_textgrid`.
+    encoding : str, default None, detect automatically the encoding.
+        The name of the encoding used to decode the files.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`. A function
+        must be defined at the top level of a module to be sent to the workers.
+    workers : int or None, default None
+        The number of processes. If None, the number of CPUs. If 1, the files
+        are read in the current process.
+    ordered : bool, default True
+        If True, the results are yielded in the order of `paths`. If False,
+        they are yielded as soon as each chunk is read.
+    chunksize : int or None, default None
+        The number of files sent to a worker at a time. If None, it is chosen
+        from the number of files and workers.
+
+    Returns
+    -------
+    iterator of :class:`ReadResult`
+        The path, the TextGrid (or None) and the error (or None) of each file.
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> paths = sorted(Path('corpus').glob('*.TextGrid'))
+    >>> for path, textgrid, error in mytextgrid.read_textgrids(paths, workers = 4):
+    ...     if error is not None:
+    ...         print(f'{path}: {error}')
+    """
+    paths = list(paths)
+    # The tiers are used for every file and sent to the workers.
+    options = {'format_': format_, 'encoding': encoding, 'tiers': _freeze_tiers(tiers)}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f'workers must be at least 1, not {workers}.')
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f'chunksize must be at least 1, not {chunksize}.')
+
+    if workers == 1 or len(paths) <= 1:
+        return (_read(path, options) for path in paths)
+
+    if chunksize is None:
+        chunksize = len(paths) // (workers * _CHUNKS_PER_WORKER)
+        chunksize = max(1, min(chunksize, _MAX_CHUNK_SIZE))
+    chunks = [paths[i:i + chunksize] for i in range(0, len(paths), chunksize)]
+    return _iter_pool_results(chunks, options, workers, ordered)
+
+def _iter_pool_results(chunks, options, workers, ordered):
+    workers = min(workers, len(chunks))
+    chunks = iter(chunks)
+    # Map the submitted futures to their chunks, in the order of the chunks.
+    futures = {}
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        def submit(count):
+            for chunk in islice(chunks, count):
+                futures[executor.submit(_read_chunk, chunk, options)] = chunk
+
+        try:
+            submit(workers * _CHUNKS_IN_FLIGHT)
+            while futures:
+                if ordered:
+                    done = [next(iter(futures))]
+                else:
+                    done, _ = wait(futures, return_when = FIRST_COMPLETED)
+                for future in done:
+                    chunk = futures.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as error:
+                        # A worker died (e.g., out of memory) or a result could not be
+                        # sent back: report the error for each file of the chunk.
+                        results = [ReadResult(path, None, error) for path in chunk]
+                    # Keep the workers busy while the caller takes the results.
+                    submit(1)
+                    yield from results
+        finally:
+            # Do not read the remaining chunks if the caller stops early.
+            for future in futures:
+                future.cancel()
+
+def _read_chunk(paths, options):
+    return [_read(path, options) for path in paths]
+
+def _read(path, options):
+    try:
+        return ReadResult(path, read_textgrid(path, **options), None)
+    except Exception as error:
+        return ReadResult(path, None, error)
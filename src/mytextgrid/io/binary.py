@@ -0,0 +1,292 @@
+"""Read and write TextGrid files in Praat binary format."""
+import struct
+from io import BytesIO
+
+from mytextgrid.io.builder import TextGridBuilder
+from mytextgrid.io.compression import open_file
+from mytextgrid.io.events import TextGridHeader, TierHeader
+from mytextgrid.io.utils import _BINARY_MARK, _tier_filter
+
+_DOUBLE = struct.Struct('>d')
+_TWO_DOUBLES = struct.Struct('>2d')
+_INT32 = struct.Struct('>i')
+_UINT16 = struct.Struct('>H')
+_TWO_UINT16 = struct.Struct('>2H')
+
+# A string length of 0xFFFF means that the string is stored in UTF-16.
+_UTF16_FLAG = 0xFFFF
+
+# The number of times stored in each item.
+_ITEM_DOUBLES = {'IntervalTier': 2, 'TextTier': 1}
+
+def read_textgrid_file(path, tiers = None, tier_factory = None):
+    """
+    Read a TextGrid file in binary format into a :class:`mytextgrid.TextGrid`.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+    """
+    with open_file(path) as file_object:
+        data = file_object.read()
+    return read(data, tiers, tier_factory)
+
+def read(data, tiers = None, tier_factory = None):
+    """
+    Read a TextGrid in binary format into a :class:`mytextgrid.TextGrid`.
+
+    The items are unpacked in place from a :class:`memoryview` of `data`
+    and passed to a :class:`~mytextgrid.io.builder.TextGridBuilder`. The
+    items of the tiers that are not selected are skipped by reading only
+    the length of their texts.
+
+    Parameters
+    ----------
+    data : bytes
+        The content of a binary TextGrid.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+    """
+    selected = _tier_filter(tiers)
+    stream = BytesIO(data)
+    view = memoryview(data)
+    try:
+        textgrid_header = _read_textgrid_header(stream)
+        builder = TextGridBuilder(tier_factory = tier_factory)
+        builder.start_textgrid(_to_time(textgrid_header.xmin), _to_time(textgrid_header.xmax))
+
+        for index in range(textgrid_header.size):
+            tier_header = _read_tier_header(stream, index)
+            if tier_header.tier_class not in _ITEM_DOUBLES:
+                raise ValueError(f'Unknown tier class: {tier_header.tier_class}')
+
+            if selected is not None and not selected(tier_header):
+                position = _skip_items(view, stream.tell(), tier_header)
+            else:
+                builder.start_tier(
+                    tier_header.tier_class, tier_header.name,
+                    _to_time(tier_header.xmin), _to_time(tier_header.xmax)
+                )
+                if tier_header.tier_class == 'IntervalTier':
+                    position = _read_intervals(view, stream.tell(), tier_header.size, builder)
+                else:
+                    position = _read_points(view, stream.tell(), tier_header.size, builder)
+
+            if position > len(view):
+                raise struct.error('Truncated text.')
+            stream.seek(position)
+    except (struct.error, IndexError) as error:
+        raise ValueError('Unexpected end of the binary TextGrid.') from error
+    finally:
+        view.release()
+    return builder.close()
+
+def write(textgrid, file_object):
+    """
+    Write a TextGrid in binary format to a file opened in binary mode.
+
+    The TextGrid is written tier by tier: the items of one tier are packed
+    and written at once, so only one tier is held in memory as bytes.
+
+    Parameters
+    ----------
+    textgrid : :class:`mytextgrid.TextGrid`
+        The TextGrid to write.
+    file_object : file object
+        A file opened for writing in binary mode.
+    """
+    file_object.write(_BINARY_MARK)
+    file_object.write(_TWO_DOUBLES.pack(float(textgrid.xmin), float(textgrid.xmax)))
+    file_object.write(b'\x01')
+    file_object.write(_INT32.pack(len(textgrid)))
+
+    for tier in textgrid:
+        tier_class = b'IntervalTier' if tier.is_interval() else b'TextTier'
+        chunks = [
+            bytes([len(tier_class)]), tier_class,
+            _pack_string(tier.name),
+            _TWO_DOUBLES.pack(float(tier.xmin), float(tier.xmax)),
+            _INT32.pack(len(tier)),
+        ]
+        if tier.is_interval():
+            pack_times = _TWO_DOUBLES.pack
+            for interval in tier:
+                chunks.append(pack_times(float(interval.xmin), float(interval.xmax)))
+                chunks.append(_pack_string(interval.text))
+        else:
+            pack_time = _DOUBLE.pack
+            for point in tier:
+                chunks.append(pack_time(float(point.time)))
+                chunks.append(_pack_string(point.text))
+        file_object.write(b''.join(chunks))
+
+def read_info(path):
+    """
+    Read the header of a binary TextGrid file and the header of each tier.
+
+    The items are skipped by seeking over them: only the length of each
+    text is read, not the text itself.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+
+    Returns
+    -------
+    tuple of (:class:`~mytextgrid.io.events.TextGridHeader`, list of :class:`~mytextgrid.io.events.TierHeader`)
+        The header of the TextGrid and of each tier. Times are floats and
+        sizes are ints.
+    """
+    with open_file(path) as file_object:
+        textgrid_header = _read_textgrid_header(file_object)
+
+        tier_headers = []
+        for index in range(textgrid_header.size):
+            tier_header = _read_tier_header(file_object, index)
+            if tier_header.tier_class not in _ITEM_DOUBLES:
+                raise ValueError(f'Unknown tier class: {tier_header.tier_class}')
+
+            item_doubles = _ITEM_DOUBLES[tier_header.tier_class]
+            for _ in range(tier_header.size):
+                file_object.seek(8 * item_doubles, 1)
+                _skip_string(file_object)
+            tier_headers.append(tier_header)
+    return textgrid_header, tier_headers
+
+def _read_textgrid_header(file_object):
+    if not file_object.read(len(_BINARY_MARK)) == _BINARY_MARK:
+        raise OSError('The stream is not a binary TextGrid.')
+
+    xmin, xmax = _TWO_DOUBLES.unpack(file_object.read(16))
+    if file_object.read(1) == b'\x01':
+        size = _INT32.unpack(file_object.read(4))[0]
+    else:
+        size = 0
+    return TextGridHeader(xmin, xmax, size)
+
+def _read_tier_header(file_object, index):
+    tier_class = file_object.read(file_object.read(1)[0]).decode('ascii')
+    name = _read_string(file_object)
+    xmin, xmax = _TWO_DOUBLES.unpack(file_object.read(16))
+    size = _INT32.unpack(file_object.read(4))[0]
+    return TierHeader(index, tier_class, name, xmin, xmax, size)
+
+def _read_string(file_object):
+    length = _UINT16.unpack(file_object.read(2))[0]
+    if length == _UTF16_FLAG:
+        length = _UINT16.unpack(file_object.read(2))[0]
+        return file_object.read(2 * length).decode('utf-16-be')
+    return file_object.read(length).decode('iso-8859-1')
+
+def _pack_string(text):
+    """
+    Pack a text as Praat does: ASCII texts in 8 bits, others in UTF-16.
+    """
+    if text.isascii():
+        data = text.encode('ascii')
+        if len(data) >= _UTF16_FLAG:
+            raise ValueError(f'The text is too long for a binary TextGrid: {text[:20]!r}...')
+        return _UINT16.pack(len(data)) + data
+
+    data = text.encode('utf-16-be')
+    if len(data) // 2 > _UTF16_FLAG:
+        raise ValueError(f'The text is too long for a binary TextGrid: {text[:20]!r}...')
+    return _TWO_UINT16.pack(_UTF16_FLAG, len(data) // 2) + data
+
+def _skip_string(file_object):
+    length = _UINT16.unpack(file_object.read(2))[0]
+    if length == _UTF16_FLAG:
+        length = 2 * _UINT16.unpack(file_object.read(2))[0]
+    file_object.seek(length, 1)
+
+def _read_intervals(view, position, size, builder):
+    """
+    Unpack `size` intervals starting at `position` and return the position
+    after the last one.
+    """
+    unpack_times = _TWO_DOUBLES.unpack_from
+    unpack_length = _UINT16.unpack_from
+    add_interval = builder.add_interval
+    # Adjacent intervals share a boundary: convert it once.
+    last_xmax = last_time = None
+    for _ in range(size):
+        xmin, xmax = unpack_times(view, position)
+        length, = unpack_length(view, position + 16)
+        position += 18
+        if length == _UTF16_FLAG:
+            length = 2 * unpack_length(view, position)[0]
+            position += 2
+            text = str(view[position:position + length], 'utf-16-be')
+        else:
+            text = str(view[position:position + length], 'iso-8859-1')
+        position += length
+        start = last_time if xmin == last_xmax else _to_time(xmin)
+        last_xmax, last_time = xmax, _to_time(xmax)
+        add_interval(start, last_time, text)
+    return position
+
+def _read_points(view, position, size, builder):
+    """
+    Unpack `size` points starting at `position` and return the position
+    after the last one.
+    """
+    unpack_time = _DOUBLE.unpack_from
+    unpack_length = _UINT16.unpack_from
+    add_point = builder.add_point
+    for _ in range(size):
+        number, = unpack_time(view, position)
+        length, = unpack_length(view, position + 8)
+        position += 10
+        if length == _UTF16_FLAG:
+            length = 2 * unpack_length(view, position)[0]
+            position += 2
+            mark = str(view[position:position + length], 'utf-16-be')
+        else:
+            mark = str(view[position:position + length], 'iso-8859-1')
+        position += length
+        add_point(_to_time(number), mark)
+    return position
+
+def _skip_items(view, position, tier_header):
+    """
+    Return the position after the items of a tier without decoding them.
+    """
+    unpack_length = _UINT16.unpack_from
+    item_doubles = 8 * _ITEM_DOUBLES[tier_header.tier_class]
+    for _ in range(tier_header.size):
+        position += item_doubles
+        length, = unpack_length(view, position)
+        position += 2
+        if length == _UTF16_FLAG:
+            length = 2 * unpack_length(view, position)[0]
+            position += 2
+        position += length
+    return position
+
+def _to_time(value):
+    """
+    Write a time the way Praat does in text files (e.g., ``1`` instead of
+    ``1.0``), so that it converts to the same :class:`decimal.Decimal`.
+    """
+    text = repr(value)
+    return text[:-2] if text.endswith('.0') else text
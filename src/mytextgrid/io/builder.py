@@ -0,0 +1,246 @@
+"""Build TextGrid objects from the values emitted by a parser."""
+import decimal
+
+from mytextgrid.core.interval_tier import IntervalTier
+from mytextgrid.core.point_tier import PointTier
+from mytextgrid.core.utils import obj_to_decimal
+from mytextgrid.io.textgrid import TextGrid
+from mytextgrid.io.utils import _tier_filter
+
+decimal.getcontext().prec = 16
+
+def build_tier(tier_class, times, texts, name, xmin, xmax, textgrid = None):
+    """
+    Build a tier from its times and texts.
+
+    This is the default tier factory of :class:`TextGridBuilder`.
+
+    Parameters
+    ----------
+    tier_class : {'IntervalTier', 'TextTier'}
+        The Praat class of the tier.
+    times : list
+        The boundaries of the intervals, or the times of the points.
+    texts : list of str
+        The texts of the items.
+    name : str
+        The name of the tier.
+    xmin : int, float, str or :class:`decimal.Decimal`
+        The starting time of the tier.
+    xmax : int, float, str or :class:`decimal.Decimal`
+        The ending time of the tier.
+    textgrid : :class:`mytextgrid.io.textgrid.TextGrid` or None, default None
+        The TextGrid that owns the tier.
+
+    Returns
+    -------
+    :class:`~mytextgrid.core.interval_tier.IntervalTier` or :class:`~mytextgrid.core.point_tier.PointTier`
+        The tier, built with :meth:`IntervalTier.from_boundaries` or
+        :meth:`PointTier.from_points`.
+    """
+    if tier_class == 'IntervalTier':
+        return IntervalTier.from_boundaries(times, texts, name, textgrid)
+    return PointTier.from_points(times, texts, name, xmin, xmax, textgrid)
+
+def build_textgrid(events, tiers = None, tier_factory = None):
+    """
+    Build a TextGrid from the events of a parser.
+
+    Parameters
+    ----------
+    events : iterable of (str, tuple)
+        The events of a TextGrid (see :mod:`mytextgrid.io.events`). If they
+        contain several TextGrids, only the first one is built.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to build. See :func:`mytextgrid.read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See :class:`TextGridBuilder`.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+    """
+    selected = _tier_filter(tiers)
+    builder = TextGridBuilder(tier_factory = tier_factory)
+    add_interval = builder.add_interval
+    add_point = builder.add_point
+    started = False
+    skip = False
+    for event, payload in events:
+        if event == 'interval':
+            if not skip:
+                add_interval(payload.xmin, payload.xmax, payload.text)
+        elif event == 'point':
+            if not skip:
+                add_point(payload.number, payload.mark)
+        elif event == 'tier_start':
+            skip = selected is not None and not selected(payload)
+            if not skip:
+                builder.start_tier(payload.tier_class, payload.name, payload.xmin, payload.xmax)
+        elif event == 'textgrid':
+            if started:
+                break
+            started = True
+            builder.start_textgrid(payload.xmin, payload.xmax)
+    return builder.close()
+
+class TextGridBuilder:
+    """
+    Assemble a :class:`~mytextgrid.io.textgrid.TextGrid` while a file is
+    being parsed.
+
+    Parsers call :meth:`start_textgrid`, :meth:`start_tier`,
+    :meth:`add_interval` and :meth:`add_point` in file order. The times and
+    texts of the current tier are collected in plain lists and the tier is
+    built in one go by `tier_factory` when it is finished. Call
+    :meth:`close` to get the resulting TextGrid.
+
+    Parameters
+    ----------
+    textgrid : :class:`mytextgrid.io.textgrid.TextGrid` or None, default None
+        The TextGrid that owns the built tiers. If given,
+        :meth:`start_textgrid` does not need to be called.
+    tier_factory : callable or None, default None
+        A function with the parameters of :func:`build_tier` that returns a
+        finished tier, e.g. the one returned by
+        :func:`~mytextgrid.core.columnar_tier.columnar_tier_factory`. If
+        None, :func:`build_tier` is used.
+    """
+    def __init__(self, textgrid = None, tier_factory = None):
+        self._textgrid = textgrid
+        self._tier_factory = build_tier if tier_factory is None else tier_factory
+
+        # The current tier
+        self._tier_class = None
+        self._tier_name = None
+        self._tier_xmin = None
+        self._tier_xmax = None
+        self._times = None
+        self._texts = None
+
+    def start_textgrid(self, xmin, xmax):
+        """
+        Create the TextGrid.
+
+        Parameters
+        ----------
+        xmin : int, float, str or :class:`decimal.Decimal`
+            The starting time of the TextGrid.
+        xmax : int, float, str or :class:`decimal.Decimal`
+            The ending time of the TextGrid.
+        """
+        self._textgrid = TextGrid(xmin, xmax)
+
+    def start_tier(self, tier_class, name, xmin = None, xmax = None):
+        """
+        Finish the current tier, if any, and start a new one.
+
+        Parameters
+        ----------
+        tier_class : {'IntervalTier', 'TextTier'}
+            The Praat class of the tier.
+        name : str
+            The name of the tier.
+        xmin : int, float, str, :class:`decimal.Decimal` or None
+            The starting time of the tier. If None, use the one of the TextGrid.
+        xmax : int, float, str, :class:`decimal.Decimal` or None
+            The ending time of the tier. If None, use the one of the TextGrid.
+        """
+        if self._textgrid is None:
+            raise ValueError('A tier was found before the TextGrid header.')
+        if tier_class not in ('IntervalTier', 'TextTier'):
+            raise ValueError(f'Unknown tier class: {tier_class}')
+
+        self._add_tier(self.end_tier())
+        self._tier_class = tier_class
+        self._tier_name = name
+        self._tier_xmin = self._textgrid.xmin if xmin is None else xmin
+        self._tier_xmax = self._textgrid.xmax if xmax is None else xmax
+        self._times = []
+        self._texts = []
+
+    def add_interval(self, xmin, xmax, text):
+        """
+        Append an interval to the current tier.
+
+        Parameters
+        ----------
+        xmin : int, float, str or :class:`decimal.Decimal`
+            The starting time of the interval.
+        xmax : int, float, str or :class:`decimal.Decimal`
+            The ending time of the interval.
+        text : str
+            The text of the interval.
+        """
+        # Times are kept as given and converted when the tier is built.
+        # Adjacent intervals share a boundary, usually written the same way.
+        times = self._times
+        if not times:
+            times.append(xmin)
+        elif times[-1] != xmin and obj_to_decimal(times[-1]) != obj_to_decimal(xmin):
+            raise ValueError(
+                f'Interval at {xmin} does not start where the previous one ends '
+                f'in tier {self._tier_name}.'
+            )
+        times.append(xmax)
+        self._texts.append(text)
+
+    def add_point(self, number, mark):
+        """
+        Append a point to the current tier.
+
+        Parameters
+        ----------
+        number : int, float, str or :class:`decimal.Decimal`
+            The time of the point.
+        mark : str
+            The text of the point.
+        """
+        self._times.append(number)
+        self._texts.append(mark)
+
+    def close(self):
+        """
+        Finish the last tier and return the TextGrid.
+
+        Returns
+        -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance.
+        """
+        if self._textgrid is None:
+            raise ValueError('The TextGrid header is missing.')
+        self._add_tier(self.end_tier())
+        return self._textgrid
+
+    def end_tier(self):
+        """
+        Finish the current tier and return it.
+
+        Unlike :meth:`start_tier` and :meth:`close`, the tier is not added to
+        the TextGrid. Use it to build a single tier on demand.
+
+        Returns
+        -------
+        :class:`~mytextgrid.core.interval_tier.IntervalTier`, :class:`~mytextgrid.core.point_tier.PointTier` or None
+            The finished tier, or None if there is no current tier.
+        """
+        if self._tier_class is None:
+            return None
+
+        if self._tier_class == 'IntervalTier' and not self._texts:
+            raise ValueError(f'The interval tier {self._tier_name} has no intervals.')
+        tier = self._tier_factory(
+            self._tier_class, self._times, self._texts, self._tier_name,
+            self._tier_xmin, self._tier_xmax, self._textgrid
+        )
+
+        self._tier_class = None
+        self._times = None
+        self._texts = None
+        return tier
+
+    def _add_tier(self, tier):
+        if tier is not None:
+            self._textgrid.tiers.append(tier)
@@ -0,0 +1,507 @@
+"""
+Cache the TextGrids read from files, so that unchanged files are not parsed again.
+
+A cache is passed to :func:`mytextgrid.read_textgrid` with the `cache`
+parameter. It has a ``get(path, options)`` method that returns the cached
+TextGrid of a file (or None) and a ``put(path, options, textgrid)`` method
+that stores it, where `options` are the reading options (`format_`,
+`encoding` and `tiers`) that change the result. If it also has a
+``get_or_read(path, options, read)`` method, it is used instead: the file is
+identified before `read` parses it, so that a file changed while it is read
+is not stored under its new identity.
+
+:class:`MemoryCache` keeps TextGrids in the current process and
+:class:`DiskCache` keeps them in a directory, across processes and runs.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+from mytextgrid.core.interval_tier import IntervalTier
+from mytextgrid.core.point_tier import PointTier
+from mytextgrid.io.textgrid import TextGrid
+
+# Change it when the serialized form changes, so that old entries are ignored.
+_CACHE_VERSION = 1
+_PICKLE_PROTOCOL = 4
+_SUFFIX = '.tgcache'
+
+# The approximate memory taken by an item and its times, without its text.
+_ITEM_SIZE = 256
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'entries', 'size'])
+CacheInfo.__doc__ = (
+    'The number of hits and misses of a :class:`MemoryCache`, and its number '
+    'of entries and approximate size in bytes.'
+)
+
+class MemoryCache:
+    """
+    Keep the most recently read TextGrids in memory.
+
+    The entries are looked up by the absolute path of the file and the
+    reading options, and are valid while the size and modification time of
+    the file do not change. When there are more than `max_entries` entries
+    or they take more than `max_bytes`, the least recently used entries are
+    removed. The cache can be shared by several threads.
+
+    Parameters
+    ----------
+    max_entries : int, default 128
+        The maximum number of TextGrids.
+    max_bytes : int or None, default 256 MiB
+        The maximum approximate memory taken by the TextGrids, estimated from
+        their number of items and the length of their texts. If None, there
+        is no limit.
+    shared : bool, default True
+        If True, every read of a file returns the same TextGrid object, which
+        must not be modified. If False, only the times and texts are kept and
+        each read returns a new TextGrid built from them, which is several
+        times faster than parsing the file.
+
+    Attributes
+    ----------
+    hits : int
+        The number of reads served from the cache.
+    misses : int
+        The number of reads that parsed the file.
+
+    Examples
+    --------
+    >>> cache = MemoryCache(max_entries = 32)
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', cache = cache)
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', cache = cache)
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, entries=1, size=5288)
+    """
+    def __init__(self, max_entries = 128, max_bytes = 256 * 1024 * 1024, shared = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.hits = 0
+        self.misses = 0
+
+        # Map a key to (file identity, TextGrid or columns, size)
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path, options):
+        """
+        Return the cached TextGrid of a file, or None.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path of the TextGrid file.
+        options : dict
+            The reading options.
+
+        Returns
+        -------
+        :class:`mytextgrid.TextGrid` or None
+            The TextGrid (or a copy of it, if `shared` is False), or None if
+            the file is not cached or has changed.
+        """
+        key = _entry_key(path, options)
+        if key is None:
+            return None
+        return self._lookup(key, _stat_id(key[0]))
+
+    def put(self, path, options, textgrid):
+        """
+        Store the TextGrid of a file.
+
+        The file is identified when the method is called: use
+        :meth:`get_or_read` if the file can change while it is read.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path of the TextGrid file.
+        options : dict
+            The reading options.
+        textgrid : :class:`mytextgrid.TextGrid`
+            The TextGrid read from the file with `options`.
+        """
+        key = _entry_key(path, options)
+        if key is not None:
+            self._store(key, _stat_id(key[0]), textgrid)
+
+    def get_or_read(self, path, options, read):
+        """
+        Return the cached TextGrid of a file, or read it and store it.
+
+        The size and modification time of the file are taken before it is
+        read, so if the file changes while it is read, the entry is not valid
+        for the new content.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path of the TextGrid file.
+        options : dict
+            The reading options.
+        read : callable
+            A function without arguments that reads the file with `options`.
+
+        Returns
+        -------
+        :class:`mytextgrid.TextGrid`
+            The cached TextGrid or the one returned by `read`.
+        """
+        key = _entry_key(path, options)
+        if key is None:
+            return read()
+        file_id = _stat_id(key[0])
+
+        textgrid = self._lookup(key, file_id)
+        if textgrid is None:
+            textgrid = read()
+            self._store(key, file_id, textgrid)
+        return textgrid
+
+    def _lookup(self, key, file_id):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != file_id:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return value if self.shared else _from_columns(value)
+
+    def _store(self, key, file_id, textgrid):
+        size = _estimate_size(textgrid)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        value = textgrid if self.shared else _to_columns(textgrid)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (file_id, value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def info(self):
+        """
+        Return the counters and the size of the cache.
+
+        Returns
+        -------
+        :class:`CacheInfo`
+            The number of hits, misses and entries, and the approximate size.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries), self._size)
+
+    def clear(self):
+        """
+        Remove all the entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key)[2]
+
+# The cache used by ``read_textgrid(..., cache = True)``.
+memory_cache = MemoryCache()
+
+class DiskCache:
+    """
+    Store parsed TextGrids in a directory.
+
+    Each TextGrid is stored in its own file as plain lists of times (as
+    strings) and texts, which load several times faster than a TextGrid
+    file is parsed. The entries are looked up by the path, size and
+    modification time of the file (or by a hash of its content) and by the
+    reading options. When the directory grows over `max_size`, the least
+    recently used entries are removed.
+
+    Entries are read with :mod:`pickle`: only use a directory that you
+    trust.
+
+    Parameters
+    ----------
+    directory : str or :class:`pathlib.Path`
+        The directory of the cache. It is created if needed.
+    max_size : int, default 512 MiB
+        The maximum size of the directory in bytes.
+    key : {'stat', 'hash'}, default 'stat'
+        How a file is identified. With 'stat', by its absolute path, size
+        and modification time, which does not read the file. With 'hash',
+        by a SHA-256 hash of its content, which reads the file but detects
+        changes that keep the size and modification time.
+
+    Examples
+    --------
+    >>> cache = DiskCache('~/.cache/mytextgrid')
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', cache = cache)
+    """
+    def __init__(self, directory, max_size = 512 * 1024 * 1024, key = 'stat'):
+        if key not in ('stat', 'hash'):
+            raise ValueError(f"key MUST BE 'stat' or 'hash', not {key!r}.")
+
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+        self.key = key
+        self.directory.mkdir(parents = True, exist_ok = True)
+
+        # The size of the directory, computed on the first write.
+        self._size = None
+
+    def get(self, path, options):
+        """
+        Return the cached TextGrid of a file, or None.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path of the TextGrid file.
+        options : dict
+            The reading options.
+
+        Returns
+        -------
+        :class:`mytextgrid.TextGrid` or None
+            A new TextGrid instance, or None if the file is not cached.
+        """
+        entry_path = self._entry_path(path, options)
+        if entry_path is None:
+            return None
+        return self._load(entry_path)
+
+    def put(self, path, options, textgrid):
+        """
+        Store the TextGrid of a file.
+
+        The file is identified when the method is called: use
+        :meth:`get_or_read` if the file can change while it is read.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path of the TextGrid file.
+        options : dict
+            The reading options.
+        textgrid : :class:`mytextgrid.TextGrid`
+            The TextGrid read from the file with `options`.
+        """
+        entry_path = self._entry_path(path, options)
+        if entry_path is not None:
+            self._save(entry_path, textgrid)
+
+    def get_or_read(self, path, options, read):
+        """
+        Return the cached TextGrid of a file, or read it and store it.
+
+        The file is identified (and hashed, if `key` is 'hash') once, before
+        it is read, so if the file changes while it is read, the entry is not
+        valid for the new content.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path of the TextGrid file.
+        options : dict
+            The reading options.
+        read : callable
+            A function without arguments that reads the file with `options`.
+
+        Returns
+        -------
+        :class:`mytextgrid.TextGrid`
+            The cached TextGrid or the one returned by `read`.
+        """
+        entry_path = self._entry_path(path, options)
+        if entry_path is None:
+            return read()
+
+        textgrid = self._load(entry_path)
+        if textgrid is None:
+            textgrid = read()
+            self._save(entry_path, textgrid)
+        return textgrid
+
+    def _load(self, entry_path):
+        try:
+            with open(entry_path, 'rb') as file_object:
+                version, data = pickle.load(file_object)
+            if version != _CACHE_VERSION:
+                return None
+            textgrid = _from_columns(data)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A damaged entry: read the file again.
+            _remove(entry_path)
+            return None
+
+        # The modification time of an entry is the time it was last used.
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return textgrid
+
+    def _save(self, entry_path, textgrid):
+        data = pickle.dumps((_CACHE_VERSION, _to_columns(textgrid)), _PICKLE_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+
+        # Write to a temporary file first, so that readers never see half an entry.
+        fd, tmp_path = tempfile.mkstemp(suffix = '.tmp', dir = self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as file_object:
+                file_object.write(data)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            _remove(tmp_path)
+            raise
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def size(self):
+        """
+        Return the size of the entries in bytes.
+        """
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def clear(self):
+        """
+        Remove all the entries.
+        """
+        for entry in self._entries():
+            _remove(entry.path)
+        self._size = 0
+
+    def _entries(self):
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith(_SUFFIX)]
+
+    def _evict(self):
+        """
+        Remove the least recently used entries until the directory takes 90%
+        of `max_size`, so that the next writes do not evict again.
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        limit = self.max_size * 0.9
+        for _, entry_size, entry_path in entries:
+            if size <= limit:
+                break
+            _remove(entry_path)
+            size -= entry_size
+        self._size = size
+
+    def _entry_path(self, path, options):
+        """
+        Return the path of the entry of a file, or None if it cannot be cached.
+        """
+        key = _entry_key(path, options)
+        if key is None:
+            return None
+
+        path, format_, encoding, tiers = key
+        if self.key == 'hash':
+            file_id = _hash_file(path)
+        else:
+            file_id = (path, *_stat_id(path))
+
+        key = repr((_CACHE_VERSION, file_id, format_, encoding, tiers))
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + _SUFFIX)
+
+def _entry_key(path, options):
+    """
+    Return the absolute path of a file and the reading options as a
+    hashable tuple, or None if the options cannot be cached.
+    """
+    tiers = options.get('tiers')
+    if callable(tiers):
+        return None
+    if isinstance(tiers, (str, int)):
+        tiers = [tiers]
+    if tiers is not None:
+        # The order and repetitions do not change the tiers that are read.
+        tiers = tuple(sorted(set(tiers), key = repr))
+
+    path = os.path.abspath(os.path.expanduser(path))
+    return path, options.get('format_'), options.get('encoding'), tiers
+
+def _stat_id(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+def _estimate_size(textgrid):
+    return sum(
+        _ITEM_SIZE * len(tier) + sum(len(item.text) for item in tier) for tier in textgrid
+    )
+
+def _to_columns(textgrid):
+    """
+    Return the values of a TextGrid as tuples of strings and lists.
+    """
+    tiers = []
+    for tier in textgrid:
+        if tier.is_interval():
+            times = [str(tier[0].xmin)]
+            times.extend([str(interval.xmax) for interval in tier])
+        else:
+            times = [str(point.time) for point in tier]
+        texts = [item.text for item in tier]
+        tiers.append((tier.is_interval(), tier.name, str(tier.xmin), str(tier.xmax), times, texts))
+    return str(textgrid.xmin), str(textgrid.xmax), tiers
+
+def _from_columns(data):
+    """
+    Build a TextGrid from the values returned by :func:`_to_columns`.
+    """
+    xmin, xmax, tiers = data
+    textgrid = TextGrid(xmin, xmax)
+    for is_interval, name, tier_xmin, tier_xmax, times, texts in tiers:
+        if is_interval:
+            tier = IntervalTier.from_boundaries(times, texts, name, textgrid)
+        else:
+            tier = PointTier.from_points(times, texts, name, tier_xmin, tier_xmax, textgrid)
+        textgrid.tiers.append(tier)
+    return textgrid
+
+def _hash_file(path, chunk_size = 1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file_object:
+        for chunk in iter(lambda: file_object.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
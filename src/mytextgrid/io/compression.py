@@ -0,0 +1,153 @@
+"""
+Read and write compressed TextGrid files.
+
+Files compressed with gzip, bzip2, xz or lzma are recognized from their
+first bytes when they are read, and from the extension of their path
+(``.gz``, ``.bz2``, ``.xz`` or ``.lzma``) when they are written. The data
+is decompressed or compressed as it is read or written, so no temporary
+file is needed.
+"""
+import io
+import os
+from contextlib import contextmanager
+
+_COMPRESSIONS = ('gzip', 'bz2', 'xz', 'lzma')
+
+# The first bytes of compressed files. The legacy lzma format has none.
+_MAGIC_NUMBERS = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+]
+_MAGIC_SIZE = 6
+
+_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'lzma',
+}
+
+# The default level of gzip (9) is much slower than 6 and the files are
+# barely smaller.
+_GZIP_LEVEL = 6
+
+def detect_compression(path):
+    """
+    Detect the compression of a file.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the file.
+
+    Returns
+    -------
+    str or None
+        One of {'gzip', 'bz2', 'xz', 'lzma'}, or None if the file is not
+        compressed. It is recognized from the first bytes of the file or,
+        for the legacy lzma format, from the ``.lzma`` extension.
+    """
+    with open(path, 'rb') as file_object:
+        return _sniff_compression(file_object.read(_MAGIC_SIZE), path)
+
+def compression_from_extension(path):
+    """
+    Return the compression given by the extension of a path.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of a file, e.g. ``'corpus.TextGrid.gz'``.
+
+    Returns
+    -------
+    str or None
+        One of {'gzip', 'bz2', 'xz', 'lzma'}, or None for other extensions.
+    """
+    extension = os.path.splitext(os.fspath(path))[1]
+    return _EXTENSIONS.get(extension.lower())
+
+@contextmanager
+def open_file(path, mode = 'rb', encoding = None, newline = None, compression = 'infer'):
+    """
+    Open a file, decompressing or compressing its content on the fly.
+
+    Uncompressed files are opened as :func:`open` does.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the file.
+    mode : {'rb', 'r', 'wb', 'w'}, default 'rb'
+        Read or write the file, in binary or text mode.
+    encoding : str or None, default None
+        The encoding of the text, in text mode.
+    newline : str or None, default None
+        How line endings are translated, in text mode. See :func:`open`.
+    compression : {'infer', 'gzip', 'bz2', 'xz', 'lzma'} or None, default 'infer'
+        The compression of the file. If 'infer', it is detected from the first
+        bytes when the file is read (see :func:`detect_compression`) and from
+        the extension when it is written (see :func:`compression_from_extension`).
+        If None, the file is not compressed.
+
+    Yields
+    ------
+    file object
+        A file object of the uncompressed content.
+
+    Examples
+    --------
+    >>> from mytextgrid.io.compression import open_file
+    >>> with open_file('corpus.TextGrid.gz', 'r', encoding = 'utf-8') as file_object:
+    ...     header = file_object.readline()
+    """
+    if mode not in ('rb', 'r', 'wb', 'w'):
+        raise ValueError(f'Unsupported mode: {mode!r}.')
+    if compression not in ('infer', None, *_COMPRESSIONS):
+        raise ValueError(f'Unknown compression: {compression!r}.')
+
+    writing = mode.startswith('w')
+    with open(path, 'wb' if writing else 'rb') as raw:
+        if compression == 'infer':
+            if writing:
+                compression = compression_from_extension(path)
+            else:
+                compression = _sniff_compression(raw.peek(_MAGIC_SIZE), path)
+
+        stream = raw
+        if compression is not None:
+            stream = _open_compressed(raw, 'wb' if writing else 'rb', compression)
+        if 'b' not in mode:
+            stream = io.TextIOWrapper(stream, encoding = encoding, newline = newline)
+        try:
+            yield stream
+        finally:
+            # Write the end of the compressed data before the file is closed.
+            stream.close()
+
+def _sniff_compression(head, path):
+    for magic_number, compression in _MAGIC_NUMBERS:
+        if head.startswith(magic_number):
+            return compression
+    if compression_from_extension(path) == 'lzma':
+        return 'lzma'
+    return None
+
+def _open_compressed(raw, mode, compression):
+    """
+    Wrap an open binary file with a (de)compressor.
+    """
+    if compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(fileobj = raw, mode = mode, compresslevel = _GZIP_LEVEL)
+    if compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(raw, mode)
+
+    import lzma
+    if mode == 'rb':
+        return lzma.LZMAFile(raw, mode) # Both xz and lzma are recognized
+    format_ = lzma.FORMAT_XZ if compression == 'xz' else lzma.FORMAT_ALONE
+    return lzma.LZMAFile(raw, mode, format = format_)
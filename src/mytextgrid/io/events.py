@@ -0,0 +1,31 @@
+"""
+Events emitted while a TextGrid file is parsed.
+
+Parsers yield ``(event, payload)`` tuples, where `event` is one of:
+
+* ``'textgrid'``: the header of a TextGrid. The payload is a :class:`TextGridHeader`.
+* ``'tier_start'``: the header of a tier. The payload is a :class:`TierHeader`.
+* ``'interval'``: an interval. The payload is an :class:`IntervalItem`.
+* ``'point'``: a point. The payload is a :class:`PointItem`.
+* ``'tier_end'``: the end of a tier. The payload is the same :class:`TierHeader`
+  as in the matching ``'tier_start'`` event.
+
+All the values are strings as written in the file. Convert times with
+:class:`decimal.Decimal` and sizes with :class:`int` when needed.
+"""
+from collections import namedtuple
+
+TextGridHeader = namedtuple('TextGridHeader', ['xmin', 'xmax', 'size'])
+TextGridHeader.__doc__ = 'The starting time, ending time and number of tiers of a TextGrid.'
+
+TierHeader = namedtuple('TierHeader', ['index', 'tier_class', 'name', 'xmin', 'xmax', 'size'])
+TierHeader.__doc__ = (
+    'The position, Praat class (IntervalTier or TextTier), name, starting time, '
+    'ending time and number of items of a tier.'
+)
+
+IntervalItem = namedtuple('IntervalItem', ['xmin', 'xmax', 'text'])
+IntervalItem.__doc__ = 'The starting time, ending time and text of an interval.'
+
+PointItem = namedtuple('PointItem', ['number', 'mark'])
+PointItem.__doc__ = 'The time and text of a point.'
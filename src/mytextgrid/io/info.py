@@ -0,0 +1,17 @@
+"""
+Summaries of TextGrid files, as returned by
+:func:`~mytextgrid.io.reader.read_textgrid_info`.
+"""
+from collections import namedtuple
+
+TextGridInfo = namedtuple('TextGridInfo', ['path', 'format', 'encoding', 'xmin', 'xmax', 'tiers'])
+TextGridInfo.__doc__ = (
+    'The path, format (long, short or binary), encoding, starting time, ending time '
+    'and list of :class:`TierInfo` of a TextGrid file. The encoding of binary files is None.'
+)
+
+TierInfo = namedtuple('TierInfo', ['name', 'tier_class', 'xmin', 'xmax', 'size'])
+TierInfo.__doc__ = (
+    'The name, Praat class (IntervalTier or TextTier), starting time, '
+    'ending time and number of items of a tier.'
+)
@@ -1,14 +1,265 @@
 """Parse TextGrid files in full text format into TextGrid objects"""
 import re
+import codecs
 import decimal
-from io import StringIO
+from functools import partial
+from itertools import chain
+from io import StringIO, TextIOWrapper
 from pathlib import Path
 
-import chardet
-
+from mytextgrid.core.interval_tier import IntervalTier
+from mytextgrid.core.lazy_tier import LazyTier
+from mytextgrid.core.point_tier import PointTier
+from mytextgrid.io.builder import TextGridBuilder
+from mytextgrid.io.events import IntervalItem, PointItem, TextGridHeader, TierHeader
+from mytextgrid.io.source import read_source
 from mytextgrid.io.textgrid import TextGrid
+from mytextgrid.io.utils import _BOOM_MARK_DICT, _detect_stream_encoding, _tier_filter
 decimal.getcontext().prec = 16
 
+# Map (indentation, text before ' = ') of a line to (key, is_string).
+_LINE_KEYS = {
+    (0, 'File type'): ('file_type', True),
+    (0, 'Object class'): ('object_class', True),
+    (0, 'xmin'): ('tg_xmin', False),
+    (0, 'xmax'): ('tg_xmax', False),
+    (0, 'size'): ('tiers', False),
+    (8, 'class'): ('tier_class', True),
+    (8, 'name'): ('tier_name', True),
+    (8, 'xmin'): ('tier_xmin', False),
+    (8, 'xmax'): ('tier_xmax', False),
+    (8, 'intervals: size'): ('intervals', False),
+    (8, 'points: size'): ('points', False),
+    (12, 'xmin'): ('interval_xmin', False),
+    (12, 'xmax'): ('interval_xmax', False),
+    (12, 'text'): ('interval_text', True),
+    (12, 'number'): ('point_number', False),
+    (12, 'mark'): ('point_mark', True),
+}
+
+# Match the rest of a quoted string up to its closing quotation mark.
+# Doubled quotation marks ("") are escaped quotes, not the end of the string.
+_STRING_END = re.compile(r'[^"]*(?:""[^"]*)*"(?!")')
+
+# The start of the line that starts a tier (e.g. '    item [1]:').
+_TIER_START = '    item ['
+
+def read_textgrid_file(path, encoding = None, lazy = False, tiers = None, tier_factory = None):
+    """
+    Read a full text TextGrid file into a :class:`mytextgrid.TextGrid`.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of the TextGrid file. If None, the function will figure out
+        the encoding.
+    lazy : bool, default False
+        If True, only the tier headers are read. The items of a tier are read
+        the first time the tier is accessed. See :func:`read_lazy`.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`read`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance.
+    """
+    if lazy:
+        return read_lazy(path, encoding, tiers, tier_factory)
+    source = read_source(path, encoding)
+    if source.format != 'long':
+        # The header keys of the long format (e.g. 'xmin = 0') are missing.
+        raise OSError(f'{path} is not a TextGrid file in long format.')
+    builder = TextGridBuilder(tier_factory = tier_factory)
+    return read(source.content, builder, tiers)
+
+def read(stream, builder = None, tiers = None):
+    """
+    Read a full text TextGrid into a :class:`mytextgrid.TextGrid`.
+
+    Unlike :func:`parse`, items are passed to a
+    :class:`~mytextgrid.io.builder.TextGridBuilder` as soon as they are
+    tokenized, so no intermediate dict is created.
+
+    Parameters
+    ----------
+    stream : str or :class:`io.StringIO`
+        The content of a full-formatted TextGrid.
+    builder : :class:`~mytextgrid.io.builder.TextGridBuilder` or None
+        The object that receives the parsed values. If None, a new
+        :class:`~mytextgrid.io.builder.TextGridBuilder` is used.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The names or positions (starting at 0) of the tiers to read, or a
+        function that takes a :class:`~mytextgrid.io.events.TierHeader` and
+        returns True for the tiers to read. The items of the other tiers are
+        skipped without being tokenized. If None, all tiers are read.
+
+    Returns
+    -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance.
+    """
+    if isinstance(stream, str):
+        stream = StringIO(stream)
+    if builder is None:
+        builder = TextGridBuilder()
+
+    _feed(stream, builder, _tier_filter(tiers))
+    return builder.close()
+
+def read_lazy(path, encoding = None, tiers = None, tier_factory = None):
+    """
+    Read the headers of a full text TextGrid file into a
+    :class:`mytextgrid.TextGrid` whose tiers are read on demand.
+
+    The file is scanned once to find the byte span of each tier and only the
+    class, name and size of each tier are parsed. The items of a tier are
+    parsed the first time the tier is reached through indexing, iteration,
+    ``get_tier_by_name`` or ``tiers``;
+    :meth:`~mytextgrid.TextGrid.describe` and ``len`` do not read any tier.
+    The file must not change while the TextGrid is in use.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of the TextGrid file. If None, the function will figure out
+        the encoding.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`read`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance.
+    """
+    selected = _tier_filter(tiers)
+    encoding, textgrid_header, tiers_ = _scan(path, encoding)
+
+    textgrid = TextGrid(textgrid_header.xmin, textgrid_header.xmax)
+    for tier_header, start, end in tiers_:
+        if selected is not None and not selected(tier_header):
+            continue
+        loader = partial(_read_tier, path, encoding, start, end, tier_factory = tier_factory)
+        textgrid._tiers.append(LazyTier(
+            tier_header.name, tier_header.tier_class == 'IntervalTier',
+            int(tier_header.size), loader
+        ))
+    return textgrid
+
+def read_info(path, encoding = None):
+    """
+    Read the header of a full text TextGrid file and the header of each tier.
+
+    The items are not tokenized. See :func:`read_lazy`.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of the TextGrid file. If None, the function will figure out
+        the encoding.
+
+    Returns
+    -------
+    tuple of (:class:`~mytextgrid.io.events.TextGridHeader`, list of :class:`~mytextgrid.io.events.TierHeader`)
+        The header of the TextGrid and of each tier.
+    """
+    _, textgrid_header, tiers = _scan(path, encoding)
+    return textgrid_header, [tier_header for tier_header, _, _ in tiers]
+
+def iter_events(stream):
+    """
+    Parse a full text TextGrid incrementally and yield an event for each
+    header and item, without building any TextGrid object.
+
+    The stream may contain several TextGrids one after another. See
+    :mod:`mytextgrid.io.events` for the list of events.
+
+    Parameters
+    ----------
+    stream : str or :class:`io.StringIO`
+        The content of a full-formatted TextGrid.
+
+    Yields
+    ------
+    (event, payload), tuple of (str, tuple)
+        The event name and its payload.
+    """
+    if isinstance(stream, str):
+        stream = StringIO(stream)
+
+    textgrid_header = None # Pending until the number of tiers is known
+    tier_header = None
+    tier_index = -1
+
+    for key, value in _tokenize(stream):
+        if key == 'interval_xmin':
+            xmin = value
+        elif key == 'interval_xmax':
+            xmax = value
+        elif key == 'interval_text':
+            yield 'interval', IntervalItem(xmin, xmax, value)
+        elif key == 'point_number':
+            number = value
+        elif key == 'point_mark':
+            yield 'point', PointItem(number, value)
+        elif key in ('intervals', 'points'):
+            tier_index += 1
+            tier_header = TierHeader(
+                tier_index, tier_class, tier_name, tier_xmin, tier_xmax, value
+            )
+            yield 'tier_start', tier_header
+        elif key == 'tier_class':
+            if tier_header is not None:
+                yield 'tier_end', tier_header
+                tier_header = None
+            if textgrid_header is not None:
+                yield 'textgrid', textgrid_header
+                textgrid_header = None
+            tier_class = value
+        elif key == 'tier_name':
+            tier_name = value
+        elif key == 'tier_xmin':
+            tier_xmin = value
+        elif key == 'tier_xmax':
+            tier_xmax = value
+        elif key == 'tiers':
+            yield 'textgrid', textgrid_header._replace(size = value)
+            textgrid_header = None
+        elif key == 'tg_xmin':
+            tg_xmin = value
+        elif key == 'tg_xmax':
+            textgrid_header = TextGridHeader(tg_xmin, value, '0')
+        elif key == 'file_type':
+            if not value == 'ooTextFile':
+                raise OSError('The stream is not a Praat object.')
+            if tier_header is not None:
+                yield 'tier_end', tier_header
+                tier_header = None
+            if textgrid_header is not None:
+                yield 'textgrid', textgrid_header
+                textgrid_header = None
+            tier_index = -1
+        elif key == 'object_class':
+            if not value == 'TextGrid':
+                raise OSError('The stream is not a TextGrid.')
+
+    if tier_header is not None:
+        yield 'tier_end', tier_header
+    if textgrid_header is not None:
+        yield 'textgrid', textgrid_header
+
 def parse_textgrid_file(path, encoding = None):
     """
     Parse a full text TextGrid file into a dict.
@@ -24,14 +275,9 @@ def parse_textgrid_file(path, encoding = None):
     if isinstance(path, str):
         path = Path(path)
 
-    # Open file
-    if encoding is None:
-        encoding = _detect_encoding(path)
-
-    with open(path, 'r', encoding = encoding) as file_object:
-        dict_ = parse(file_object)
-        dict_['basename'] = path.stem
-        dict_['path'] = path
+    dict_ = parse(read_source(path, encoding).content)
+    dict_['basename'] = path.stem
+    dict_['path'] = path
     return dict_
 
 def parse(stream, name = None, path = None):
@@ -77,6 +323,10 @@ def parse(stream, name = None, path = None):
     -------
         dict
             A `dict` representation of the TextGrid file.
+
+    See also
+    --------
+    read : Build a TextGrid object without the intermediate dict.
     """
     if isinstance(stream, str):
         stream = StringIO(stream)
@@ -91,84 +341,53 @@ def parse(stream, name = None, path = None):
         'tiers':[]
     }
 
-    line = stream.readline()
-    while line:
-        key, match = _parse_line(line)
-        # Check header
-        if key == 'file_type':
-            file_type = match.group(key)
-            if not file_type == 'ooTextFile':
-                raise OSError('The stream is not a Praat object.')
+    for key, value in _tokenize(stream):
+        # Item content
+        if key == 'interval_xmin':
+            item = {'xmin': value, 'xmax': None, 'text': None}
+            textgrid['tiers'][-1]['items'].append(item)
 
-        if key == 'object_class':
-            object_class = match.group(key)
-            if not object_class == 'TextGrid':
-                raise OSError('The stream is not a TextGrid.')
+        elif key == 'interval_xmax':
+            item['xmax'] = value
 
-        # TextGrid info
-        if key == 'tg_xmin':
-            textgrid['xmin'] = match.group(key)
+        elif key == 'interval_text':
+            item['text'] = value
 
-        if key == 'tg_xmax':
-            textgrid['xmax'] = match.group(key)
+        elif key == 'point_number':
+            item = {'number': value, 'mark': None}
+            textgrid['tiers'][-1]['items'].append(item)
+
+        elif key == 'point_mark':
+            item['mark'] = value
 
         # Tier info
-        if key == 'tier_class':
+        elif key == 'tier_class':
             textgrid['tiers'].append(
                 {
-                'class': match.group(key),
+                'class': value,
                 'tier_name':None,
                 'items': []
                 }
             )
 
-        if key == 'tier_name':
-            textgrid['tiers'][-1]['tier_name'] = match.group(key)
+        elif key == 'tier_name':
+            textgrid['tiers'][-1]['tier_name'] = value
 
-        # Item content
-        if key == 'interval_xmin':
-            textgrid['tiers'][-1]['items'].append(
-                {
-                'xmin': match.group(key),
-                'xmax': None,
-                'text': None
-                }
-            )
+        # TextGrid info
+        elif key == 'tg_xmin':
+            textgrid['xmin'] = value
 
-        if key == 'interval_xmax':
-            textgrid['tiers'][-1]['items'][-1]['xmax'] = match.group(key)
+        elif key == 'tg_xmax':
+            textgrid['xmax'] = value
 
-        if key == 'point_number':
-            textgrid['tiers'][-1]['items'].append(
-                {'number':match.group(key),
-                'mark':None
-                }
-            )
+        # Check header
+        elif key == 'file_type':
+            if not value == 'ooTextFile':
+                raise OSError('The stream is not a Praat object.')
 
-        if key in ('interval_text', 'point_mark'):
-            type_label = 'text' if key == 'interval_text' else 'mark'
-            text = match.group(key).replace('""', '"')
-            textgrid['tiers'][-1]['items'][-1][type_label] = text
-
-        # If the text or mark field has multiple lines, read the those
-        # lines until the last.
-        if key in ('interval_text2', 'point_mark2'):
-            text = match.group(key) + '\n'
-            enditem_pattern = re.compile('(.*)" $')
-            type_label = 'text' if key == 'interval_text2' else 'mark'
-            item = textgrid['tiers'][-1]['items'][-1]
-
-            while line:
-                line = stream.readline()
-                match = enditem_pattern.match(line)
-                if match:
-                    # Check the last character not to be a `"" \n`
-                    if not line.endswith('"" \n'):
-                        text = text + match.group(1)
-                        item[type_label] = text.replace('""', '"')
-                        break
-                text = text + line
-        line = stream.readline()
+        elif key == 'object_class':
+            if not value == 'TextGrid':
+                raise OSError('The stream is not a TextGrid.')
     return textgrid
 
 def dict_to_textgrid(textgrid):
@@ -199,92 +418,278 @@ def dict_to_textgrid(textgrid):
     for tier in textgrid['tiers']:
         tier_class = tier['class']
         tier_name = tier['tier_name']
+        items = tier['items']
 
         if tier_class == 'IntervalTier':
-            # Insert interval tier
-            tier_obj = textgrid_obj.insert_tier(tier_name)
-
-            # Insert interval
-            for loc, item in enumerate(tier['items']):
-                # Insert boundary.
-                if not loc == 0:
-                    tier_obj.insert_boundaries(
-                        decimal.Decimal(item['xmin'])
-                    )
-                # Insert text
-                tier_obj.set_text_at_index(loc, item['text'])
+            times = [item['xmin'] for item in items] + [items[-1]['xmax']]
+            texts = [item['text'] for item in items]
+            tier_obj = IntervalTier.from_boundaries(times, texts, tier_name, textgrid_obj)
+            textgrid_obj.tiers.append(tier_obj)
 
         if tier_class == 'TextTier':
-            # Insert tier
-            tier_obj = textgrid_obj.insert_tier(tier_name, False)
-            for item in tier['items']:
-                # Insert Point
-                tier_obj.insert_point(
-                    decimal.Decimal(item['number']),
-                    item['mark']
-                )
+            times = [item['number'] for item in items]
+            marks = [item['mark'] for item in items]
+            tier_obj = PointTier.from_points(
+                times, marks, tier_name, textgrid_obj.xmin, textgrid_obj.xmax, textgrid_obj
+            )
+            textgrid_obj.tiers.append(tier_obj)
     return textgrid_obj
 
-def _parse_line(line):
+def _feed(stream, builder, selected = None):
     """
-    Test if a list of patterns stored in dictonary match a text line.
+    Pass the tokens of a long-format TextGrid to a builder.
+
+    If `selected` is a function, the tiers whose
+    :class:`~mytextgrid.io.events.TierHeader` it rejects are skipped.
+    """
+    lines = iter(stream)
+    tier_index = -1
+    for key, value in _tokenize(lines):
+        if key == 'interval_xmin':
+            xmin = value
+        elif key == 'interval_xmax':
+            xmax = value
+        elif key == 'interval_text':
+            builder.add_interval(xmin, xmax, value)
+        elif key == 'point_number':
+            number = value
+        elif key == 'point_mark':
+            builder.add_point(number, value)
+        elif key == 'tier_class':
+            tier_class = value
+        elif key == 'tier_name':
+            tier_name = value
+        elif key == 'tier_xmin':
+            tier_xmin = value
+        elif key == 'tier_xmax':
+            tier_xmax = value
+        elif key in ('intervals', 'points'):
+            tier_index += 1
+            if selected is not None and not selected(TierHeader(
+                tier_index, tier_class, tier_name, tier_xmin, tier_xmax, value
+            )):
+                # The tokenizer reads from the same lines, so it resumes
+                # at the next tier.
+                _skip_tier(lines)
+                continue
+            builder.start_tier(tier_class, tier_name, tier_xmin, tier_xmax)
+        elif key == 'tg_xmin':
+            tg_xmin = value
+        elif key == 'tg_xmax':
+            builder.start_textgrid(tg_xmin, value)
+        elif key == 'file_type':
+            if not value == 'ooTextFile':
+                raise OSError('The stream is not a Praat object.')
+        elif key == 'object_class':
+            if not value == 'TextGrid':
+                raise OSError('The stream is not a TextGrid.')
+
+def _scan(path, encoding = None):
+    """
+    Find the headers and byte spans of the tiers of a full text TextGrid file.
+
+    Returns
+    -------
+    tuple
+        The encoding of the file, the
+        :class:`~mytextgrid.io.events.TextGridHeader` and a list with the
+        :class:`~mytextgrid.io.events.TierHeader`, starting byte and ending
+        byte of each tier.
+    """
+    with open(path, 'rb') as file_object:
+        if encoding is None:
+            encoding = _detect_stream_encoding(file_object)
+        elif codecs.lookup(encoding).name == 'utf-16':
+            # Byte offsets are counted by encoding the text again, so the
+            # byte order must be explicit to not count a BOM on every block.
+            file_object.seek(0)
+            encoding = _BOOM_MARK_DICT.get(file_object.read(2), 'utf-16le')
+
+    with open(path, 'r', encoding = encoding, newline = '') as file_object:
+        tier_offsets, file_size = _find_tiers(file_object, encoding)
+
+    with open(path, 'rb') as file_object:
+        header = _read_header(file_object, encoding, 0, ('tiers',))
+        if not header.get('file_type') == 'ooTextFile':
+            raise OSError('The stream is not a Praat object.')
+        if not header.get('object_class') == 'TextGrid':
+            raise OSError('The stream is not a TextGrid.')
+
+        # The keys are only found in long-format files.
+        try:
+            textgrid_header = TextGridHeader(
+                header['tg_xmin'], header['tg_xmax'], header.get('tiers', '0')
+            )
+
+            tiers = []
+            tier_ends = tier_offsets[1:] + [file_size]
+            for index, (start, end) in enumerate(zip(tier_offsets, tier_ends)):
+                header = _read_header(file_object, encoding, start, ('intervals', 'points'))
+                tier_class = header['tier_class']
+                size = header['intervals' if tier_class == 'IntervalTier' else 'points']
+                tier_header = TierHeader(
+                    index, tier_class, header['tier_name'],
+                    header['tier_xmin'], header['tier_xmax'], size
+                )
+                tiers.append((tier_header, start, end))
+        except KeyError:
+            raise OSError(f'{path} is not a TextGrid file in long format.') from None
+    return encoding, textgrid_header, tiers
+
+def _skip_tier(lines):
+    """
+    Consume the lines up to and including the start of the next tier.
+
+    Quotation marks are counted to not stop inside a multi-line string.
+    """
+    quotes = 0
+    for line in lines:
+        if not quotes % 2 and line.startswith(_TIER_START):
+            return
+        quotes += line.count('"')
+
+def _find_tiers(file_object, encoding):
+    """
+    Find the byte offsets of the tiers of a long-format TextGrid.
+
+    The file is searched in blocks of whole lines for ``item [`` lines. A match is
+    the start of a tier only if it is not inside a string, i.e., if the number
+    of quotation marks before it is even.
 
     Parameters
     ----------
-    line : str
-        Any line in full textgrid format that comes from a TextGrid file.
+    file_object : file object
+        A TextGrid file opened in text mode with ``newline=''``.
+    encoding : str
+        The encoding of the file.
 
     Returns
     -------
-        (key, match), tuple of (str, re.Match)
-            Return the key of the pattern that matches the line and the `re.Match`.
-            If no key matches the line, return (None, None)
-    """
-    _patterns_dict = {
-        'file_type': re.compile('File type = "(?P<file_type>.+)"'),
-        'object_class': re.compile('Object class = "(?P<object_class>.+)"'),
-        'tg_xmin': re.compile('xmin = (?P<tg_xmin>.+) '),
-        'tg_xmax': re.compile('xmax = (?P<tg_xmax>.+) '),
-        'tier_exists': re.compile(r'tiers? <(?P<tier_exists>.+)> '),
-        'tiers': re.compile(r'size = (?P<tiers>\d+) '),
-        'tier_loc': re.compile(r' {4}item [(?P<tier_loc>\d+)]'),
-        'tier_class': re.compile(' {8}class = "(?P<tier_class>.+)" '),
-        'tier_name': re.compile(' {8}name = "(?P<tier_name>.*)" '),
-        'tier_xmin': re.compile(' {8}xmin = (?P<tier_xmin>.+) '),
-        'tier_xmax': re.compile(' {8}xmax = (?P<tier_xmax>.+) '),
-        'intervals': re.compile(r' {8}intervals: size = (?P<intervals>\d+) '),
-        'interval_loc': re.compile(r' {8}intervals [(?P<interval_loc>\d+)]:'),
-        'interval_xmin': re.compile(' {12}xmin = (?P<interval_xmin>.+) '),
-        'interval_xmax': re.compile(' {12}xmax = (?P<interval_xmax>.+) '),
-        'interval_text': re.compile(' {12}text = "(?P<interval_text>.*)" '),
-        'interval_text2': re.compile(' {12}text = "(?P<interval_text2>.*)'),
-        'points': re.compile(r' {8}points: size = (?P<points> \d+) '),
-        'point_loc': re.compile(r' {8}points [(?P<point_loc>\d+)]:'),
-        'point_number': re.compile(' {12}number = (?P<point_number>.+) '),
-        'point_mark': re.compile(' {12}mark = "(?P<point_mark>.*)" '),
-        'point_mark2': re.compile(' {12}mark = "(?P<point_mark2>.*)')
-    }
-    for key, pattern in _patterns_dict.items():
-        match = pattern.match(line)
-        if match:
-            return key, match
-    return None, None
+    tuple of (list of int, int)
+        The byte offset of each tier and the size of the file in bytes.
+    """
+    tier_offsets = []
+    offset = 0
+    quotes = 0
+    while True:
+        lines = file_object.readlines(1 << 16)
+        if not lines:
+            break
+        chunk = ''.join(lines)
+
+        last = 0
+        position = chunk.find(_TIER_START)
+        while position != -1:
+            if position == 0 or chunk[position - 1] in '\r\n':
+                quotes += chunk.count('"', last, position)
+                last = position
+                if not quotes % 2:
+                    tier_offsets.append(offset + len(chunk[:position].encode(encoding)))
+            position = chunk.find(_TIER_START, position + 1)
+        quotes += chunk.count('"', last)
+        offset += len(chunk.encode(encoding))
+    return tier_offsets, offset
+
+def _read_header(file_object, encoding, offset, last_keys):
+    """
+    Tokenize a file from `offset` until one of `last_keys` is found.
+
+    Returns
+    -------
+    dict
+        The tokens found, by key.
+    """
+    file_object.seek(offset)
+    stream = TextIOWrapper(file_object, encoding = encoding, newline = '')
+    header = {}
+    for key, value in _tokenize(stream):
+        header[key] = value
+        if key in last_keys:
+            break
+    stream.detach()
+    return header
+
+def _read_tier(path, encoding, start, end, textgrid, tier_factory = None):
+    """
+    Read the tier stored between the bytes `start` and `end` of a file.
+    """
+    with open(path, 'rb') as file_object:
+        file_object.seek(start)
+        data = file_object.read(end - start)
 
-def _detect_encoding(path):
+    builder = TextGridBuilder(textgrid, tier_factory)
+    _feed(StringIO(data.decode(encoding), newline = None), builder)
+    return builder.end_tier()
+
+def _tokenize(stream):
     """
-    Detect and return a file encoding.
+    Split a long-format TextGrid into a sequence of (key, value) tokens.
+
+    Each line is classified once by looking up its indentation level and
+    the text before ``' = '`` in :data:`_LINE_KEYS`. Lines that do not
+    carry any value used by the parser (e.g. ``item [1]:``) are skipped.
+    String values are returned unquoted and unescaped, and may span
+    several lines.
 
     Parameters
     ----------
-    path : str
-        The path of a text file.
+    stream : iterable of str
+        The lines of a long-format TextGrid.
+
+    Yields
+    ------
+    (key, value), tuple of (str, str)
+        The key of the line (see :data:`_LINE_KEYS`) and its value.
+    """
+    lines = iter(stream)
+    # Drop the byte order mark that is kept when UTF-16 is decoded with an
+    # explicit byte order.
+    lines = chain([next(lines, '').lstrip('\ufeff')], lines)
+    for line in lines:
+        stripped = line.lstrip(' ')
+        name, _, value = stripped.partition(' = ')
+        key_info = _LINE_KEYS.get((len(line) - len(stripped), name))
+        if key_info is None:
+            continue
+
+        key, is_string = key_info
+        if not is_string:
+            yield key, value.rstrip()
+            continue
+        yield key, _read_string(value, lines)
+
+def _read_string(value, lines):
+    """
+    Return the unquoted and unescaped text of a string value.
+
+    Parameters
+    ----------
+    value : str
+        The rest of the line from the opening quotation mark.
+    lines : iterator of str
+        The next lines, consumed if the string spans several lines.
 
     Returns
     -------
-        str
-            The detected encoding name of the specified file.
+    str
+        The text of the string.
     """
-    with open(path, 'rb') as file_object:
-        rawdata = file_object.read()
-        result = chardet.detect(rawdata)
-        return result.get('encoding')
+    # Find the closing quotation mark, which may be on a later line.
+    value = value.rstrip('\r\n')
+    match = _STRING_END.match(value, 1)
+    if match:
+        text = value[1:match.end() - 1]
+    else:
+        pieces = [value[1:]]
+        for line in lines:
+            line = line.rstrip('\r\n')
+            match = _STRING_END.match(line)
+            if match:
+                pieces.append(line[:match.end() - 1])
+                break
+            pieces.append(line)
+        text = '\n'.join(pieces)
+
+    if '""' in text:
+        text = text.replace('""', '"')
+    return text
@@ -1,28 +1,136 @@
+from mytextgrid.core.utils import obj_to_decimal
+from mytextgrid.io import binary
 from mytextgrid.io import long
+from mytextgrid.io import text_parser
+from mytextgrid.io.builder import TextGridBuilder
+from mytextgrid.io.compression import detect_compression, open_file
+from mytextgrid.io.info import TextGridInfo, TierInfo
+from mytextgrid.io.source import read_source
+from mytextgrid.io.utils import _detect_stream_encoding, _freeze_tiers, detect_textgrid_format
 
-def read_textgrid(filepath, format_ = 'long', encoding = None):
+def read_textgrid(filepath, format_ = 'long', encoding = None, lazy = False, tiers = None,
+                  memory_map = False, cache = None, columnar = False, resolution = None):
     """
     Read a TextGrid file and return a TextGrid object.
 
+    Files compressed with gzip, bzip2, xz or lzma are decompressed as they
+    are read (see :mod:`mytextgrid.io.compression`).
+
     Parameters
     ----------
     path : str
         The path of the TextGrid file.
-    format_ : {'long'}
-        The TextGrid format.
+    format_ : {'long', 'short', 'binary', 'auto'}, default 'long'
+        The TextGrid format. If 'auto', it is detected from the file header.
+        Unless `lazy` or `memory_map` is True, the file is read only once to
+        detect the format and the encoding and to parse it.
     encoding : str, default None, detect automatically the encoding.
         The name of the encoding used to decode the file. See the codecs module for the list
-        supported encodings.
+        supported encodings. Ignored for binary files.
+    lazy : bool, default False
+        If True, the file is scanned once and the items of each tier are read
+        only when the tier is first accessed (by index, iteration or
+        :meth:`~mytextgrid.TextGrid.get_tier_by_name`). Use it to look at a few
+        tiers of large files. The file must not change while the TextGrid is in use.
+        Only supported for uncompressed files in long format; ignored otherwise.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The names or positions (starting at 0) of the tiers to read, or a
+        function that takes a :class:`~mytextgrid.io.events.TierHeader` and
+        returns True for the tiers to read. The items of the other tiers are
+        skipped while the file is parsed. If None, all tiers are read.
+        Negative positions raise ValueError, since the number of tiers is
+        not known before they are read.
+    memory_map : bool, default False
+        If True, the file is memory-mapped and parsed as bytes: only the
+        labels are decoded, so very large files are read without a decoded
+        copy in memory. Supports UTF-8 and single-byte encodings; other
+        encodings are read as usual. Ignored if `lazy` is True, for compressed
+        files and for binary files, which are read in one go.
+    cache : :class:`~mytextgrid.io.cache.MemoryCache`, :class:`~mytextgrid.io.cache.DiskCache`, bool or None, default None
+        A cache of parsed TextGrids (see :mod:`mytextgrid.io.cache`). If the
+        file is in the cache, it is not parsed again; otherwise, the TextGrid
+        is stored in the cache after it is read. If True, use the
+        :class:`~mytextgrid.io.cache.MemoryCache` shared by the process,
+        whose TextGrids must not be modified. Ignored if `lazy` is True.
+    columnar : bool, default False
+        If True, the tiers store their times and texts in columns instead of
+        one object per item, which takes about a third of the memory (see
+        :mod:`mytextgrid.core.columnar_tier`). The columns are filled while
+        the file is read and the items are made when they are accessed.
+    resolution : int, float, str, :class:`decimal.Decimal` or None, default None
+        If given, the tiers are columnar and also keep their times as integer
+        ticks of this duration (in seconds), e.g. ``'1e-9'`` for nanoseconds,
+        so that times are looked up with integer comparisons. The exact times
+        are kept and written back unchanged.
 
     Returns
     -------
         :class:`mytextgrid.io.textgrid.TextGrid`
             A TextGrid instance.
+
+    Examples
+    --------
+    Read only the tier named 'phone'.
+
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', lazy = True)
+    >>> phones = textgrid.get_tier_by_name('phone')[0]
+
+    Read the tier named 'phone' and the first tier, skipping the others.
+
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', tiers = ['phone', 0])
+
+    Parse a file only the first time it is read in the process.
+
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', cache = True)
+
+    Keep the parsed TextGrids on disk for the next runs.
+
+    >>> from mytextgrid.io.cache import DiskCache
+    >>> cache = DiskCache('~/.cache/mytextgrid')
+    >>> textgrid = mytextgrid.read_textgrid('corpus.TextGrid', cache = cache)
     """
+    # The tiers are used by the cache and by the reader: take them once.
+    tiers = _freeze_tiers(tiers)
+
+    tier_factory = None
+    if columnar or resolution is not None:
+        from mytextgrid.core.columnar_tier import columnar_tier_factory, to_columnar
+        if cache is not None and cache is not False and not lazy:
+            # The cache keeps TextGrids with item objects, whatever the tiers read.
+            textgrid = read_textgrid(filepath, format_, encoding, lazy, tiers, memory_map, cache)
+            return to_columnar(textgrid, resolution)
+        # The tiers are built in columns as they are read.
+        tier_factory = columnar_tier_factory(resolution)
+
+    if cache is True:
+        from mytextgrid.io.cache import memory_cache as cache
+    if cache is not None and cache is not False and not lazy:
+        options = {'format_': format_, 'encoding': encoding, 'tiers': tiers}
+        read = lambda: read_textgrid(filepath, format_, encoding, tiers = tiers,
+                                     memory_map = memory_map)
+        if hasattr(cache, 'get_or_read'):
+            return cache.get_or_read(filepath, options, read)
+        textgrid = cache.get(filepath, options)
+        if textgrid is None:
+            textgrid = read()
+            cache.put(filepath, options, textgrid)
+        return textgrid
+
+    if format_ == 'auto':
+        if not (lazy or memory_map):
+            return _read_source(read_source(filepath, encoding), tiers, tier_factory)
+        format_ = detect_textgrid_format(filepath)
+
     if format_ == 'long':
-        return read_long(filepath, encoding)
+        return read_long(filepath, encoding, lazy, tiers, memory_map, tier_factory)
+    if format_ == 'short':
+        return read_short(filepath, encoding, tiers, memory_map, tier_factory)
+    if format_ == 'binary':
+        return read_binary(filepath, tiers, tier_factory)
+    raise ValueError(f'Cannot read {filepath}: unsupported format {format_!r}.')
 
-def read_long(filepath, encoding = None):
+def read_long(filepath, encoding = None, lazy = False, tiers = None, memory_map = False,
+              tier_factory = None):
     """
     Read a TextGrid file with full text format and return a TextGrid object.
 
@@ -33,17 +141,90 @@ def read_long(filepath, encoding = None):
     encoding : str, default None, detect automatically the encoding.
         The name of the encoding used to decode the file. See the codecs module for the list
         supported encodings.
+    lazy : bool, default False
+        If True, read the items of each tier when the tier is first accessed.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`read_textgrid`.
+    memory_map : bool, default False
+        If True, memory-map the file and parse it as bytes.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance.
+    """
+    if (lazy or memory_map) and detect_compression(filepath) is not None:
+        # Compressed files can be neither mapped nor read by byte offsets.
+        lazy = memory_map = False
+    if memory_map and not lazy:
+        return text_parser.read_mmap(filepath, encoding, tiers, tier_factory)
+    return long.read_textgrid_file(filepath, encoding, lazy, tiers, tier_factory)
+
+def read_short(filepath, encoding = None, tiers = None, memory_map = False, tier_factory = None):
+    """
+    Read a TextGrid file with short text format and return a TextGrid object.
+
+    Parameters
+    ----------
+    path : str
+        The path of the TextGrid file.
+    encoding : str, default None, detect automatically the encoding.
+        The name of the encoding used to decode the file. See the codecs module for the list
+        supported encodings.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`read_textgrid`.
+    memory_map : bool, default False
+        If True, memory-map the file and parse it as bytes.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance.
+    """
+    if memory_map and detect_compression(filepath) is None:
+        return text_parser.read_mmap(filepath, encoding, tiers, tier_factory)
+    return text_parser.read_textgrid_file(filepath, encoding, tiers, tier_factory)
+
+def read_binary(filepath, tiers = None, tier_factory = None):
+    """
+    Read a TextGrid file with Praat binary format and return a TextGrid object.
+
+    Parameters
+    ----------
+    path : str
+        The path of the TextGrid file.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
 
     Returns
     -------
         :class:`mytextgrid.io.textgrid.TextGrid`
             A TextGrid instance.
     """
-    textgrid_dict = long.parse_textgrid_file(filepath, encoding)
-    textgrid_obj = long.dict_to_textgrid(textgrid_dict)
-    return textgrid_obj
+    return binary.read_textgrid_file(filepath, tiers, tier_factory)
 
-def read_textgrid_from_stream(*args, **kwds):
+def _read_source(source, tiers = None, tier_factory = None):
+    """
+    Parse the content of a :class:`~mytextgrid.io.source.TextGridSource`.
+    """
+    if source.format == 'long':
+        return long.read(source.content, TextGridBuilder(tier_factory = tier_factory), tiers)
+    if source.format == 'short':
+        return text_parser.read(source.content, tiers, tier_factory)
+    if source.format == 'binary':
+        return binary.read(source.content, tiers, tier_factory)
+    raise OSError(f'{source.path} is not a TextGrid file.')
+
+def read_textgrid_from_stream(stream, name = None, path = None, tiers = None):
     """
     Read a stream into a TextGrid object.
 
@@ -55,12 +236,125 @@ def read_textgrid_from_stream(*args, **kwds):
         The name of the TextGrid.
     path : str or :class:`pathlib.Path`
         The path of the TextGrid.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`read_textgrid`.
 
     Returns
     -------
         :class:`mytextgrid.io.textgrid.TextGrid`
             A TextGrid instance.
     """
-    textgrid_dict = long.parse(*args, **kwds)
-    textgrid_obj = long.dict_to_textgrid(textgrid_dict)
-    return textgrid_obj
+    return long.read(stream, tiers = tiers)
+
+def iterparse(filepath, format_ = 'auto', encoding = None):
+    """
+    Parse a TextGrid file incrementally and yield events as it is read.
+
+    No TextGrid object is built and the file is read in small pieces, so
+    memory use stays constant even for very large files (e.g., several
+    TextGrids concatenated in a single file).
+
+    Parameters
+    ----------
+    filepath : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    format_ : {'auto', 'long', 'short'}
+        The TextGrid format. If 'auto', it is detected from the file header.
+    encoding : str, default None, detect automatically the encoding.
+        The name of the encoding used to decode the file.
+
+    Yields
+    ------
+    (event, payload), tuple of (str, tuple)
+        One of ``'textgrid'``, ``'tier_start'``, ``'interval'``, ``'point'``
+        or ``'tier_end'`` and its payload. See :mod:`mytextgrid.io.events`.
+
+    Examples
+    --------
+    Count the labelled intervals of each tier.
+
+    >>> counts = {}
+    >>> for event, payload in mytextgrid.iterparse('corpus.TextGrid'):
+    ...     if event == 'tier_start':
+    ...         name = payload.name
+    ...     elif event == 'interval' and payload.text:
+    ...         counts[name] = counts.get(name, 0) + 1
+    """
+    if format_ == 'auto':
+        format_ = detect_textgrid_format(filepath)
+
+    if format_ == 'long':
+        iter_events = long.iter_events
+    elif format_ == 'short':
+        iter_events = text_parser.iter_events
+    else:
+        raise ValueError(f'Cannot parse {filepath} incrementally: unsupported format {format_!r}.')
+
+    if encoding is None:
+        with open_file(filepath) as file_object:
+            encoding = _detect_stream_encoding(file_object)
+
+    with open_file(filepath, 'r', encoding = encoding) as file_object:
+        yield from iter_events(file_object)
+
+def read_textgrid_info(filepath, encoding = None):
+    """
+    Read the header of a TextGrid file without reading its items.
+
+    Use it to make an inventory of a corpus: only the header of the TextGrid
+    and the header of each tier are parsed. In long format, the items are
+    found without being tokenized; in binary format, they are skipped by
+    seeking; in short format, they are scanned but not assembled.
+
+    Parameters
+    ----------
+    filepath : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str, default None, detect automatically the encoding.
+        The name of the encoding used to decode a text file. Ignored for
+        binary files.
+
+    Returns
+    -------
+    :class:`~mytextgrid.io.info.TextGridInfo`
+        The format, encoding, starting and ending time of the TextGrid, and
+        the name, class, starting and ending time and number of items of
+        each tier.
+
+    Examples
+    --------
+    >>> info = mytextgrid.read_textgrid_info('corpus.TextGrid')
+    >>> [(tier.name, tier.size) for tier in info.tiers]
+    [('Mary', 4), ('John', 4), ('bell', 3)]
+    """
+    format_ = detect_textgrid_format(filepath)
+    if format_ == 'binary':
+        encoding = None
+        textgrid_header, tier_headers = binary.read_info(filepath)
+    elif format_ in ('long', 'short'):
+        if encoding is None:
+            with open_file(filepath) as file_object:
+                encoding = _detect_stream_encoding(file_object)
+        if format_ == 'long' and detect_compression(filepath) is None:
+            # The tiers are found by byte offsets in uncompressed files.
+            textgrid_header, tier_headers = long.read_info(filepath, encoding)
+        else:
+            with open_file(filepath, 'r', encoding = encoding) as file_object:
+                textgrid_header, tier_headers = text_parser.read_info(file_object)
+    else:
+        raise OSError(f'{filepath} is not a TextGrid file.')
+
+    tiers = [
+        TierInfo(
+            tier_header.name,
+            tier_header.tier_class,
+            obj_to_decimal(tier_header.xmin),
+            obj_to_decimal(tier_header.xmax),
+            int(tier_header.size)
+        )
+        for tier_header in tier_headers
+    ]
+    return TextGridInfo(
+        filepath, format_, encoding,
+        obj_to_decimal(textgrid_header.xmin), obj_to_decimal(textgrid_header.xmax), tiers
+    )
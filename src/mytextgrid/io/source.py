@@ -0,0 +1,73 @@
+"""
+Read a TextGrid file once for format detection, decoding and parsing.
+
+The bytes of the file are read in a single call. The format is sniffed from
+the first bytes of that buffer, the encoding is detected while the buffer is
+decoded, and the decoded text (or the bytes, for binary files) is handed to
+the parsers. Compressed files are decompressed as they are read.
+"""
+import codecs
+from collections import namedtuple
+
+from mytextgrid.io.compression import open_file
+from mytextgrid.io.utils import _SNIFF_SIZE, _decode_textgrid, _sniff_format
+
+TextGridSource = namedtuple('TextGridSource', ['path', 'format', 'encoding', 'content'])
+TextGridSource.__doc__ = (
+    'The path, format (long, short, binary or an empty string if the header is '
+    'not recognized), encoding and content of a TextGrid file. The content is '
+    'the decoded text with LF line endings, or the bytes of a binary file.'
+)
+
+def read_source(path, encoding = None):
+    """
+    Read a TextGrid file and detect its format and encoding.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of a text file. If None, it is detected while the file
+        is decoded (see :func:`~mytextgrid.io.utils.detect_textgrid_encoding`).
+        Ignored for binary files.
+
+    Returns
+    -------
+    :class:`TextGridSource`
+        The format, encoding and content of the file.
+    """
+    with open_file(path) as file_object:
+        data = file_object.read()
+    return decode_source(data, encoding, path)
+
+def decode_source(data, encoding = None, path = None):
+    """
+    Detect the format and encoding of the bytes of a TextGrid file.
+
+    Parameters
+    ----------
+    data : bytes
+        The content of a TextGrid file, e.g. a member of an archive.
+    encoding : str or None, default None
+        The encoding of a text file. If None, it is detected while the bytes
+        are decoded. Ignored for binary files.
+    path : str, :class:`pathlib.Path` or None, default None
+        The path or name of the file, used in error messages.
+
+    Returns
+    -------
+    :class:`TextGridSource`
+        The format, encoding and content of the file.
+    """
+    head = data[:_SNIFF_SIZE]
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8):]
+    format_ = _sniff_format(head)
+    if format_ == 'binary':
+        return TextGridSource(path, format_, None, data)
+
+    encoding, text = _decode_textgrid(data, encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return TextGridSource(path, format_, encoding, text)
@@ -1,310 +1,891 @@
 """Parse TextGrid files in long and short formats.
 """
-from mytextgrid.io.utils import detect_textgrid_encoding, is_textgrid_file
+import codecs
+import os
+import re
+import mmap
+from io import StringIO
+from itertools import islice
+
+from mytextgrid.io.builder import build_textgrid, TextGridBuilder
+from mytextgrid.io.events import IntervalItem, PointItem, TextGridHeader, TierHeader
+from mytextgrid.io.source import read_source
+from mytextgrid.io.textgrid import TextGrid
+from mytextgrid.io.utils import _BOOM_MARK_DICT, _detect_stream_encoding, _tier_filter
+
+# The text between values, such as the labels of the long format (`xmin = `)
+# or the positions between square brackets (`intervals [1]:`).
+_SKIP = r'[^"\[<0-9.+\-]*(?:\[[^\]]*\][^"\[<0-9.+\-]*)*'
+_SKIPPED = re.compile(_SKIP)
+
+# The values of a TextGrid text file: quoted strings, numbers and flags.
+# The text before a value is skipped as part of its match. The lookahead and
+# backreference make the skipped text atomic, so a failed match does not
+# backtrack over it. An opening quotation mark or bracket that is not closed
+# matches `open`.
+_VALUE_PATTERN = re.compile(r'''
+    (?=(?P<skip>''' + _SKIP + r'''))(?P=skip)
+    (?:
+        "(?P<string>[^"]*(?:""[^"]*)*)"(?!")
+        |(?P<number>[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)
+        |<(?P<flag>[a-z]+)>
+        |(?P<open>["\[<])
+    )
+    ''', re.VERBOSE)
+
+# The same values in the raw bytes of a file. Valid for encodings where ASCII
+# characters are single bytes that never occur inside other characters.
+_BYTES_SKIPPED = re.compile(_SKIP.encode('ascii'))
+_BYTES_VALUE_PATTERN = re.compile(_VALUE_PATTERN.pattern.encode('ascii'), re.VERBOSE)
+
+# The characters of a string before its closing quotation mark.
+_STRING_CHARS = re.compile(r'[^"]*(?:""[^"]*)*')
+
+# The beginning of an exponent at the end of a chunk, e.g. `3e-`
+_EXPONENT_START = re.compile('[eE][-+]?')
+
+_CHUNK_SIZE = 1 << 16
+
+# The kinds of the values of an item, by tier class.
+_INTERVAL_KINDS = ('number', 'number', 'string')
+_POINT_KINDS = ('number', 'string')
+_ITEM_KINDS = {'IntervalTier': _INTERVAL_KINDS, 'TextTier': _POINT_KINDS}
+
+# The kinds of the values of the headers, after 'ooTextFile' and before the
+# number of tiers, and of each tier.
+_HEADER_KINDS = ('string', 'number', 'number', 'flag')
+_TIER_KINDS = ('string', 'string', 'number', 'number', 'number')
+
+# The number of items taken from the value scanner at once.
+_BATCH_SIZE = 1024
+
+def iter_events(stream):
+    """
+    Parse a TextGrid in short (or long) text format incrementally and yield an
+    event for each header and item, without building any TextGrid object.
+
+    The stream is read in chunks, so memory use does not depend on the size
+    of the file. It may contain several TextGrids one after another. See
+    :mod:`mytextgrid.io.events` for the list of events.
+
+    Parameters
+    ----------
+    stream : str or :class:`io.StringIO`
+        The content of a TextGrid.
+
+    Yields
+    ------
+    (event, payload), tuple of (str, tuple)
+        The event name and its payload.
+    """
+    if isinstance(stream, str):
+        stream = StringIO(stream)
+    chunks = iter(lambda: stream.read(_CHUNK_SIZE), '')
+    return _iter_events_from_values(_iter_values(chunks))
 
-_DECIMAL_CHARS = {'.', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0'}
+def read_textgrid_file(path, encoding = None, tiers = None, tier_factory = None):
+    """
+    Read a TextGrid file in short (or long) text format into a
+    :class:`mytextgrid.TextGrid`.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of the TextGrid file. If None, the function will figure out
+        the encoding.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+    """
+    source = read_source(path, encoding)
+    if source.format == 'binary':
+        raise OSError(f'{path} is not a TextGrid file in text format.')
+    return read(source.content, tiers, tier_factory)
 
-def parse_textgrid_file(fpath, encoding=None):
+def read(stream, tiers = None, tier_factory = None):
     """
-    Parse a TextGrid file in long or short formats to a dict.
+    Read a TextGrid in short (or long) text format into a
+    :class:`mytextgrid.TextGrid`.
+
+    Parameters
+    ----------
+    stream : str or :class:`io.StringIO`
+        The content of a TextGrid.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
     """
-    if not is_textgrid_file(fpath, False):
-        return None
+    return build_textgrid(iter_events(stream), tiers, tier_factory)
 
-    if encoding is None:
-        encoding = detect_textgrid_encoding(fpath)
-
-    with open(fpath, 'r', encoding=encoding) as f:
-        raw_text = f.read()
-
-    label_list = []
-    # SOT: Start of Label
-    # CT: collect Label
-    # EOT: End of Label
-    # EON:
-    # '0000 0000' = ~CL, ~SOL, ~EOL
-    # '0000 0001' = ~CL, ~SOL, EOL
-    # '0000 0010' = ~CL, SOL, ~EOL
-    # '0000 0011' = ~CL, SOL, EOL
-    #'GLOBAL_XMIN' -> 'GLOBAL_XMAX'
-    #'GLOBAL_XMAX' -> 'GLOBAL_SIZE'
-    #'GLOBAL_SIZE' -> 'TIER_CLASS'
-    #'TIER_CLASS' -> 'TIER_NAME'
-    #'TIER_NAME'
-    #'ITEM_TEXT'
-    #'ITEM_XMAX'
-
-    state = 'GLOBAL_XMIN'
-    sub_state = 'start' # {'start', 'store', 'finish'}
-
-    _buffer = []
-    dictgrid = {}
-    skip_character = False
-    for ind, char in enumerate(raw_text):
-        if skip_character:
-            skip_character = False
-            continue
-
-        if state == 'GLOBAL_XMIN':
-
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
+def read_mmap(path, encoding = None, tiers = None, tier_factory = None):
+    """
+    Read a TextGrid file in short or long text format by memory-mapping it.
+
+    Values are located in the raw bytes of the file and only the strings are
+    decoded, so the text of the file is never held in memory as a whole.
+    UTF-8 and single-byte encodings (e.g. Windows-1252) are supported; other
+    encodings, such as UTF-16, are read in chunks of decoded text instead.
+
+    Parameters
+    ----------
+    path : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of the TextGrid file. If None, the function will figure out
+        the encoding.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+    tier_factory : callable or None, default None
+        The function that builds each tier. See
+        :class:`~mytextgrid.io.builder.TextGridBuilder`.
+
+    Returns
+    -------
+    :class:`mytextgrid.io.textgrid.TextGrid`
+        A TextGrid instance.
+    """
+    with open(path, 'rb') as file_object:
+        if encoding is None:
+            encoding = _detect_stream_encoding(file_object)
+
+        if '"<[]>.'.encode(encoding) != b'"<[]>.' or os.fstat(file_object.fileno()).st_size == 0:
+            with open(path, 'r', encoding = encoding) as text_object:
+                return read(text_object, tiers, tier_factory)
+
+        with mmap.mmap(file_object.fileno(), 0, access = mmap.ACCESS_READ) as buffer:
+            values = _iter_byte_values(buffer, encoding)
+            try:
+                return build_textgrid(_iter_events_from_values(values), tiers, tier_factory)
+            finally:
+                # Release the buffer before the map is closed.
+                values.close()
+
+def read_info(stream):
+    """
+    Read the header of a TextGrid in short (or long) text format and the
+    header of each tier.
+
+    The values of the items are scanned but not assembled.
+
+    Parameters
+    ----------
+    stream : str or :class:`io.StringIO`
+        The content of a TextGrid.
+
+    Returns
+    -------
+    tuple of (:class:`~mytextgrid.io.events.TextGridHeader`, list of :class:`~mytextgrid.io.events.TierHeader`)
+        The header of the TextGrid and of each tier.
+    """
+    if isinstance(stream, str):
+        stream = StringIO(stream)
+    chunks = iter(lambda: stream.read(_CHUNK_SIZE), '')
+
+    textgrid_header = None
+    tier_headers = []
+    for event, payload in _iter_events_from_values(_iter_values(chunks), items = False):
+        if event == 'textgrid':
+            if textgrid_header is not None:
+                break
+            textgrid_header = payload
+        elif event == 'tier_start':
+            tier_headers.append(payload)
+    if textgrid_header is None:
+        raise ValueError('The stream is empty.')
+    return textgrid_header, tier_headers
+
+class TextGridParser:
+    """
+    Parse a TextGrid in short or long text format from pieces pushed as
+    they arrive.
+
+    Use it when a TextGrid comes from a socket, a pipe or an HTTP response:
+    call :meth:`feed` with each piece and :meth:`close` at the end. Only the
+    text of a value that is not complete yet is kept between two pieces, and
+    each tier is added to :attr:`textgrid` as soon as its last item is parsed.
+
+    Parameters
+    ----------
+    encoding : str or None, default None
+        The encoding of the pieces given as bytes. If None, UTF-16 is
+        detected from the byte order mark, otherwise UTF-8 is used.
+    tiers : str, int, iterable of str or int, callable or None, default None
+        The tiers to build. See :func:`mytextgrid.read_textgrid`.
+    events : bool, default False
+        If True, keep the events of the TextGrid (see
+        :mod:`mytextgrid.io.events`) until they are taken with
+        :meth:`read_events`.
+
+    Examples
+    --------
+    >>> parser = mytextgrid.TextGridParser()
+    >>> with urllib.request.urlopen(url) as response:
+    ...     for chunk in iter(lambda: response.read(65536), b''):
+    ...         parser.feed(chunk)
+    ...         print(len(parser.textgrid or []), 'tiers read')
+    >>> textgrid = parser.close()
+    """
+    def __init__(self, encoding = None, tiers = None, events = False):
+        self._encoding = encoding
+        self._decoder = None
+        self._head = b'' # The bytes received before the byte order mark is known
+        self._carriage_return = False # The last piece ended with '\r'
+        self._tail = '' # The text of a value that may continue in the next piece
+        self._string = None # The pieces of a string that is not closed yet
+        self._after_quote = False # The string pieces end with a quotation mark
+        self._values = []
+        self._events = [] if events else None
+        self._closed = False
+
+        # The position in the structure of the TextGrid
+        self._state = 'textgrid'
+        self._tiers_size = 0
+        self._tier_index = 0
+        self._tier_header = None
+        self._items_left = 0
+
+        # The TextGrid built from the first TextGrid of the data
+        self._selected = _tier_filter(tiers)
+        self._textgrid = None
+        self._builder = None
+        self._skip = False
+        self._built = False
+
+    @property
+    def textgrid(self):
+        """
+        The TextGrid being parsed, with the tiers completed so far, or None if
+        its header has not been parsed yet.
+        """
+        return self._textgrid
+
+    def feed(self, data):
+        """
+        Parse the next piece of a TextGrid.
+
+        Parameters
+        ----------
+        data : str or bytes-like object
+            The next piece. It may end anywhere, even inside a value or a
+            character.
+
+        Raises
+        ------
+        ValueError
+            If the parser is closed or the data is not a valid TextGrid.
+        """
+        if self._closed:
+            raise ValueError('The parser is closed.')
+        self._parse(self._decode(data, False), False)
+
+    def close(self):
+        """
+        Parse the end of the data and return the TextGrid.
+
+        Returns
+        -------
+        :class:`mytextgrid.io.textgrid.TextGrid`
+            A TextGrid instance. If the data contains several TextGrids, the
+            first one.
+
+        Raises
+        ------
+        ValueError
+            If the data ends before the end of a TextGrid or if it is empty.
+        """
+        if not self._closed:
+            self._closed = True
+            self._parse(self._decode(b'', True), True)
+        if self._textgrid is None:
+            raise ValueError('The TextGrid header is missing.')
+        return self._textgrid
+
+    def read_events(self):
+        """
+        Return the events parsed since the last call.
+
+        Returns
+        -------
+        list of (event, payload), tuple of (str, tuple)
+            The event names and their payload. See :mod:`mytextgrid.io.events`.
+        """
+        if self._events is None:
+            raise ValueError('The parser does not keep events. Create it with events = True.')
+        events, self._events = self._events, []
+        return events
+
+    def _decode(self, data, final):
+        if isinstance(data, str):
+            text = data
+        else:
+            if self._decoder is None:
+                self._head += data
+                if len(self._head) < 2 and not final:
+                    return ''
+                encoding = self._encoding or _BOOM_MARK_DICT.get(self._head[:2], 'utf-8')
+                self._decoder = codecs.getincrementaldecoder(encoding)()
+                data, self._head = self._head, b''
+            text = self._decoder.decode(data, final)
+
+        # Normalize the line breaks of the strings. A '\r\n' may be split
+        # between two pieces.
+        if self._carriage_return:
+            text = '\r' + text
+            self._carriage_return = False
+        if '\r' in text:
+            if text.endswith('\r') and not final:
+                text = text[:-1]
+                self._carriage_return = True
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def _parse(self, text, final):
+        self._values.extend(self._scan(text))
+        if final:
+            if self._string is not None:
+                self._tail = ''.join(self._string)
+                self._string = None
+            self._values.extend(_scan_end(self._tail))
+            self._tail = ''
+
+        events = self._assemble(final)
+        if self._events is not None:
+            self._events.extend(events)
+        if not self._built:
+            self._build(events)
+
+    def _scan(self, text):
+        if self._string is not None:
+            # Look for the end of the string in the new text only, so that a
+            # long string split into many pieces is scanned once.
+            self._string.append(text)
+            end, self._after_quote = _find_string_end(text, self._after_quote)
+            if end is None:
+                return
+            text = ''.join(self._string)
+            self._string = None
+        else:
+            text = self._tail + text
+
+        self._tail = tail = yield from _scan_chunk(text)
+        if tail.startswith('"'):
+            end, self._after_quote = _find_string_end(tail[1:], False)
+            if end is None:
+                self._string = [tail]
+                self._tail = ''
+
+    def _assemble(self, final):
+        # Turn the complete headers and items of the scanned values into
+        # events. The values of an incomplete header wait for the next piece.
+        values = self._values
+        size = len(values)
+        position = 0
+        events = []
+        while True:
+            if self._state == 'textgrid':
+                # Wait for the number of tiers, which some writers also include
+                # after an absent tier list.
+                if position == size or (size - position < 6 and not final):
+                    break
+                kind, value = values[position]
+                if not (kind == 'string' and value == 'ooTextFile'):
+                    raise OSError('The stream is not a Praat object.')
+                object_class, xmin, xmax, flag = _take_values(values, position + 1, _HEADER_KINDS)
+                if not object_class == 'TextGrid':
+                    raise OSError('The stream is not a TextGrid.')
+                position += 1 + len(_HEADER_KINDS)
+                if flag == 'exists':
+                    tiers_size, = _take_values(values, position, ('number',))
+                    position += 1
                 else:
-                    sub_state = 'finish'
+                    tiers_size = '0'
+                    if position < size and values[position][0] == 'number':
+                        position += 1
+                events.append(('textgrid', TextGridHeader(xmin, xmax, tiers_size)))
+                self._tiers_size = int(tiers_size)
+                self._tier_index = 0
+                self._state = 'tier'
+            elif self._state == 'tier':
+                if self._tier_index == self._tiers_size:
+                    self._state = 'textgrid'
+                    continue
+                if size - position < len(_TIER_KINDS) and not final:
+                    break
+                tier_header = TierHeader(
+                    self._tier_index, *_take_values(values, position, _TIER_KINDS)
+                )
+                position += len(_TIER_KINDS)
+                events.append(('tier_start', tier_header))
+                if tier_header.tier_class not in _ITEM_KINDS:
+                    raise ValueError(f'Unknown tier class: {tier_header.tier_class}')
+                self._tier_header = tier_header
+                self._items_left = int(tier_header.size)
+                self._state = 'items'
+            else:
+                kinds = _ITEM_KINDS[self._tier_header.tier_class]
+                count = min(self._items_left, (size - position) // len(kinds))
+                if count:
+                    end = position + count * len(kinds)
+                    batch_kinds, batch_values = zip(*values[position:end])
+                    _check_kinds(batch_kinds, batch_values, kinds)
+                    batch = iter(batch_values)
+                    if kinds is _INTERVAL_KINDS:
+                        items = map(IntervalItem._make, zip(batch, batch, batch))
+                        events.extend(('interval', item) for item in items)
+                    else:
+                        items = map(PointItem._make, zip(batch, batch))
+                        events.extend(('point', item) for item in items)
+                    position = end
+                    self._items_left -= count
+                if self._items_left:
+                    if final:
+                        raise ValueError('Unexpected end of the TextGrid.')
+                    break
+                events.append(('tier_end', self._tier_header))
+                self._tier_index += 1
+                self._state = 'tier'
+
+        del values[:position]
+        return events
+
+    def _build(self, events):
+        builder = self._builder
+        for event, payload in events:
+            if event == 'interval':
+                if not self._skip:
+                    builder.add_interval(payload.xmin, payload.xmax, payload.text)
+            elif event == 'point':
+                if not self._skip:
+                    builder.add_point(payload.number, payload.mark)
+            elif event == 'tier_start':
+                self._skip = self._selected is not None and not self._selected(payload)
+                if not self._skip:
+                    builder.start_tier(payload.tier_class, payload.name, payload.xmin, payload.xmax)
+            elif event == 'tier_end':
+                if not self._skip:
+                    self._textgrid.tiers.append(builder.end_tier())
+            elif event == 'textgrid':
+                if self._textgrid is not None:
+                    # Only the first TextGrid is built.
+                    self._built = True
+                    break
+                self._textgrid = TextGrid(payload.xmin, payload.xmax)
+                self._builder = builder = TextGridBuilder(self._textgrid)
+
+def _iter_values(chunks):
+    """
+    Split the text of a TextGrid into values.
 
-            if sub_state == 'finish':
-                dictgrid['xmin'] = ''.join(_buffer)
-                state = 'GLOBAL_MAX'
-                sub_state = 'start'
+    A value may be split between two chunks, so the text that follows the
+    last complete value of a chunk is kept and scanned again with the next one.
 
-        elif state == 'GLOBAL_MAX':
+    Parameters
+    ----------
+    chunks : iterable of str
+        Consecutive pieces of the text of a TextGrid.
 
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
+    Yields
+    ------
+    (kind, value), tuple of (str, str)
+        `kind` is one of {'string', 'number', 'flag'}. Strings are unquoted
+        and unescaped.
+    """
+    tail = ''
+    for chunk in chunks:
+        tail = yield from _scan_chunk(tail + chunk)
+    yield from _scan_end(tail)
 
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
-                else:
-                    sub_state = 'finish'
+def _scan_chunk(text):
+    """
+    Yield the complete values of a piece of text and return the rest.
+
+    Parameters
+    ----------
+    text : str
+        The text that follows the last complete value, including the rest
+        returned for the previous piece.
+
+    Yields
+    ------
+    (kind, value), tuple of (str, str)
+        See :func:`_iter_values`.
+
+    Returns
+    -------
+    str
+        The text that may belong to a value continued in the next piece.
+    """
+    end = len(text)
+    match = None
+    position = 0
+    near_end = end - 2 # Where an incomplete exponent (e.g. `3e-`) may end
+    for match in _VALUE_PATTERN.finditer(text):
+        # The text skipped before the next value reaches the end of the
+        # chunk, so a match found after it may be a part of it.
+        if match.start() != position and _SKIPPED.fullmatch(text, position):
+            return text[position:]
+        # The value may continue in the next chunk
+        kind = match.lastgroup
+        position = match.end()
+        if kind == 'open' or (position >= near_end and (
+                position == end or _EXPONENT_START.fullmatch(text, position))):
+            return text[match.end('skip'):]
+        value = match.group(kind)
+        if kind == 'string' and '""' in value:
+            value = value.replace('""', '"')
+        yield kind, value
+    return text[match.end():] if match else text
+
+def _find_string_end(text, after_quote):
+    """
+    Find the closing quotation mark of a string that continues in a piece
+    of text.
+
+    Parameters
+    ----------
+    text : str
+        The piece of text, which starts inside the string.
+    after_quote : bool
+        True if the text before the piece ends with a quotation mark that
+        may close the string or be the first of an escaped quote ("").
+
+    Returns
+    -------
+    (int or None, bool)
+        The position that follows the string in `text`, or None if the
+        string may continue in the next piece, and whether `text` ends with
+        a quotation mark.
+    """
+    position = 0
+    if after_quote:
+        if not text:
+            return None, True
+        if text[0] != '"':
+            return 0, False
+        position = 1
+    position = _STRING_CHARS.match(text, position).end()
+    if position >= len(text) - 1:
+        return None, position == len(text) - 1
+    return position + 1, False
+
+def _scan_end(text):
+    """
+    Yield the values of the last piece of text, which must be complete.
+
+    Parameters
+    ----------
+    text : str
+        The rest returned by :func:`_scan_chunk` for the last piece.
+
+    Yields
+    ------
+    (kind, value), tuple of (str, str)
+        See :func:`_iter_values`.
+    """
+    position = 0
+    for match in _VALUE_PATTERN.finditer(text):
+        if match.start() != position and _SKIPPED.fullmatch(text, position):
+            break
+        position = match.end()
+        kind = match.lastgroup
+        if kind == 'open':
+            raise ValueError(f'Unterminated value: {text[match.start():][:20]!r}')
+        value = match.group(kind)
+        if kind == 'string' and '""' in value:
+            value = value.replace('""', '"')
+        yield kind, value
+
+def _iter_byte_values(buffer, encoding):
+    """
+    Split the raw bytes of a TextGrid into values.
+
+    Parameters
+    ----------
+    buffer : bytes-like object
+        The content of a TextGrid file, e.g. a :class:`mmap.mmap`.
+    encoding : str
+        The encoding of the strings. ASCII characters must be encoded as
+        single bytes that never occur inside other characters.
+
+    Yields
+    ------
+    (kind, value), tuple of (str, str)
+        See :func:`_iter_values`.
+    """
+    position = 0
+    for match in _BYTES_VALUE_PATTERN.finditer(buffer):
+        if match.start() != position and _BYTES_SKIPPED.fullmatch(buffer, position):
+            break
+        position = match.end()
+        kind = match.lastgroup
+        if kind == 'open':
+            raise ValueError(f'Unterminated value at byte {match.start()}.')
+        if kind == 'string':
+            value = match.group(kind).decode(encoding)
+            if '""' in value:
+                value = value.replace('""', '"')
+        else:
+            value = match.group(kind).decode('ascii')
+        yield kind, value
+
+def _iter_events_from_values(values, items = True):
+    """
+    Assemble the values of one or more TextGrids into events.
+
+    Parameters
+    ----------
+    values : iterable of (str, str)
+        The values yielded by :func:`_iter_values`.
+    items : bool, default True
+        If False, the values of the items are dropped without being assembled
+        and no 'interval' or 'point' event is yielded.
+
+    Yields
+    ------
+    (event, payload), tuple of (str, tuple)
+        The event name and its payload.
+    """
+    values = iter(values)
+
+    def next_value(expected_kind):
+        try:
+            kind, value = next(values)
+        except StopIteration:
+            raise ValueError('Unexpected end of the TextGrid.') from None
+        if kind != expected_kind:
+            raise ValueError(f'Expected a {expected_kind}, found {value!r}.')
+        return value
+
+    pending = None
+    while True:
+        if pending is None:
+            pending = next(values, None)
+            if pending is None:
+                return
+        kind, value = pending
+        pending = None
+
+        # Header
+        if not (kind == 'string' and value == 'ooTextFile'):
+            raise OSError('The stream is not a Praat object.')
+        if not next_value('string') == 'TextGrid':
+            raise OSError('The stream is not a TextGrid.')
+        xmin = next_value('number')
+        xmax = next_value('number')
+        if next_value('flag') == 'exists':
+            size = next_value('number')
+        else:
+            size = '0'
+            # Some writers include the size of an absent tier list.
+            pending = next(values, None)
+            if pending is not None and pending[0] == 'number':
+                pending = None
+        yield 'textgrid', TextGridHeader(xmin, xmax, size)
+
+        # Tiers
+        for tier_index in range(int(size)):
+            tier_header = TierHeader(
+                tier_index,
+                next_value('string'),
+                next_value('string'),
+                next_value('number'),
+                next_value('number'),
+                next_value('number')
+            )
+            yield 'tier_start', tier_header
+
+            if tier_header.tier_class not in _ITEM_KINDS:
+                raise ValueError(f'Unknown tier class: {tier_header.tier_class}')
+
+            if not items:
+                # Skip the values of the items, failing if they are missing.
+                n_values = len(_ITEM_KINDS[tier_header.tier_class]) * int(tier_header.size)
+                if n_values and next(islice(values, n_values - 1, None), None) is None:
+                    raise ValueError('Unexpected end of the TextGrid.')
+            elif tier_header.tier_class == 'IntervalTier':
+                for batch in _iter_item_values(values, _INTERVAL_KINDS, int(tier_header.size)):
+                    batch = iter(batch)
+                    for item in map(IntervalItem._make, zip(batch, batch, batch)):
+                        yield 'interval', item
+            else:
+                for batch in _iter_item_values(values, _POINT_KINDS, int(tier_header.size)):
+                    batch = iter(batch)
+                    for item in map(PointItem._make, zip(batch, batch)):
+                        yield 'point', item
+
+            yield 'tier_end', tier_header
+
+def _iter_item_values(values, kinds, size):
+    """
+    Take the values of `size` items in batches and check their kinds.
+
+    Parameters
+    ----------
+    values : iterator of (str, str)
+        The values yielded by :func:`_iter_values`.
+    kinds : tuple of str
+        The kinds of the values of one item.
+    size : int
+        The number of items.
+
+    Yields
+    ------
+    tuple of str
+        The values of up to :data:`_BATCH_SIZE` items.
+    """
+    remaining = len(kinds) * size
+    while remaining:
+        count = min(remaining, len(kinds) * _BATCH_SIZE)
+        batch = list(islice(values, count))
+        if len(batch) < count:
+            raise ValueError('Unexpected end of the TextGrid.')
+
+        batch_kinds, batch_values = zip(*batch)
+        _check_kinds(batch_kinds, batch_values, kinds)
+        yield batch_values
+        remaining -= count
+
+def _check_kinds(batch_kinds, batch_values, kinds):
+    """
+    Check the kinds of the values of consecutive items.
 
-            if sub_state == 'finish':
-                dictgrid['xmax'] = ''.join(_buffer)
-                state = 'GLOBAL_SIZE'
-                sub_state = 'start'
+    Raises
+    ------
+    ValueError
+        If a value is not of the kind expected at its position.
+    """
+    if batch_kinds != kinds * (len(batch_kinds) // len(kinds)):
+        for index, kind in enumerate(batch_kinds):
+            if kind != kinds[index % len(kinds)]:
+                raise ValueError(
+                    f'Expected a {kinds[index % len(kinds)]}, found {batch_values[index]!r}.'
+                )
+
+def _take_values(values, position, kinds):
+    """
+    Return the values found at `position` after checking their kinds.
 
-        elif state == 'GLOBAL_SIZE':
+    Raises
+    ------
+    ValueError
+        If there are not enough values or one of them is not of the
+        expected kind.
+    """
+    taken = values[position:position + len(kinds)]
+    if len(taken) < len(kinds):
+        raise ValueError('Unexpected end of the TextGrid.')
+    for (kind, value), expected_kind in zip(taken, kinds):
+        if kind != expected_kind:
+            raise ValueError(f'Expected a {expected_kind}, found {value!r}.')
+    return [value for _, value in taken]
 
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
+def parse_textgrid_file(fpath, encoding=None):
+    """
+    Parse a TextGrid file in long or short formats to a dict.
 
-            if sub_state == 'store':
-                if char.isdecimal():
-                    _buffer.append(char)
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                tier_index = 0
-                global_size = int(''.join(_buffer))
-                dictgrid['size'] = global_size
-                dictgrid['tiers'] = [None]*global_size
-
-                state = 'TIER_CLASS'
-                sub_state = 'start'
-
-        elif state == 'TIER_CLASS':
-            if tier_index >= global_size:
-                state = 'END'
-                sub_state = ''
-
-            if sub_state == 'start':
-                if char == '"':
-                    sub_state = 'store'
-                    _buffer = []
-                    continue # Do not include the starting quotation mark
-
-            if sub_state == 'store':
-                if char == '"':
-                    sub_state = 'finish'
-                else:
-                    _buffer.append(char)
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index] = {}
-                dictgrid['tiers'][tier_index]['tier_class'] = ''.join(_buffer)
-                state = 'TIER_NAME'
-                sub_state = 'start'
-
-        elif state == 'TIER_NAME':
-            if sub_state == 'start':
-                if char == '"':
-                    sub_state = 'store'
-                    _buffer = []
-                    continue # Do not include the starting quotation mark
-
-            if sub_state == 'store':
-                if char == '"':
-                    next_char = raw_text[ind + 1] if ind + 1 < len(raw_text) else ''
-                    if next_char == '"':
-                        _buffer.append(char)
-                        skip_character = True
-                    else:
-                        sub_state = 'finish'
-                else:
-                    _buffer.append(char)
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['tier_name'] = ''.join(_buffer)
-                state = 'TIER_XMIN'
-                sub_state = 'start'
-
-        elif state == 'TIER_XMIN':
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['tier_xmin'] = ''.join(_buffer)
-                state = 'TIER_XMAX'
-                sub_state = 'start'
-
-        elif state == 'TIER_XMAX':
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['tier_xmax'] = ''.join(_buffer)
-                state = 'TIER_SIZE'
-                sub_state = 'start'
-
-        elif state == 'TIER_SIZE':
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char.isdecimal():
-                    _buffer.append(char)
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                item_index = 0
-                tier_size = int(''.join(_buffer))
-                dictgrid['tiers'][tier_index]['tier_size'] = tier_size
-                dictgrid['tiers'][tier_index]['items'] = [None]*tier_size
-                if dictgrid['tiers'][tier_index]['tier_class'] == 'IntervalTier':
-                    state = 'ITEM_XMIN'
-                elif dictgrid['tiers'][tier_index]['tier_class'] == 'TextTier':
-                    state = 'ITEM_NUMBER'
-                else:
-                    state = ''
-                sub_state = 'start'
-
-        elif state == 'ITEM_NUMBER':
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
-                elif char == ']':
-                    sub_state = 'start'
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['items'][item_index] = {}
-                dictgrid['tiers'][tier_index]['items'][item_index]['item_point'] = ''.join(_buffer)
-                state = 'ITEM_TEXT'
-                sub_state = 'start'
-
-        elif state == 'ITEM_XMIN':
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
-                elif char == ']':
-                    sub_state = 'start'
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['items'][item_index] = {}
-                dictgrid['tiers'][tier_index]['items'][item_index]['item_xmin'] = ''.join(_buffer)
-                state = 'ITEM_XMAX'
-                sub_state = 'start'
-
-        elif state == 'ITEM_XMAX':
-
-            if sub_state == 'start':
-                if char.isdecimal():
-                    sub_state = 'store'
-                    _buffer = []
-
-            if sub_state == 'store':
-                if char in _DECIMAL_CHARS:
-                    _buffer.append(char)
-                elif char == ']':
-                    sub_state = 'start'
-                else:
-                    sub_state = 'finish'
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['items'][item_index]['item_xmax'] = ''.join(_buffer)
-                state = 'ITEM_TEXT'
-                sub_state = 'start'
-
-        elif state == 'ITEM_TEXT':
-            if item_index >= tier_size:
-                state = 'TIER_CLASS'
-                sub_state = 'start'
-                continue
-
-            if sub_state == 'start':
-                if char == '"':
-                    sub_state = 'store'
-                    _buffer = []
-                    continue # Do not include the starting quotation mark
-
-            if sub_state == 'store':
-                if char == '"':
-                    next_char = raw_text[ind + 1] if ind + 1 < len(raw_text) else ''
-                    if next_char == '"':
-                        _buffer.append(char)
-                        skip_character = True
-                    else:
-                        sub_state = 'finish'
-                else:
-                    _buffer.append(char)
-
-            if sub_state == 'finish':
-                dictgrid['tiers'][tier_index]['items'][item_index]['item_text'] = ''.join(_buffer)
-                item_index += 1
-                if item_index < tier_size:
-                    if dictgrid['tiers'][tier_index]['tier_class'] == 'IntervalTier':
-                        state = 'ITEM_XMIN'
-                    elif dictgrid['tiers'][tier_index]['tier_class'] == 'TextTier':
-                        state = 'ITEM_NUMBER'
-                    else:
-                        state = ''
-                else:
-                    item_index += 0
-                    tier_index += 1
-                    state = 'TIER_CLASS'
-                sub_state = 'start'
+    Parameters
+    ----------
+    fpath : str or :class:`pathlib.Path`
+        The path of the TextGrid file.
+    encoding : str or None, default None
+        The encoding of the TextGrid file. If None, the function will figure out
+        the encoding.
+
+    Returns
+    -------
+    dict or None
+        A `dict` representation of the TextGrid file, or None if the file
+        is not a TextGrid.
+    """
+    source = read_source(fpath, encoding)
+    if source.format not in ('long', 'short'):
+        return None
+    return parse(source.content)
 
+def parse(stream):
+    """
+    Parse a TextGrid in long or short formats to a dict.
+
+    {
+        'xmin': str,
+        'xmax': str,
+        'size': int,
+        'tiers': [
+            {
+                'tier_class': str,
+                'tier_name': str,
+                'tier_xmin': str,
+                'tier_xmax': str,
+                'tier_size': int,
+                'items': [
+                    {
+                        '{"item_xmin", "item_point"}': str,
+                        'item_xmax': str,
+                        'item_text': str
+                    },
+                    .
+                    .
+                    .
+                ]
+            },
+            .
+            .
+            .
+        ]
+    }
+
+    Parameters
+    ----------
+    stream : str or :class:`io.StringIO`
+        The content of a TextGrid.
+
+    Returns
+    -------
+    dict
+        A `dict` representation of the TextGrid. If the stream contains
+        several TextGrids, only the first one.
+    """
+    dictgrid = None
+    for event, payload in iter_events(stream):
+        if event == 'interval':
+            items.append(
+                {'item_xmin': payload.xmin, 'item_xmax': payload.xmax, 'item_text': payload.text}
+            )
+        elif event == 'point':
+            items.append({'item_point': payload.number, 'item_text': payload.mark})
+        elif event == 'tier_start':
+            items = []
+            dictgrid['tiers'].append({
+                'tier_class': payload.tier_class,
+                'tier_name': payload.name,
+                'tier_xmin': payload.xmin,
+                'tier_xmax': payload.xmax,
+                'tier_size': int(payload.size),
+                'items': items,
+            })
+        elif event == 'textgrid':
+            if dictgrid is not None:
+                break
+            dictgrid = {
+                'xmin': payload.xmin,
+                'xmax': payload.xmax,
+                'size': int(payload.size),
+                'tiers': [],
+            }
     return dictgrid
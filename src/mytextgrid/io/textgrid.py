@@ -28,19 +28,45 @@ class TextGrid(TextGridAbstract):
     """
     def write(self, path, format_ = 'long', encoding = 'utf-8'):
         """
-        Write a TextGrid object as a text file.
+        Write a TextGrid object as a TextGrid file.
 
         Parameters
         ----------
         path : str or :class:`pathlib.Path`
-            The path where the TextGrid file will be written.
-        short_format : bool, default False
-            ``True`` to output TextGrid file in long format. ``False`` for short format.
+            The path where the TextGrid file will be written. If it ends with
+            ``.gz``, ``.bz2``, ``.xz`` or ``.lzma``, the file is compressed.
+        format_ : {'long', 'short', 'binary'}, default 'long'
+            The format of the TextGrid file.
         encoding : str, default 'utf-8'
-            The encoding of the file.
+            The encoding of the file. Ignored for binary files.
         """
         write_textgrid(self, path, format_, encoding)
 
+    async def awrite(self, path, format_ = 'long', encoding = 'utf-8', executor = None):
+        """
+        Write a TextGrid object as a TextGrid file without blocking the event loop.
+
+        The file is written in `executor`, so the TextGrid must not be modified
+        until the coroutine returns.
+
+        Parameters
+        ----------
+        path : str or :class:`pathlib.Path`
+            The path where the TextGrid file will be written. If it ends with
+            ``.gz``, ``.bz2``, ``.xz`` or ``.lzma``, the file is compressed.
+        format_ : {'long', 'short', 'binary'}, default 'long'
+            The format of the TextGrid file.
+        encoding : str, default 'utf-8'
+            The encoding of the file. Ignored for binary files.
+        executor : :class:`concurrent.futures.Executor` or None, default None
+            The executor that writes the file. If None, the default executor
+            of the event loop.
+        """
+        # The aio module imports the readers, which import this module.
+        from mytextgrid.io.aio import awrite_textgrid
+
+        await awrite_textgrid(self, path, format_, encoding, executor)
+
     def write_as_json(self, *args, **kwds):
         """
         Write a TextGrid object as a JSON file.
@@ -1,3 +1,8 @@
+import re
+import codecs
+
+from mytextgrid.io.compression import open_file
+
 _BINARY_MARK = b'ooBinaryFile\x08TextGrid'
 
 _UTF8_LF_MARK = b'File type = "ooTextFile"\nObject class = "TextGrid"\n'
@@ -72,6 +77,15 @@ _TEXTGRID_ENCODINGS = [
     'iso-8859-1',
 ]
 
+_TEXTGRID_CODEC_NAMES = {codecs.lookup(encoding).name for encoding in _TEXTGRID_ENCODINGS}
+
+# The number of bytes read to recognize the header of a TextGrid.
+_SNIFF_SIZE = 4096
+
+# The number of bytes given to chardet, from the first non-ASCII byte.
+_CHARDET_SAMPLE_SIZE = 1 << 15
+_NON_ASCII = re.compile(b'[\x80-\xff]')
+
 
 def detect_textgrid_encoding(fpath):
     """
@@ -83,9 +97,13 @@ def detect_textgrid_encoding(fpath):
         - UTF-16 with BOM
         - UTF-8 without BOM
         - Windows-1252
+        - The encoding guessed by chardet from a sample of the file
         - Mac OS Roman
         - ISO 8859-1 (used as a final fallback)
 
+    Each attempt stops at the first byte that cannot be decoded. chardet is
+    only imported if the file is neither UTF-8 nor Windows-1252.
+
     Parameters
     ----------
     fpath : str
@@ -95,28 +113,162 @@ def detect_textgrid_encoding(fpath):
     -------
     str
         The detected encoding string: one of {'utf-16be', 'utf-16le',
-        'utf-8', 'windows-1252', 'mac_roman', 'iso-8859-1'}. Returns an
-         empty string ('') if a valid encoding cannot be detected.
+        'utf-8', 'windows-1252', 'mac_roman', 'iso-8859-1'} or the name of
+        the codec guessed by chardet. Returns an empty string ('') if a valid
+        encoding cannot be detected.
+    """
+    with open_file(fpath) as f:
+        if not _has_textgrid_header(f.read(_SNIFF_SIZE), _TEXTGRID_HEADERS):
+            return ''
+        return _detect_stream_encoding(f)
+
+
+def detect_textgrid_format(fpath):
+    """
+    Detects the format of a Praat TextGrid file.
+
+    Parameters
+    ----------
+    fpath : str
+        The file path to the TextGrid file to be evaluated.
+
+    Returns
+    -------
+    str
+        One of {'long', 'short', 'binary'}. Returns an empty string ('')
+        if the file is not a TextGrid.
     """
-    if not is_textgrid_file(fpath, include_binary=False):
+    with open_file(fpath) as f:
+        chunk = f.read(_SNIFF_SIZE)
+    return _sniff_format(chunk)
+
+
+def _sniff_format(chunk):
+    """
+    Return the TextGrid format of a file from its first bytes.
+
+    In the long format, the first line after the header is ``xmin = ...``.
+    In the short format, it is a number.
+    """
+    if chunk.startswith(_BINARY_MARK):
+        return 'binary'
+
+    for header in _TEXTGRID_HEADERS:
+        if chunk.startswith(header):
+            break
+    else:
         return ''
 
-    with open(fpath, 'rb') as f:
-        byte_stream = f.read()
+    # The header is ASCII, so any ASCII-compatible encoding works.
+    encoding = _BOOM_MARK_DICT.get(chunk[0:2], 'iso-8859-1')
+    text = chunk[len(header):].decode(encoding, errors='ignore')
+    if text.lstrip().startswith('xmin'):
+        return 'long'
+    return 'short'
+
+
+def _detect_stream_encoding(file_object, chunk_size=1 << 16):
+    """
+    Detects the encoding of an open TextGrid file in binary mode.
 
-    boom_mark = byte_stream[0:2]
+    The file is decoded in chunks in the order of
+    :func:`detect_textgrid_encoding` and each attempt stops at the first
+    invalid byte, so the file is never loaded into memory at once. The file
+    position is moved.
+
+    Parameters
+    ----------
+    file_object : file object
+        A TextGrid file opened in binary mode.
+    chunk_size : int
+        The number of bytes decoded at a time.
+
+    Returns
+    -------
+    str
+        The detected encoding (see :func:`detect_textgrid_encoding`) or an
+        empty string ('') if a valid encoding cannot be detected.
+    """
+    file_object.seek(0)
+    boom_mark = file_object.read(2)
     if boom_mark in _BOOM_MARK_DICT:
         return _BOOM_MARK_DICT[boom_mark]
 
-    for encoding in _TEXTGRID_ENCODINGS:
+    for encoding in _iter_encodings(lambda: _read_sample(file_object, chunk_size)):
+        file_object.seek(0)
+        decoder = codecs.getincrementaldecoder(encoding)()
         try:
-            byte_stream.decode(encoding)
+            for chunk in iter(lambda: file_object.read(chunk_size), b''):
+                decoder.decode(chunk)
+            decoder.decode(b'', final=True)
             return encoding
         except UnicodeDecodeError:
             continue
     return ''
 
 
+def _iter_encodings(read_sample):
+    """
+    Yield the encodings to try on a file without byte order mark, in the
+    order of :func:`detect_textgrid_encoding`.
+
+    Parameters
+    ----------
+    read_sample : callable
+        A function that returns the bytes given to chardet. It is only
+        called if the encodings before chardet's guess are rejected.
+    """
+    for encoding in _TEXTGRID_ENCODINGS:
+        yield encoding
+        if encoding == 'windows-1252':
+            guess = _guess_encoding(read_sample())
+            if guess is not None and guess not in _TEXTGRID_CODEC_NAMES:
+                yield guess
+
+
+def _guess_encoding(sample):
+    """
+    Return the name of the codec guessed by chardet for `sample`, or None.
+    """
+    if not sample:
+        return None
+
+    # chardet is slow to import and only needed for unusual files.
+    import chardet
+
+    guess = chardet.detect(sample).get('encoding')
+    try:
+        return codecs.lookup(guess).name if guess else None
+    except LookupError:
+        return None
+
+
+def _sample(data):
+    """
+    Return the bytes of `data` from its first non-ASCII byte, up to
+    `_CHARDET_SAMPLE_SIZE` bytes.
+    """
+    match = _NON_ASCII.search(data)
+    if match is None:
+        return b''
+    return data[match.start():match.start() + _CHARDET_SAMPLE_SIZE]
+
+
+def _read_sample(file_object, chunk_size):
+    """
+    Like :func:`_sample`, but read from a file opened in binary mode.
+    """
+    file_object.seek(0)
+    position = 0
+    for chunk in iter(lambda: file_object.read(chunk_size), b''):
+        match = _NON_ASCII.search(chunk)
+        if match is not None:
+            file_object.seek(position + match.start())
+            return file_object.read(_CHARDET_SAMPLE_SIZE)
+        position += len(chunk)
+    return b''
+
+
 def is_textgrid_file(filepath, include_binary=True):
     """
     Validates if a file is a recognized Praat TextGrid file format.
@@ -152,10 +304,120 @@ def is_textgrid_file(filepath, include_binary=True):
     else:
         headers_to_check = _TEXTGRID_HEADERS
 
-    with open(filepath, 'rb') as f:
-        chunk = f.read(4096)
+    with open_file(filepath) as f:
+        chunk = f.read(_SNIFF_SIZE)
+    return _has_textgrid_header(chunk, headers_to_check)
 
-    for header in headers_to_check:
-        if chunk.startswith(header):
-            return True
-    return False
+
+def _has_textgrid_header(chunk, headers):
+    """
+    Return True if `chunk` starts with one of `headers`.
+    """
+    return any(chunk.startswith(header) for header in headers)
+
+
+def _decode_textgrid(data, encoding=None):
+    """
+    Decode the bytes of a TextGrid file, detecting the encoding if needed.
+
+    The encodings are tried in the order of :func:`detect_textgrid_encoding`
+    on the whole buffer. A failed attempt stops at the first invalid byte
+    and the text of the successful attempt is returned, so a UTF-8 file is
+    decoded only once.
+
+    Parameters
+    ----------
+    data : bytes
+        The content of the file.
+    encoding : str or None, default None
+        The encoding of the file. If None, it is detected.
+
+    Returns
+    -------
+    tuple of (str, str)
+        The encoding and the decoded text, without byte order mark.
+    """
+    if encoding is None:
+        encoding = _BOOM_MARK_DICT.get(data[0:2])
+
+    if encoding is not None:
+        text = data.decode(encoding)
+    else:
+        for encoding in _iter_encodings(lambda: _sample(data)):
+            try:
+                text = data.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    return encoding, text
+
+
+def _freeze_tiers(tiers):
+    """
+    Turn an iterable of tier names or positions into a tuple.
+
+    The tiers given to the readers may be a generator, which can be iterated
+    only once and cannot be sent to other processes. Readers that use the
+    tiers more than once (for several files, or for a cache key and the
+    reading) take them with this function first.
+
+    Parameters
+    ----------
+    tiers : str, int, iterable of str or int, callable or None
+        The tiers to read. See :func:`mytextgrid.read_textgrid`.
+
+    Returns
+    -------
+    str, int, tuple, callable or None
+        `tiers`, with an iterable turned into a tuple.
+    """
+    if tiers is None or isinstance(tiers, (str, int)) or callable(tiers):
+        return tiers
+    return tuple(tiers)
+
+def _tier_filter(tiers):
+    """
+    Return a function that tells whether a tier must be read.
+
+    Parameters
+    ----------
+    tiers : str, int, iterable of str or int, callable or None
+        The names or positions (starting at 0) of the tiers to read, or a
+        function that takes a :class:`~mytextgrid.io.events.TierHeader` and
+        returns True for the tiers to read. If None, all tiers are read.
+
+    Returns
+    -------
+    callable or None
+        A function that takes a :class:`~mytextgrid.io.events.TierHeader`
+        and returns a bool, or None if all tiers are read.
+
+    Raises
+    ------
+    TypeError
+        If a tier is neither a name nor a position (bool is not a position).
+    ValueError
+        If a position is negative: the number of tiers is not known before
+        they are read.
+    """
+    if tiers is None or callable(tiers):
+        return tiers
+
+    if isinstance(tiers, (str, int)):
+        tiers = [tiers]
+
+    names = set()
+    indices = set()
+    for tier in tiers:
+        if isinstance(tier, str):
+            names.add(tier)
+        elif isinstance(tier, int) and not isinstance(tier, bool):
+            if tier < 0:
+                raise ValueError(f'Tier positions MUST NOT BE negative, not {tier}')
+            indices.add(tier)
+        else:
+            raise TypeError(f'tiers MUST BE tier names, positions or a function, not {tier!r}')
+    return lambda header: header.name in names or header.index in indices
@@ -3,40 +3,62 @@ Export TextGrid files to other formats
 """
 import csv
 import json
+from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
 from decimal import Decimal
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from mytextgrid.io.compression import open_file
 
 
-env = Environment(
-    loader=PackageLoader('mytextgrid.io'),
-    autoescape=select_autoescape()
-)
-env.trim_blocks = True
-env.lstrip_blocks  = True
+@lru_cache(maxsize=None)
+def _get_environment():
+    """
+    Return the Jinja environment of the TextGrid templates.
+
+    jinja2 is slow to import, so it is imported and the environment is built
+    the first time a text TextGrid is written.
+    """
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    env = Environment(
+        loader=PackageLoader('mytextgrid.io'),
+        autoescape=select_autoescape()
+    )
+    env.trim_blocks = True
+    env.lstrip_blocks  = True
+    return env
+
+def __getattr__(name):
+    # Keep `writer.env` available without building it at import time.
+    if name == 'env':
+        return _get_environment()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 def write_textgrid(textgrid_obj, filepath, format_ = 'long', encoding = 'utf-8'):
     """
-    Write a TextGrid object to a text file.
+    Write a TextGrid object to a TextGrid file.
 
     Parameters
     ----------
     textgrid_obj :
         A TextGrid object.
     filepath : str or :class:`pathlib.Path`
-        The path where the text file will be stored.
+        The path where the text file will be stored. If it ends with ``.gz``,
+        ``.bz2``, ``.xz`` or ``.lzma``, the file is compressed as it is written.
     format_ : {'long', 'short', 'binary'}
         The output format of the file.
     encoding: str, default 'utf-8'
-        The encoding of the text file.
+        The encoding of the text file. Ignored for binary files.
     """
     if format_ == 'long':
         write_long(textgrid_obj, filepath, encoding)
     elif format_ == 'short':
         write_short(textgrid_obj, filepath, encoding)
-    elif format == 'binary':
+    elif format_ == 'binary':
         write_binary(textgrid_obj, filepath)
+    else:
+        raise ValueError(f'Unsupported TextGrid format: {format_!r}.')
 
 def write_long(textgrid_obj, dst_path, encoding = 'utf-8'):
     """
@@ -51,13 +73,8 @@ def write_long(textgrid_obj, dst_path, encoding = 'utf-8'):
     encoding: str, default 'utf-8'
         The encoding of the text file.
     """
-    dict_ = textgrid_obj.to_dict()
-
-    template_name = 'long_format.TextGrid.jinja'
-    template = env.get_template(template_name)
-    textgrid_str = template.render(textgrid = dict_)
-
-    with open(dst_path, 'w', encoding = encoding) as textfile:
+    textgrid_str = _render(textgrid_obj, 'long_format.TextGrid.jinja')
+    with open_file(dst_path, 'w', encoding = encoding) as textfile:
         textfile.write(textgrid_str)
 
 def write_short(textgrid_obj, dst_path, encoding = 'utf-8'):
@@ -73,17 +90,53 @@ def write_short(textgrid_obj, dst_path, encoding = 'utf-8'):
     encoding: str, default 'utf-8'
         The encoding of the text file.
     """
-    dict_ = textgrid_obj.to_dict()
+    textgrid_str = _render(textgrid_obj, 'short_format.TextGrid.jinja')
+    with open_file(dst_path, 'w', encoding = encoding) as textfile:
+        textfile.write(textgrid_str)
 
-    template_name = 'short_format.TextGrid.jinja'
-    template = env.get_template(template_name)
-    textgrid_str = template.render(textgrid = dict_)
+def write_binary(textgrid_obj, dst_path):
+    """
+    Write a TextGrid object to a file in Praat binary format.
 
-    with open(dst_path, 'w', encoding = encoding) as textfile:
-        textfile.write(textgrid_str)
+    Texts made of ASCII characters are stored in 8 bits and the others in
+    UTF-16, as Praat does.
+
+    Parameters
+    ----------
+    textgrid_obj :
+        A TextGrid object.
+    dst_path : str or :class:`pathlib.Path`
+        The path where the binary file will be stored.
+    """
+    # The binary module imports the TextGrid class, which imports this module.
+    from mytextgrid.io import binary
+
+    with open_file(dst_path, 'wb') as binary_file:
+        binary.write(textgrid_obj, binary_file)
+
+def _render(textgrid_obj, template_name):
+    """
+    Return the text of a TextGrid in the format of a template.
+    """
+    template = _get_environment().get_template(template_name)
+    return template.render(textgrid = textgrid_obj.to_dict())
+
+def _to_bytes(textgrid_obj, format_ = 'long', encoding = 'utf-8'):
+    """
+    Return the content of the file written by :func:`write_textgrid`, with
+    LF line endings.
+    """
+    if format_ == 'long':
+        return _render(textgrid_obj, 'long_format.TextGrid.jinja').encode(encoding)
+    if format_ == 'short':
+        return _render(textgrid_obj, 'short_format.TextGrid.jinja').encode(encoding)
+    if format_ == 'binary':
+        from mytextgrid.io import binary
 
-def write_binary(textgrid_obj):
-    pass
+        buffer = BytesIO()
+        binary.write(textgrid_obj, buffer)
+        return buffer.getvalue()
+    raise ValueError(f'Unsupported TextGrid format: {format_!r}.')
 
 def write_csv(textgrid_obj, path, encoding = 'utf-8'):
     """
@@ -118,7 +171,7 @@ def write_csv(textgrid_obj, path, encoding = 'utf-8'):
                 table.append([item.time, tier.name, item.text, item.time])
     table.sort(key=lambda x:x[0])
 
-    with open(path, 'w', encoding = encoding, newline = '') as file_object:
+    with open_file(path, 'w', encoding = encoding, newline = '') as file_object:
         spamwriter = csv.writer(file_object)
         spamwriter.writerow(['tmin', 'tier_name', 'text', 'tmax'])
         for row in table:
@@ -138,7 +191,7 @@ def write_json(textgrid_obj, filepath, encoding = 'utf-8'):
         The encoding of the resulting file.
     """
     dict_ = textgrid_obj.to_dict()
-    with open(filepath, 'w', encoding = encoding) as file_object:
+    with open_file(filepath, 'w', encoding = encoding) as file_object:
         json.dump(dict_, file_object, cls = _DecimalEncoder, ensure_ascii = False, indent = 4)
 
 class _DecimalEncoder(json.JSONEncoder):
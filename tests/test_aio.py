@@ -0,0 +1,73 @@
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+
+class TestAsyncio(unittest.TestCase):
+    """
+    Test reading and writing TextGrid files from asyncio code.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.paths = sorted(self.src_dir.glob('*.TextGrid')) + [self.src_dir / 'missing.TextGrid']
+        self.expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+
+    def test_aread_textgrid(self):
+        textgrid = asyncio.run(
+            mytextgrid.aread_textgrid(self.src_dir / 'text-UTF16-BIN.TextGrid', format_ = 'auto')
+        )
+        self.assertEqual(textgrid.to_dict(), self.expected.to_dict())
+
+    def test_aread_textgrids(self):
+        async def read_all(**kwds):
+            return [result async for result in mytextgrid.aread_textgrids(
+                (path for path in self.paths), format_ = 'auto', **kwds
+            )]
+
+        for ordered in (True, False):
+            results = asyncio.run(read_all(concurrency = 3, ordered = ordered))
+            paths = [result.path for result in results]
+            if not ordered:
+                paths.sort()
+            self.assertEqual(paths, sorted(self.paths) if not ordered else self.paths)
+            for path, textgrid, error in results:
+                if path.name == 'missing.TextGrid':
+                    self.assertIsInstance(error, FileNotFoundError)
+                else:
+                    self.assertIsNone(error)
+                    self.assertEqual(textgrid.to_dict(), self.expected.to_dict())
+
+        with self.assertRaises(ValueError):
+            mytextgrid.aread_textgrids(self.paths, concurrency = 0)
+
+    def test_tiers_iterator(self):
+        async def read_all():
+            return [result async for result in mytextgrid.aread_textgrids(
+                self.paths[:3], format_ = 'auto', tiers = (name for name in ['John'])
+            )]
+
+        for _, textgrid, error in asyncio.run(read_all()):
+            self.assertIsNone(error)
+            self.assertEqual([tier.name for tier in textgrid], ['John'])
+
+    def test_awrite(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            async def write_all():
+                await asyncio.gather(*[
+                    self.expected.awrite(Path(tmp_dir) / f'{format_}.TextGrid', format_)
+                    for format_ in ('long', 'short', 'binary')
+                ])
+            asyncio.run(write_all())
+
+            for format_ in ('long', 'short', 'binary'):
+                textgrid = mytextgrid.read_textgrid(Path(tmp_dir) / f'{format_}.TextGrid', format_)
+                self.assertEqual(textgrid.to_dict(), self.expected.to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
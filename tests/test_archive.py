@@ -0,0 +1,130 @@
+import shutil
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+
+class TestArchive(unittest.TestCase):
+    """
+    Test reading and writing TextGrids inside zip and tar archives.
+    """
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid').to_dict()
+        self.fnames = sorted(
+            path.name for path in self.src_dir.glob('text-*.TextGrid')
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_read_archives(self):
+        zip_path = self.tmp_dir / 'corpus.zip'
+        with zipfile.ZipFile(zip_path, 'w') as archive:
+            archive.write(self.src_dir / 'empty_file', 'corpus/empty_file')
+            for fname in self.fnames:
+                archive.write(self.src_dir / fname, f'corpus/{fname}')
+
+        tar_path = self.tmp_dir / 'corpus.tar.gz'
+        with tarfile.open(tar_path, 'w:gz') as archive:
+            archive.add(self.src_dir / 'empty_file', 'corpus/empty_file')
+            for fname in self.fnames:
+                archive.add(self.src_dir / fname, f'corpus/{fname}')
+
+        for path in [zip_path, tar_path]:
+            results = list(mytextgrid.iter_textgrids_from_archive(path))
+            self.assertEqual([name for name, _, _ in results], [f'corpus/{fname}' for fname in self.fnames])
+            for name, textgrid, error in results:
+                self.assertIsNone(error, msg = name)
+                self.assertEqual(textgrid.to_dict(), self.expected, msg = name)
+
+            # Errors are returned for each member
+            results = list(mytextgrid.iter_textgrids_from_archive(path, pattern = None, format_ = 'short'))
+            self.assertEqual(len(results), len(self.fnames) + 1)
+            for name, textgrid, error in results:
+                if 'SHORT' in name:
+                    self.assertIsNone(error)
+                else:
+                    self.assertIsNone(textgrid)
+                    self.assertIsInstance(error, OSError)
+
+        results = mytextgrid.iter_textgrids_from_archive(zip_path, '*/*-UTF16-BIN.TextGrid', tiers = ['John'])
+        self.assertEqual([[tier.name for tier in textgrid] for _, textgrid, _ in results], [['John']])
+
+        with self.assertRaises(ValueError):
+            list(mytextgrid.iter_textgrids_from_archive(self.src_dir / self.fnames[0]))
+
+    def test_tiers_iterator(self):
+        zip_path = self.tmp_dir / 'corpus.zip'
+        with zipfile.ZipFile(zip_path, 'w') as archive:
+            for fname in self.fnames[:3]:
+                archive.write(self.src_dir / fname, fname)
+
+        results = list(mytextgrid.iter_textgrids_from_archive(
+            zip_path, tiers = (name for name in ['John'])
+        ))
+        self.assertEqual(len(results), 3)
+        for _, textgrid, error in results:
+            self.assertIsNone(error)
+            self.assertEqual([tier.name for tier in textgrid], ['John'])
+
+    def test_read_damaged_member(self):
+        zip_path = self.tmp_dir / 'corpus.zip'
+        with zipfile.ZipFile(zip_path, 'w') as archive:
+            for fname in self.fnames[:2]:
+                archive.write(self.src_dir / fname, fname)
+            archive.writestr('encrypted.TextGrid', b'')
+
+        # A byte of the first member is changed and the last member is
+        # flagged as encrypted.
+        data = bytearray(zip_path.read_bytes())
+        with zipfile.ZipFile(zip_path) as archive:
+            first, _, last = archive.infolist()
+        data[first.header_offset + 30 + len(first.filename) + 100] ^= 0xff
+        for offset in [last.header_offset + 6, data.rindex(b'PK\x01\x02') + 8]:
+            data[offset] |= 0x1
+        zip_path.write_bytes(bytes(data))
+
+        results = list(mytextgrid.iter_textgrids_from_archive(zip_path))
+        self.assertEqual([name for name, _, _ in results], self.fnames[:2] + ['encrypted.TextGrid'])
+        self.assertIsInstance(results[0].error, zipfile.BadZipFile)
+        self.assertEqual(results[1].textgrid.to_dict(), self.expected)
+        self.assertIsInstance(results[2].error, RuntimeError)
+
+    def test_write_archives(self):
+        textgrid = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+        for extension in ['zip', 'tar', 'tar.gz', 'tar.bz2', 'tar.xz']:
+            path = self.tmp_dir / f'corpus.{extension}'
+            with mytextgrid.ArchiveWriter(path) as archive:
+                archive.add(textgrid, 'a/long.TextGrid')
+            if extension in ('zip', 'tar'):
+                with mytextgrid.ArchiveWriter(path, 'a', 'binary') as archive:
+                    archive.add(textgrid, 'a/binary.TextGrid')
+                with mytextgrid.ArchiveWriter(path, 'a', 'short', 'utf-16') as archive:
+                    archive.add(textgrid, 'b/short.TextGrid')
+            else:
+                with self.assertRaises(ValueError):
+                    mytextgrid.ArchiveWriter(path, 'a')
+
+            results = list(mytextgrid.iter_textgrids_from_archive(path))
+            for name, textgrid_read, error in results:
+                self.assertIsNone(error)
+                self.assertEqual(textgrid_read.to_dict(), self.expected)
+            expected_names = ['a/long.TextGrid']
+            if extension in ('zip', 'tar'):
+                expected_names += ['a/binary.TextGrid', 'b/short.TextGrid']
+            self.assertEqual([name for name, _, _ in results], expected_names)
+
+        with self.assertRaises(ValueError):
+            mytextgrid.ArchiveWriter(self.tmp_dir / 'corpus.rar')
+
+if __name__ == '__main__':
+    unittest.main()
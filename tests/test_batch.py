@@ -0,0 +1,96 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io import batch
+
+class TestReadTextGrids(unittest.TestCase):
+    """
+    Test reading many TextGrid files in parallel.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.paths = sorted(self.src_dir.glob('*.TextGrid')) + [self.src_dir / 'empty_file']
+        self.expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+
+    def check_results(self, results):
+        self.assertEqual(sorted(result.path for result in results), sorted(self.paths))
+        for path, textgrid, error in results:
+            if path.name == 'empty_file':
+                self.assertIsNone(textgrid)
+                self.assertIsInstance(error, OSError)
+            else:
+                self.assertIsNone(error)
+                self.assertEqual(textgrid.to_dict(), self.expected.to_dict())
+
+    def test_read_ordered(self):
+        for workers, chunksize in [(1, None), (2, None), (3, 4)]:
+            results = list(mytextgrid.read_textgrids(
+                self.paths, format_ = 'auto', workers = workers, chunksize = chunksize
+            ))
+            self.assertEqual([result.path for result in results], self.paths)
+            self.check_results(results)
+
+    def test_read_unordered(self):
+        results = list(mytextgrid.read_textgrids(
+            self.paths, format_ = 'auto', workers = 2, ordered = False, chunksize = 2
+        ))
+        self.check_results(results)
+
+    def test_chunks_in_flight(self):
+        submitted = []
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, *args, **kwds):
+                submitted.append(args[1])
+                return super().submit(*args, **kwds)
+
+        paths = self.paths * 10
+        with mock.patch.object(batch, 'ProcessPoolExecutor', Executor):
+            for ordered in [True, False]:
+                submitted.clear()
+                results = mytextgrid.read_textgrids(
+                    paths, format_ = 'auto', workers = 2, ordered = ordered, chunksize = 1
+                )
+                # A new chunk is sent when the results of a chunk are taken.
+                next(results)
+                self.assertEqual(len(submitted), 2 * batch._CHUNKS_IN_FLIGHT + 1)
+                for _ in range(9):
+                    next(results)
+                self.assertEqual(len(submitted), 2 * batch._CHUNKS_IN_FLIGHT + 10)
+                results.close()
+
+                results = list(mytextgrid.read_textgrids(
+                    paths, format_ = 'auto', workers = 2, ordered = ordered, chunksize = 3
+                ))
+                self.assertEqual(len(results), len(paths))
+                if ordered:
+                    self.assertEqual([result.path for result in results], paths)
+
+    def test_tiers_iterator(self):
+        paths = [self.src_dir / 'text-UTF8-LONG-LF.TextGrid'] * 3
+        for workers in [1, 2]:
+            results = list(mytextgrid.read_textgrids(
+                paths, workers = workers, tiers = (name for name in ['John'])
+            ))
+            for _, textgrid, error in results:
+                self.assertIsNone(error)
+                self.assertEqual([tier.name for tier in textgrid], ['John'])
+
+    def test_read_errors(self):
+        with self.assertRaises(ValueError):
+            mytextgrid.read_textgrids(self.paths, workers = 0)
+
+        paths = [self.src_dir / 'text-UTF8-LONG-LF.TextGrid', self.src_dir / 'missing.TextGrid']
+        results = list(mytextgrid.read_textgrids(paths, workers = 2, tiers = 'bell'))
+        self.assertEqual([tier.name for tier in results[0].textgrid], ['bell'])
+        self.assertIsInstance(results[1].error, FileNotFoundError)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+benchmarks_dir = Path(__file__).parent.parent.joinpath('benchmarks')
+sys.path.insert(0, str(package_dir))
+sys.path.insert(0, str(benchmarks_dir))
+
+import mytextgrid
+import corpus
+import run
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Test the synthetic corpus and the benchmark runner on small TextGrids.
+    """
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_generate_textgrid(self):
+        textgrid = corpus.generate_textgrid(tiers = 2, intervals = 50, point_tiers = 1,
+                                            multiline = 0.5, seed = 1)
+        self.assertEqual([tier.name for tier in textgrid], ['tier1', 'tier2', 'points1'])
+        self.assertEqual([len(tier) for tier in textgrid], [50, 50, 50])
+        self.assertTrue(any('\n' in item.text for item in textgrid[0]))
+
+        other = corpus.generate_textgrid(tiers = 2, intervals = 50, point_tiers = 1,
+                                         multiline = 0.5, seed = 1)
+        self.assertEqual(other.to_dict(), textgrid.to_dict())
+
+        textgrid = corpus.generate_textgrid(tiers = 1, intervals = 200, vocabulary = 3)
+        self.assertLessEqual(len({item.text for item in textgrid[0]}), 4)
+
+    def test_older_releases(self):
+        # Releases without TextGridBuilder or columnar tiers.
+        options = {'tiers': 2, 'intervals': 50, 'point_tiers': 1, 'multiline': 0.5}
+        expected = corpus.generate_textgrid(**options).to_dict()
+        with mock.patch.object(corpus, 'TextGridBuilder', None):
+            self.assertEqual(corpus.generate_textgrid(**options).to_dict(), expected)
+
+        argv = ['--tiers', '1', '--intervals', '20', '--ops', '20', '--repeat', '1',
+                '--groups', 'ops', 'memory']
+        with mock.patch.object(run, 'ColumnarIntervalTier', None):
+            with redirect_stdout(io.StringIO()) as stdout:
+                run.main(argv)
+        self.assertNotIn('columnar', stdout.getvalue())
+
+    def test_write_corpus(self):
+        options = {'tiers': 2, 'intervals': 50, 'point_tiers': 1, 'multiline': 0.2}
+        expected = corpus.generate_textgrid(**options).to_dict()
+        paths = corpus.write_corpus(self.tmp_dir, **options)
+        self.assertEqual(len(paths), 7)
+        for path, format_, encoding in paths:
+            textgrid = mytextgrid.read_textgrid(path, format_ = 'auto')
+            self.assertEqual(textgrid.to_dict(), expected, msg = f'{format_} {encoding}')
+
+    def test_run(self):
+        output = self.tmp_dir / 'results.json'
+        argv = ['--tiers', '1', '--intervals', '20', '--ops', '20', '--repeat', '1',
+                '--formats', 'short', 'binary', '--encodings', 'utf-16',
+                '--groups', 'read', 'write', 'ops', 'memory', '--output', str(output)]
+        with redirect_stdout(io.StringIO()):
+            run.main(argv)
+        with redirect_stdout(io.StringIO()) as stdout:
+            run.main(argv[:-2] + ['--compare', str(output)])
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 12)
+        self.assertTrue(lines[0].startswith('read short utf-16'))
+        self.assertIn('B/item', lines[-1])
+        self.assertTrue(all(line.rstrip().endswith('%') for line in lines))
+
+if __name__ == '__main__':
+    unittest.main()
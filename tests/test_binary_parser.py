@@ -0,0 +1,72 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io import binary
+
+class TestBinaryParser(unittest.TestCase):
+    """
+    Test the reader of Praat binary TextGrid files.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.fnames = [
+            'text-ISO_Latin_1-BIN.TextGrid',
+            'text-UTF16-BIN.TextGrid',
+            'text-UTF8-BIN.TextGrid',
+        ]
+
+    def test_read_binary(self):
+        expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+        for fname in self.fnames:
+            for format_ in ('binary', 'auto'):
+                textgrid = mytextgrid.read_textgrid(self.src_dir / fname, format_ = format_)
+                self.assertEqual(textgrid.to_dict(), expected.to_dict())
+                self.assertEqual(textgrid[0][4].text, 'ñoz')
+                self.assertEqual(str(textgrid.xmax), '1')
+
+        path = Path(__file__).parent / 'files'
+        textgrid = mytextgrid.read_textgrid(path / 'Mary_John_bell-1-bin.TextGrid', format_ = 'binary')
+        expected = mytextgrid.read_textgrid(path / 'Mary_John_bell-1.TextGrid')
+        self.assertEqual(textgrid.to_dict(), expected.to_dict())
+
+    def test_read_selected_tiers(self):
+        path = self.src_dir / 'text-UTF16-BIN.TextGrid'
+        expected = binary.read_textgrid_file(path)
+        textgrid = binary.read_textgrid_file(path, tiers = ['bell', 0])
+        self.assertEqual([tier.name for tier in textgrid], [expected[0].name, 'bell'])
+        self.assertEqual(
+            textgrid.to_dict()['tiers'],
+            [expected.to_dict()['tiers'][0], expected.to_dict()['tiers'][2]]
+        )
+
+    def test_read_truncated(self):
+        data = (self.src_dir / 'text-UTF8-BIN.TextGrid').read_bytes()
+        for size in (30, 100, len(data) - 3):
+            with self.assertRaises(ValueError):
+                binary.read(data[:size])
+
+        with self.assertRaises(OSError):
+            binary.read(b'File type = "ooTextFile"\n')
+
+    def test_write_binary(self):
+        textgrid = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'binary.TextGrid'
+            textgrid.write(path, format_ = 'binary')
+            # Same bytes as the file saved by Praat
+            self.assertEqual(path.read_bytes(), (self.src_dir / 'text-UTF16-BIN.TextGrid').read_bytes())
+
+            textgrid[0][0].text = 'x' * 70000
+            with self.assertRaises(ValueError):
+                textgrid.write(path, format_ = 'binary')
+            with self.assertRaises(ValueError):
+                textgrid.write(path, format_ = 'xml')
+
+if __name__ == '__main__':
+    unittest.main()
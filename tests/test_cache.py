@@ -0,0 +1,219 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io import reader
+from mytextgrid.io import cache as cache_module
+from mytextgrid.io.cache import DiskCache, MemoryCache
+
+class TestDiskCache(unittest.TestCase):
+    """
+    Test the on-disk cache of parsed TextGrids.
+    """
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.src_dir = Path(__file__).parent / 'files'
+        self.path = self.tmp_dir / 'Mary_John_bell.TextGrid'
+        shutil.copy(self.src_dir / 'encodings/text-UTF8-LONG-LF.TextGrid', self.path)
+        self.cache = DiskCache(self.tmp_dir / 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def read(self, path = None, cache = None, **kwds):
+        with mock.patch.object(reader, 'read_long', wraps = reader.read_long) as read_long:
+            textgrid = mytextgrid.read_textgrid(
+                path or self.path, cache = cache or self.cache, **kwds
+            )
+        return textgrid, read_long.called
+
+    def test_hit(self):
+        expected = mytextgrid.read_textgrid(self.path)
+        textgrid, parsed = self.read()
+        self.assertTrue(parsed)
+        for _ in range(2):
+            textgrid, parsed = self.read()
+            self.assertFalse(parsed)
+            self.assertEqual(textgrid.to_dict(), expected.to_dict())
+            self.assertEqual(textgrid[0].textgrid(), textgrid)
+
+        # Other options are other entries
+        textgrid, parsed = self.read(tiers = 'bell')
+        self.assertTrue(parsed)
+        self.assertEqual([tier.name for tier in textgrid], ['bell'])
+        self.assertFalse(self.read(tiers = ['bell'])[1])
+
+        path = self.src_dir / 'Mary_John_bell-1-bin.TextGrid'
+        expected = mytextgrid.read_textgrid(path, 'binary')
+        for _ in range(2):
+            textgrid = mytextgrid.read_textgrid(path, 'binary', cache = self.cache)
+            self.assertEqual(textgrid.to_dict(), expected.to_dict())
+
+    def test_changed_file(self):
+        self.read()
+        stat = os.stat(self.path)
+        os.utime(self.path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertTrue(self.read()[1])
+
+        cache = DiskCache(self.tmp_dir / 'cache', key = 'hash')
+        self.assertTrue(self.read(cache = cache)[1])
+        os.utime(self.path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        self.assertFalse(self.read(cache = cache)[1])
+
+        text = self.path.read_text(encoding = 'utf-8').replace('ñoz', 'noz')
+        self.path.write_text(text, encoding = 'utf-8')
+        textgrid, parsed = self.read(cache = cache)
+        self.assertTrue(parsed)
+        self.assertEqual(textgrid[0][4].text, 'noz')
+
+    def test_changed_while_read(self):
+        # The file is rewritten after it is parsed, before the TextGrid is stored.
+        def read_long(*args, **kwds):
+            textgrid = reader_read_long(*args, **kwds)
+            text = self.path.read_text(encoding = 'utf-8').replace('ñoz', 'noz')
+            self.path.write_text(text, encoding = 'utf-8')
+            return textgrid
+
+        reader_read_long = reader.read_long
+        for key in ['stat', 'hash']:
+            shutil.copy(self.src_dir / 'encodings/text-UTF8-LONG-LF.TextGrid', self.path)
+            cache = DiskCache(self.tmp_dir / key, key = key)
+            with mock.patch.object(cache_module, '_hash_file',
+                                   wraps = cache_module._hash_file) as hash_file:
+                with mock.patch.object(reader, 'read_long', read_long):
+                    mytextgrid.read_textgrid(self.path, cache = cache)
+            self.assertEqual(hash_file.call_count, 1 if key == 'hash' else 0)
+
+            textgrid, parsed = self.read(cache = cache)
+            self.assertTrue(parsed, msg = key)
+            self.assertEqual(textgrid[0][4].text, 'noz')
+
+    def test_tiers_iterator(self):
+        for cache in [self.cache, MemoryCache()]:
+            for _ in range(2):
+                textgrid = mytextgrid.read_textgrid(
+                    self.path, tiers = (name for name in ['John']), cache = cache
+                )
+                self.assertEqual([tier.name for tier in textgrid], ['John'])
+
+    def test_damaged_entry(self):
+        self.read()
+        for entry in (self.tmp_dir / 'cache').iterdir():
+            entry.write_bytes(b'damaged')
+        self.assertTrue(self.read()[1])
+        self.assertFalse(self.read()[1])
+
+    def test_eviction(self):
+        paths = []
+        for i in range(4):
+            path = self.tmp_dir / f'{i}.TextGrid'
+            shutil.copy(self.path, path)
+            paths.append(path)
+
+        self.read(paths[0])
+        entry_size = self.cache.size()
+        cache = DiskCache(self.tmp_dir / 'cache', max_size = int(entry_size * 2.5))
+        for path in paths:
+            self.read(path, cache = cache)
+            time.sleep(0.01) # Entries are ordered by modification time
+        self.assertLessEqual(cache.size(), cache.max_size)
+        self.assertEqual(len(list((self.tmp_dir / 'cache').iterdir())), 2)
+        self.assertFalse(self.read(paths[3], cache = cache)[1])
+        self.assertTrue(self.read(paths[0], cache = cache)[1])
+
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+
+class TestMemoryCache(unittest.TestCase):
+    """
+    Test the in-process cache of parsed TextGrids.
+    """
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.paths = []
+        for i in range(3):
+            path = self.tmp_dir / f'{i}.TextGrid'
+            shutil.copy(Path(__file__).parent / 'files/encodings/text-UTF8-LONG-LF.TextGrid', path)
+            self.paths.append(path)
+        self.expected = mytextgrid.read_textgrid(self.paths[0])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_shared(self):
+        cache = MemoryCache(max_entries = 2)
+        textgrid = mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        self.assertIs(mytextgrid.read_textgrid(str(self.paths[0]), cache = cache), textgrid)
+        self.assertEqual(cache.info(), (1, 1, 1, cache.info().size))
+        self.assertGreater(cache.info().size, 0)
+
+        # Least recently used entries are removed
+        mytextgrid.read_textgrid(self.paths[1], cache = cache)
+        mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        mytextgrid.read_textgrid(self.paths[2], cache = cache)
+        self.assertEqual(cache.info()[:3], (2, 3, 2))
+        self.assertIs(mytextgrid.read_textgrid(self.paths[0], cache = cache), textgrid)
+        mytextgrid.read_textgrid(self.paths[1], cache = cache)
+        self.assertEqual(cache.misses, 4)
+
+        # Changed files are read again
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        textgrid_new = mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        self.assertIsNot(textgrid_new, textgrid)
+        self.assertEqual(textgrid_new.to_dict(), self.expected.to_dict())
+        self.assertEqual(cache.misses, 5)
+
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, 0))
+
+    def test_copies(self):
+        cache = MemoryCache(shared = False)
+        textgrids = [mytextgrid.read_textgrid(self.paths[0], cache = cache) for _ in range(2)]
+        self.assertIsNot(textgrids[0], textgrids[1])
+        textgrids[0][0][4].text = 'changed'
+        self.assertEqual(textgrids[1].to_dict(), self.expected.to_dict())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_max_bytes(self):
+        cache = MemoryCache(max_bytes = 1)
+        mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        self.assertEqual(cache.info(), (0, 2, 0, 0))
+
+    def test_changed_while_read(self):
+        # The file is rewritten after it is parsed, before the TextGrid is stored.
+        def read_long(*args, **kwds):
+            textgrid = reader_read_long(*args, **kwds)
+            content = self.paths[0].read_text(encoding = 'utf-8')
+            self.paths[0].write_text(content.replace('Mary', 'Maria'), encoding = 'utf-8')
+            return textgrid
+
+        cache = MemoryCache()
+        reader_read_long = reader.read_long
+        with mock.patch.object(reader, 'read_long', read_long):
+            mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        textgrid = mytextgrid.read_textgrid(self.paths[0], cache = cache)
+        self.assertEqual(textgrid.to_dict(), mytextgrid.read_textgrid(self.paths[0]).to_dict())
+        self.assertEqual(textgrid[0].name, 'Maria')
+        self.assertEqual(cache.misses, 2)
+
+    def test_default_cache(self):
+        cache_module.memory_cache.clear()
+        textgrid = mytextgrid.read_textgrid(self.paths[0], cache = True)
+        self.assertIs(mytextgrid.read_textgrid(self.paths[0], cache = True), textgrid)
+        self.assertEqual(cache_module.memory_cache.hits, 1)
+        self.assertIsNot(mytextgrid.read_textgrid(self.paths[0], cache = False), textgrid)
+        cache_module.memory_cache.clear()
+
+if __name__ == '__main__':
+    unittest.main()
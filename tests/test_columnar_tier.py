@@ -0,0 +1,206 @@
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.core.columnar_tier import ColumnarIntervalTier, ColumnarPointTier, to_columnar
+from mytextgrid.core.interval_tier import Interval, IntervalTier
+from mytextgrid.core.point_tier import Point, PointTier
+
+class TestColumnarTier(unittest.TestCase):
+    """
+    Test that columnar tiers behave as the tiers that store item objects.
+    """
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.src_path = Path(__file__).parent / 'files/encodings/text-UTF8-LONG-LF.TextGrid'
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def assert_same_items(self, tier, expected):
+        self.assertEqual(len(tier), len(expected))
+        self.assertEqual(
+            [(item.xmin, item.xmax, item.text) for item in tier],
+            [(item.xmin, item.xmax, item.text) for item in expected]
+        )
+
+    def test_interval_tier(self):
+        times = ['-0.05', 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 1]
+        texts = ['', 'p', 'e', 'r', 'r', 'o', '']
+        tier = ColumnarIntervalTier.from_boundaries(times, texts, 'palabra')
+        expected = IntervalTier.from_boundaries(times, texts, 'palabra')
+        self.assert_same_items(tier, expected)
+        self.assertIsInstance(tier[0], Interval)
+        self.assertIs(tier[-1].tier(), tier)
+        self.assertEqual(tier[1:3][1].text, 'e')
+
+        for time in ['-0.05', '0.15', '0.2', '0.99', '1', '-10', '12']:
+            self.assertEqual(tier.get_index_at_time(time), expected.get_index_at_time(time))
+            self.assertEqual(tier.get_index_at_time_boundary(time),
+                             expected.get_index_at_time_boundary(time))
+
+        rng = random.Random(0)
+        for _ in range(200):
+            time = Decimal(rng.randrange(-49, 1000)) / 1000
+            try:
+                expected.insert_boundary(time)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    tier.insert_boundary(time)
+            else:
+                tier.insert_boundary(time)
+        self.assert_same_items(tier, expected)
+
+        for tier_ in [tier, expected]:
+            tier_.set_text_at_index(3, 'a', 'b')
+            tier_.remove_boundary('0.3')
+            tier_.move_boundary('0.1', '0.1005')
+        self.assert_same_items(tier, expected)
+
+        with self.assertRaises(ValueError):
+            tier.move_boundary('0.2', '0.9')
+        with self.assertRaises(ValueError):
+            tier.remove_boundary('0.15')
+        with self.assertRaises(IndexError):
+            tier[len(tier)]
+
+    def test_point_tier(self):
+        tier = ColumnarPointTier('tone', 0, 1)
+        expected = PointTier('tone', 0, 1)
+        for tier_ in [tier, expected]:
+            tier_.insert_point(0.4, 'H')
+            tier_.insert_point(0.1, 'L')
+            tier_.insert_point(0.7, 'L')
+            tier_.remove_point(1)
+        self.assert_same_items(tier, expected)
+        self.assertIsInstance(tier[0], Point)
+        self.assertEqual(tier.get_index_at_time(0.7), 1)
+        self.assertIsNone(tier.get_index_at_time(0.4))
+        self.assertEqual(tier.get_point_at_time(0.1).text, 'L')
+        with self.assertRaises(ValueError):
+            tier.insert_point(0.1, 'H')
+
+        tier = ColumnarPointTier.from_points([0.1, 0.4, 0.7], ['L', 'H', 'L'], 'tone', 0, 1)
+        self.assertEqual([point.time for point in tier], [Decimal('0.1'), Decimal('0.4'), Decimal('0.7')])
+        with self.assertRaises(ValueError):
+            ColumnarPointTier.from_points([0.4, 0.1], ['', ''], 'tone', 0, 1)
+
+    def test_set_text(self):
+        tier = ColumnarIntervalTier.from_boundaries([0, 1, 2, 3], ['a', 'b', 'c'])
+        last = tier[2]
+        first = tier[0]
+        tier.insert_boundary('0.5')
+
+        # The last interval did not change, so its text is set in the tier.
+        last.text = 'C'
+        self.assertEqual([interval.text for interval in tier], ['a', '', 'b', 'C'])
+
+        # The first interval was split: it is no longer in the tier.
+        first.text = 'A'
+        self.assertEqual(first.text, 'A')
+        self.assertEqual(tier[0].text, 'a')
+
+        tier = ColumnarPointTier.from_points([0.1, 0.4], ['L', 'H'], 'tone', 0, 1)
+        point = tier[1]
+        tier.remove_point(0)
+        point.text = 'L*'
+        self.assertEqual(tier[0].text, 'L*')
+
+    def test_exact_times(self):
+        # The digits are kept, even for values that do not fit in 64 bits.
+        times = ['0', '0.000000012345678901234567890', '0.50', '1234.5678901234567', '1E+4']
+        tier = ColumnarPointTier.from_points(times, ['a'] * len(times), 'times', 0, 10000)
+        self.assertEqual([str(point.time) for point in tier], [str(Decimal(time)) for time in times])
+        tier.insert_point('0.25')
+        self.assertEqual(str(tier[2].time), '0.25')
+
+    def test_ticks(self):
+        # Some times are in the same nanosecond and some are negative.
+        times = ['-1', '-0.0000000005', '0', '0.1000000001', '0.10000000011', '0.1000000002', '2']
+        texts = ['a', 'b', 'c', 'd', 'e', 'f']
+        tier = ColumnarIntervalTier.from_boundaries(times, texts, 'ticks', resolution = '1e-9')
+        expected = IntervalTier.from_boundaries(times, texts, 'ticks')
+        self.assertEqual(tier.resolution, Decimal('1e-9'))
+        self.assert_same_items(tier, expected)
+
+        queries = times + ['-2', '-0.0000000001', '0.10000000010', '0.100000000105', '0.5', '3']
+        for time in queries:
+            self.assertEqual(tier.get_index_at_time(time), expected.get_index_at_time(time),
+                             msg = time)
+            self.assertEqual(tier.get_index_at_time_boundary(time),
+                             expected.get_index_at_time_boundary(time), msg = time)
+
+        for tier_ in [tier, expected]:
+            tier_.insert_boundary('0.100000000105')
+            tier_.remove_boundary('0.10000000011')
+            tier_.move_boundary('0.1000000002', '0.10000000019')
+        self.assert_same_items(tier, expected)
+        self.assertEqual(tier.get_index_at_time('0.100000000195'), 5)
+
+        points = ColumnarPointTier.from_points(['0.5', '1'], ['a', 'b'], 'points', 0, 2,
+                                               resolution = '0.25')
+        points.insert_point('0.6', 'c')
+        points.insert_point('0.55', 'd')
+        self.assertEqual([point.text for point in points], ['a', 'd', 'c', 'b'])
+        self.assertEqual(points.get_index_at_time('0.6'), 2)
+        self.assertIsNone(points.get_index_at_time('0.58'))
+
+        # Ticks that do not fit in 64 bits are kept as int.
+        tier = ColumnarIntervalTier.from_boundaries([0, 50, 100], ['', ''], resolution = '1e-18')
+        self.assertEqual(tier.get_index_at_time('99.999999999999999999'), 1)
+
+        with self.assertRaises(ValueError):
+            ColumnarIntervalTier('ticks', 0, 1, resolution = 0)
+
+    def test_to_columnar(self):
+        for lazy in [False, True]:
+            textgrid = mytextgrid.read_textgrid(self.src_path, lazy = lazy)
+            columnar = to_columnar(textgrid)
+            self.assertEqual(columnar.to_dict(), textgrid.to_dict())
+            self.assertIsInstance(columnar[0], (ColumnarIntervalTier, ColumnarPointTier))
+            self.assertIs(columnar[0].textgrid(), columnar)
+
+        for options in [{'columnar': True}, {'resolution': '1e-9'}]:
+            textgrid = mytextgrid.read_textgrid(self.src_path, **options)
+            self.assertTrue(all(
+                isinstance(tier, (ColumnarIntervalTier, ColumnarPointTier)) for tier in textgrid
+            ))
+            for format_ in ['long', 'short', 'binary']:
+                path = self.tmp_dir / f'{format_}.TextGrid'
+                textgrid.write(path, format_)
+                expected = self.tmp_dir / f'{format_}-expected.TextGrid'
+                mytextgrid.read_textgrid(self.src_path).write(expected, format_)
+                self.assertEqual(path.read_bytes(), expected.read_bytes())
+
+    def test_read_columnar(self):
+        expected = mytextgrid.read_textgrid(self.src_path)
+        paths = {}
+        for format_ in ['long', 'short', 'binary']:
+            paths[format_] = self.tmp_dir / f'{format_}.TextGrid'
+            expected.write(paths[format_], format_)
+
+        # The tiers are built in columns, without making item objects first.
+        options = [{'format_': format_} for format_ in ['long', 'short', 'binary', 'auto']]
+        options += [{'lazy': True}, {'memory_map': True}, {'format_': 'short', 'memory_map': True}]
+        with mock.patch.object(IntervalTier, 'from_boundaries') as from_boundaries, \
+                mock.patch.object(PointTier, 'from_points') as from_points:
+            for kwds in options:
+                path = paths.get(kwds.get('format_'), paths['long'])
+                textgrid = mytextgrid.read_textgrid(path, resolution = '1e-9', **kwds)
+                self.assertIsInstance(textgrid[0], ColumnarIntervalTier, msg = kwds)
+                self.assertIsInstance(textgrid[2], ColumnarPointTier, msg = kwds)
+                self.assertEqual(textgrid[0].resolution, Decimal('1e-9'))
+                self.assertEqual(textgrid.to_dict(), expected.to_dict(), msg = kwds)
+        self.assertFalse(from_boundaries.called or from_points.called)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import gzip
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io.compression import detect_compression, open_file
+from mytextgrid.io.utils import detect_textgrid_format, is_textgrid_file
+
+class TestCompression(unittest.TestCase):
+    """
+    Test reading and writing compressed TextGrid files.
+    """
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.src_path = Path(__file__).parent / 'files/encodings/text-UTF8-LONG-LF.TextGrid'
+        self.textgrid = mytextgrid.read_textgrid(self.src_path)
+        self.expected = self.textgrid.to_dict()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_write_and_read(self):
+        extensions = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.lzma': 'lzma'}
+        for extension, compression in extensions.items():
+            for format_ in ['long', 'short', 'binary']:
+                path = self.tmp_dir / f'{format_}.TextGrid{extension}'
+                self.textgrid.write(path, format_)
+                self.assertEqual(detect_compression(path), compression)
+                self.assertTrue(is_textgrid_file(path))
+                self.assertEqual(detect_textgrid_format(path), format_)
+
+                for options in [{}, {'lazy': True}, {'memory_map': True}]:
+                    textgrid = mytextgrid.read_textgrid(path, format_, **options)
+                    self.assertEqual(textgrid.to_dict(), self.expected,
+                                     msg = f'{path.name} {options}')
+                textgrid = mytextgrid.read_textgrid(path, 'auto', lazy = True)
+                self.assertEqual(textgrid.to_dict(), self.expected)
+
+                info = mytextgrid.read_textgrid_info(path)
+                self.assertEqual(info.format, format_)
+                self.assertEqual([tier.size for tier in info.tiers], [len(tier) for tier in textgrid])
+
+    def test_magic_bytes(self):
+        # A compressed file is recognized without its extension.
+        path = self.tmp_dir / 'corpus.TextGrid'
+        with gzip.open(path, 'wb') as file_object:
+            file_object.write(self.src_path.read_bytes())
+        self.assertEqual(detect_compression(path), 'gzip')
+        self.assertEqual(mytextgrid.read_textgrid(path).to_dict(), self.expected)
+
+        events = list(mytextgrid.iterparse(path))
+        self.assertEqual(events, list(mytextgrid.iterparse(self.src_path)))
+
+        # An uncompressed file is read as is whatever its extension.
+        path = self.tmp_dir / 'corpus.TextGrid.gz'
+        shutil.copy(self.src_path, path)
+        self.assertIsNone(detect_compression(path))
+        self.assertEqual(mytextgrid.read_textgrid(path).to_dict(), self.expected)
+
+    def test_open_file(self):
+        path = self.tmp_dir / 'labels.txt.gz'
+        with open_file(path, 'w', encoding = 'utf-16') as file_object:
+            file_object.write('ñoz\n')
+        with open_file(path, 'r', encoding = 'utf-16') as file_object:
+            self.assertEqual(file_object.read(), 'ñoz\n')
+        with gzip.open(path, 'rt', encoding = 'utf-16') as file_object:
+            self.assertEqual(file_object.read(), 'ñoz\n')
+
+        with open_file(path, 'wb', compression = None) as file_object:
+            file_object.write(b'plain')
+        self.assertEqual(path.read_bytes(), b'plain')
+
+        with self.assertRaises(ValueError):
+            with open_file(path, 'a'):
+                pass
+        with self.assertRaises(ValueError):
+            with open_file(path, 'rb', compression = 'zstd'):
+                pass
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+
+# Modules that are slow to import and only needed by some functions.
+DEFERRED_MODULES = ['jinja2', 'markupsafe', 'chardet', 'asyncio', 'zipfile',
+                    'tarfile', 'bz2', 'lzma', 'concurrent.futures', 'multiprocessing',
+                    'pickle']
+
+CODE = f'''
+import sys
+sys.path.insert(0, {str(package_dir)!r})
+import mytextgrid
+print(' '.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))
+'''
+
+class TestImportTime(unittest.TestCase):
+    """
+    Test that `import mytextgrid` does not load the heavy dependencies.
+    """
+    def run_python(self, *args):
+        result = subprocess.run(
+            [sys.executable, *args, '-c', CODE],
+            stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+            universal_newlines = True, check = True
+        )
+        return result
+
+    def test_deferred_imports(self):
+        result = self.run_python()
+        self.assertEqual(result.stdout.strip(), '')
+
+    def test_import_time(self):
+        # Each line of -X importtime is: import time: self | cumulative | name
+        result = self.run_python('-X', 'importtime')
+        times = {}
+        for line in result.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[1].strip().isdigit():
+                times[fields[2].strip()] = int(fields[1])
+        self.assertIn('mytextgrid', times)
+        message = f"import mytextgrid took {times['mytextgrid'] / 1000:.1f} ms"
+        for name in DEFERRED_MODULES:
+            self.assertNotIn(name, times, msg = message)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -139,5 +139,29 @@ class TestIntervalTier(unittest.TestCase):
             self.tier.set_text_at_index(10, ['p', 'e', 'r', 'o', 's'])
             self.tier.set_text_at_index(10, ('p', 'e', 'r', 'o', 's'))
 
+    def test_from_boundaries(self):
+        times = ['-0.05', 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 1]
+        texts = ['', 'p', 'e', 'r', 'r', 'o', '']
+        tier = IntervalTier.from_boundaries(times, texts, 'palabra')
+
+        self.assertEqual(tier.name, 'palabra')
+        self.assertEqual(tier.xmin, Decimal('-0.05'))
+        self.assertEqual(tier.xmax, Decimal('1'))
+        self.assertEqual(len(tier), len(self.tier))
+        for interval, expected in zip(tier, self.tier):
+            self.assertEqual(interval.xmin, expected.xmin)
+            self.assertEqual(interval.xmax, expected.xmax)
+            self.assertEqual(interval.text, expected.text)
+            self.assertEqual(interval.tier(), tier)
+
+        with self.assertRaises(ValueError):
+            IntervalTier.from_boundaries([0, 0.2, 0.1, 1], ['', '', ''])
+        with self.assertRaises(ValueError):
+            IntervalTier.from_boundaries([0, 0.2, 0.2, 1], ['', '', ''])
+        with self.assertRaises(ValueError):
+            IntervalTier.from_boundaries([0, 0.5, 1], ['a'])
+        with self.assertRaises(ValueError):
+            IntervalTier.from_boundaries([0], [])
+
 if __name__ == '__main__':
     unittest.main()
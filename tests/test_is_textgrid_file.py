@@ -70,5 +70,18 @@ class TestIsTextGrid(unittest.TestCase):
             detected_encoding = utils.detect_textgrid_encoding(path)
             self.assertEqual(encoding, detected_encoding)
 
+    def test_detect_textgrid_format(self):
+        for fname, is_textgrid, _ in self.fnames:
+            path = self.src_dir / fname
+            if not is_textgrid:
+                expected = ''
+            elif 'BIN' in fname:
+                expected = 'binary'
+            elif 'SHORT' in fname:
+                expected = 'short'
+            else:
+                expected = 'long'
+            self.assertEqual(utils.detect_textgrid_format(path), expected)
+
 if __name__ == '__main__':
     unittest.main()
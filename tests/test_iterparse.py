@@ -0,0 +1,156 @@
+import sys
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io import long
+from mytextgrid.io import text_parser
+from mytextgrid.io.events import IntervalItem, PointItem, TextGridHeader, TierHeader
+from mytextgrid.io.utils import detect_textgrid_encoding
+
+class TestIterparse(unittest.TestCase):
+    """
+    Test the incremental event parsers.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.fnames = [
+            'text-ISO_Latin_1-LONG.TextGrid',
+            'text-ISO_Latin_1-SHORT.TextGrid',
+            'text-UTF16BE-LONG-CR.TextGrid',
+            'text-UTF16LE-SHORT-CRLF.TextGrid',
+            'text-UTF8-LONG-CRLF.TextGrid',
+            'text-UTF8-SHORT-LF.TextGrid',
+        ]
+
+    def test_iterparse(self):
+        for fname in self.fnames:
+            events = list(mytextgrid.iterparse(self.src_dir / fname))
+            names = [event for event, _ in events]
+
+            self.assertEqual(events[0], ('textgrid', TextGridHeader('0', '1', '3')))
+            self.assertEqual(names.count('tier_start'), 3)
+            self.assertEqual(names.count('tier_end'), 3)
+            self.assertEqual(names.count('interval'), 20)
+            self.assertEqual(names.count('point'), 9)
+            self.assertEqual(
+                events[1],
+                ('tier_start', TierHeader(0, 'IntervalTier', 'Mary', '0', '1', '10'))
+            )
+            self.assertEqual(events[6], ('interval', IntervalItem('0.4', '0.5', 'ñoz')))
+            self.assertEqual(events[-2], ('point', PointItem('0.9', '')))
+
+    def test_long_and_short_events(self):
+        path = Path(__file__).parent / 'files'
+        long_events = list(mytextgrid.iterparse(path / 'Mary_John_bell-1.TextGrid'))
+        short_events = list(mytextgrid.iterparse(path / 'Mary_John_bell-1-short.TextGrid'))
+        self.assertEqual(long_events, short_events)
+
+    def test_concatenated_textgrids(self):
+        path = Path(__file__).parent / 'files' / 'Mary_John_bell-1.TextGrid'
+        text = path.read_text(encoding = 'utf-8')
+
+        events = list(long.iter_events(text * 3))
+        self.assertEqual([event for event, _ in events].count('textgrid'), 3)
+        self.assertEqual(events, list(text_parser.iter_events(text * 3)))
+
+    def test_values_split_between_chunks(self):
+        text = '"a ""quoted""\nlabel" -0.125 <exists> [12] 3e-05 ""'
+        expected = list(text_parser._iter_values([text]))
+        self.assertEqual(
+            expected,
+            [
+                ('string', 'a "quoted"\nlabel'),
+                ('number', '-0.125'),
+                ('flag', 'exists'),
+                ('number', '3e-05'),
+                ('string', ''),
+            ]
+        )
+        for size in range(1, 8):
+            chunks = [text[i:i+size] for i in range(0, len(text), size)]
+            self.assertEqual(list(text_parser._iter_values(chunks)), expected)
+
+        with self.assertRaises(ValueError):
+            list(text_parser._iter_values(['"unterminated']))
+
+class TestTextGridParser(unittest.TestCase):
+    """
+    Test the push parser fed with pieces of a TextGrid.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.path = Path(__file__).parent / 'files' / 'Mary_John_bell-1.TextGrid'
+
+    def feed(self, parser, data, size):
+        for i in range(0, len(data), size):
+            parser.feed(data[i:i+size])
+        return parser.close()
+
+    def test_feed_bytes(self):
+        for path in sorted(self.src_dir.glob('text-*.TextGrid')):
+            if '-BIN' in path.name.upper():
+                continue
+            expected = mytextgrid.read_textgrid(path, format_ = 'auto').to_dict()
+            data = path.read_bytes()
+            encoding = detect_textgrid_encoding(path)
+            for size in [1, 5, 4096]:
+                parser = mytextgrid.TextGridParser(encoding = encoding)
+                textgrid = self.feed(parser, data, size)
+                self.assertEqual(textgrid.to_dict(), expected, msg = f'{path.name} {size}')
+
+    def test_feed_text(self):
+        text = self.path.read_text(encoding = 'utf-8') * 2
+        parser = mytextgrid.TextGridParser(tiers = ['bell'], events = True)
+        textgrid = self.feed(parser, text, 7)
+        self.assertEqual([tier.name for tier in textgrid], ['bell'])
+        self.assertEqual(parser.read_events(), list(text_parser.iter_events(text)))
+        self.assertEqual(parser.read_events(), [])
+
+    def test_long_string(self):
+        # The label is split into many pieces, some of them between the two
+        # quotes of an escaped quote.
+        label = ('a' * 50 + '"') * 4000
+        text = self.path.read_text(encoding = 'utf-8')
+        text = text.replace('text = "a"', 'text = "{}"'.format(label.replace('"', '""')), 1)
+        for size in [100, 51, 7]:
+            textgrid = self.feed(mytextgrid.TextGridParser(), text, size)
+            self.assertEqual(textgrid[0][1].text, label)
+            self.assertEqual(textgrid[0][2].text, 'b')
+
+    def test_partial_results(self):
+        text = self.path.read_text(encoding = 'utf-8')
+        parser = mytextgrid.TextGridParser()
+        self.assertIsNone(parser.textgrid)
+
+        # Up to the middle of the second tier
+        parser.feed(text[:text.index('name = "John"') + 100])
+        self.assertEqual([tier.name for tier in parser.textgrid], ['Mary'])
+        self.assertEqual(len(parser.textgrid[0]), 4)
+        parser.feed(text[text.index('name = "John"') + 100:])
+        self.assertIs(parser.close(), parser.textgrid)
+        self.assertEqual(len(parser.textgrid), 3)
+
+    def test_errors(self):
+        text = self.path.read_text(encoding = 'utf-8')
+        parser = mytextgrid.TextGridParser()
+        parser.feed(text[:-30])
+        with self.assertRaises(ValueError):
+            parser.close()
+        with self.assertRaises(ValueError):
+            parser.feed(text[-30:])
+
+        parser = mytextgrid.TextGridParser()
+        with self.assertRaises(OSError):
+            self.feed(parser, '"ooTextFile" "Sound" 0 1 <exists> 1', 10)
+
+        with self.assertRaises(ValueError):
+            mytextgrid.TextGridParser().close()
+        with self.assertRaises(ValueError):
+            mytextgrid.TextGridParser().read_events()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.core.lazy_tier import LazyTier
+from mytextgrid.io import long
+
+MULTILINE_TEXTGRID = '''File type = "ooTextFile"
+Object class = "TextGrid"
+
+xmin = 0
+xmax = 1
+tiers? <exists>
+size = 2
+item []:
+    item [1]:
+        class = "IntervalTier"
+        name = "say ""hi"""
+        xmin = 0
+        xmax = 1
+        intervals: size = 2
+        intervals [1]:
+            xmin = 0
+            xmax = 0.5
+            text = "first ""line""
+second "" line
+    item [2]:
+third"""
+        intervals [2]:
+            xmin = 0.5
+            xmax = 1
+            text = ""
+    item [2]:
+        class = "TextTier"
+        name = "tone"
+        xmin = 0
+        xmax = 1
+        points: size = 1
+        points [1]:
+            number = 0.25
+            mark = "H
+L"
+'''
+
+class TestLongParser(unittest.TestCase):
+    """
+    Test the long-format tokenizer and parser.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.fnames = [
+            'text-UTF8-LONG-CR.TextGrid',
+            'text-UTF8-LONG-CRLF.TextGrid',
+            'text-UTF8-LONG-LF.TextGrid',
+        ]
+
+    def test_tokenize(self):
+        tokens = list(long._tokenize(MULTILINE_TEXTGRID.splitlines(True)))
+        self.assertEqual(tokens[0], ('file_type', 'ooTextFile'))
+        self.assertEqual(tokens[1], ('object_class', 'TextGrid'))
+        self.assertIn(('tier_name', 'say "hi"'), tokens)
+        self.assertIn(('interval_xmax', '0.5'), tokens)
+        self.assertIn(('point_number', '0.25'), tokens)
+
+    def test_parse_multiline_text(self):
+        textgrid = long.parse(MULTILINE_TEXTGRID)
+        interval_tier, point_tier = textgrid['tiers']
+
+        self.assertEqual(len(textgrid['tiers']), 2)
+        self.assertEqual(interval_tier['tier_name'], 'say "hi"')
+        self.assertEqual(
+            interval_tier['items'][0]['text'],
+            'first "line"\nsecond " line\n    item [2]:\nthird"'
+        )
+        self.assertEqual(interval_tier['items'][1]['text'], '')
+        self.assertEqual(point_tier['items'][0]['mark'], 'H\nL')
+
+    def test_read(self):
+        textgrid = long.read(MULTILINE_TEXTGRID)
+        expected = long.dict_to_textgrid(long.parse(MULTILINE_TEXTGRID))
+        self.assertEqual(textgrid.to_dict(), expected.to_dict())
+
+        for tier in textgrid:
+            self.assertEqual(tier.textgrid(), textgrid)
+            for item in tier:
+                self.assertEqual(item.tier(), tier)
+
+    def test_read_overlapping_intervals(self):
+        text = MULTILINE_TEXTGRID.replace('xmin = 0.5', 'xmin = 0.4')
+        with self.assertRaises(ValueError):
+            long.read(text)
+
+    def test_parse_eol(self):
+        for fname in self.fnames:
+            path = self.src_dir / fname
+            textgrid = long.parse_textgrid_file(path, 'utf-8')
+
+            self.assertEqual(textgrid['xmin'], '0')
+            self.assertEqual(textgrid['xmax'], '1')
+            self.assertEqual(len(textgrid['tiers']), 3)
+            self.assertEqual(len(textgrid['tiers'][0]['items']), 10)
+            self.assertEqual(textgrid['tiers'][0]['items'][4]['text'], 'ñoz')
+            self.assertEqual(len(textgrid['tiers'][2]['items']), 9)
+
+            textgrid_obj = long.read_textgrid_file(path, 'utf-8')
+            self.assertEqual(textgrid_obj[0][4].text, 'ñoz')
+
+    def test_read_selected_tiers(self):
+        expected = long.read(MULTILINE_TEXTGRID)
+        for tiers in ['tone', 1, ['tone'], lambda header: header.tier_class == 'TextTier']:
+            textgrid = long.read(MULTILINE_TEXTGRID, tiers = tiers)
+            self.assertEqual(len(textgrid), 1)
+            self.assertEqual(textgrid.to_dict()['tiers'], expected.to_dict()['tiers'][1:])
+
+        textgrid = long.read(MULTILINE_TEXTGRID, tiers = ['say "hi"', 'missing'])
+        self.assertEqual(len(textgrid), 1)
+        self.assertEqual(textgrid.to_dict()['tiers'], expected.to_dict()['tiers'][:1])
+
+        self.assertEqual(len(long.read(MULTILINE_TEXTGRID, tiers = [])), 0)
+        with self.assertRaises(TypeError):
+            long.read(MULTILINE_TEXTGRID, tiers = [1.5])
+        with self.assertRaises(TypeError):
+            long.read(MULTILINE_TEXTGRID, tiers = True)
+        with self.assertRaises(ValueError):
+            long.read(MULTILINE_TEXTGRID, tiers = [0, -1])
+
+    def test_read_binary_file(self):
+        path = Path(__file__).parent / 'files/Mary_John_bell-1-bin.TextGrid'
+        with self.assertRaisesRegex(OSError, 'not a TextGrid file in long format'):
+            mytextgrid.read_textgrid(path)
+        with self.assertRaisesRegex(OSError, 'not a TextGrid file in text format'):
+            mytextgrid.read_textgrid(path, 'short')
+
+    def test_read_lazy(self):
+        for fname in self.fnames + ['text-UTF16LE-LONG-CRLF.TextGrid']:
+            path = self.src_dir / fname
+            textgrid = long.read_textgrid_file(path, lazy = True)
+            self.assertTrue(all(isinstance(tier, LazyTier) for tier in textgrid._tiers))
+            self.assertEqual(len(textgrid), 3)
+            self.assertEqual(len(textgrid._tiers[2]), 9)
+
+            tier = textgrid[0]
+            self.assertEqual(tier[4].text, 'ñoz')
+            self.assertEqual(tier.textgrid(), textgrid)
+            self.assertIs(textgrid[0], tier)
+            self.assertIsInstance(textgrid._tiers[1], LazyTier)
+
+            expected = long.read_textgrid_file(path, 'utf-8' if 'UTF8' in fname else None)
+            self.assertEqual(textgrid.to_dict(), expected.to_dict())
+            self.assertFalse(any(isinstance(tier, LazyTier) for tier in textgrid._tiers))
+
+    def test_read_short_file(self):
+        path = Path(__file__).parent / 'files/Mary_John_bell-1-short.TextGrid'
+        for lazy in [False, True]:
+            with self.assertRaisesRegex(OSError, 'not a TextGrid file in long format'):
+                long.read_textgrid_file(path, lazy = lazy)
+            with self.assertRaisesRegex(OSError, 'not a TextGrid file in long format'):
+                mytextgrid.read_textgrid(path, lazy = lazy)
+
+    def test_read_lazy_multiline_text(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'multiline.TextGrid'
+            path.write_text(MULTILINE_TEXTGRID, encoding = 'utf-8')
+            textgrid = long.read_textgrid_file(path, 'utf-8', lazy = True)
+
+            point_tier = textgrid.get_tier_by_name('tone')[0]
+            self.assertIsInstance(textgrid._tiers[0], LazyTier)
+            self.assertEqual(point_tier[0].text, 'H\nL')
+            self.assertEqual(textgrid.to_dict(), long.read(MULTILINE_TEXTGRID).to_dict())
+
+            textgrid = long.read_textgrid_file(path, 'utf-8', lazy = True, tiers = [1])
+            self.assertEqual(len(textgrid), 1)
+            self.assertEqual(textgrid[0].name, 'tone')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import sys
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io import text_parser
+
+class TestMemoryMap(unittest.TestCase):
+    """
+    Test reading TextGrid files with memory_map=True.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.fnames = [
+            'text-UTF8-LONG-CR.TextGrid',
+            'text-UTF8-LONG-CRLF.TextGrid',
+            'text-UTF8-SHORT-LF.TextGrid',
+            'text-ISO_Latin_1-LONG.TextGrid',
+            'text-ISO_Latin_1-SHORT.TextGrid',
+            'text-UTF16LE-SHORT-CRLF.TextGrid', # Not memory-mapped
+        ]
+
+    def test_read_memory_map(self):
+        expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+        for fname in self.fnames:
+            textgrid = mytextgrid.read_textgrid(self.src_dir / fname, memory_map = True)
+            self.assertEqual(textgrid.to_dict(), expected.to_dict())
+            self.assertEqual(textgrid[0][4].text, 'ñoz')
+
+        textgrid = mytextgrid.read_textgrid(
+            self.src_dir / 'text-UTF8-LONG-LF.TextGrid', memory_map = True, tiers = 'bell'
+        )
+        self.assertEqual([tier.name for tier in textgrid], ['bell'])
+
+    def test_byte_values(self):
+        text = '"a ""quoted""\nlabel" -0.125 <exists> [12] 3e-05 "ñ" [1]\n'
+        self.assertEqual(
+            list(text_parser._iter_byte_values(text.encode('utf-8'), 'utf-8')),
+            list(text_parser._iter_values([text]))
+        )
+        self.assertEqual(
+            list(text_parser._iter_byte_values(text.encode('utf-8'), 'utf-8'))[-1],
+            ('string', 'ñ')
+        )
+        with self.assertRaises(ValueError):
+            list(text_parser._iter_byte_values(b'1 "unterminated', 'utf-8'))
+
+if __name__ == '__main__':
+    unittest.main()
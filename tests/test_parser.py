@@ -6,8 +6,39 @@ from pathlib import Path
 package_dir = Path(__file__).parent.parent.joinpath('src')
 sys.path.insert(0, str(package_dir))
 
+import mytextgrid
 from mytextgrid.io import text_parser
 
+SHORT_TEXTGRID = '''File type = "ooTextFile"
+Object class = "TextGrid"
+
+0
+1
+<exists>
+2
+"IntervalTier"
+"say ""hi"""
+0
+1
+2
+0
+0.5
+"first ""line""
+second "" line
+[2]"
+0.5
+1
+""
+"TextTier"
+"tone"
+0
+1
+1
+0.25
+"H
+L"
+'''
+
 class TestTextGridParser(unittest.TestCase):
     """
     Test Point object methods.
@@ -33,5 +64,40 @@ class TestTextGridParser(unittest.TestCase):
             print('='*20, fname, '='*20)
             pprint.pp(a)
 
+    def test_parse_dict(self):
+        textgrid = text_parser.parse(SHORT_TEXTGRID)
+        self.assertEqual((textgrid['xmin'], textgrid['xmax'], textgrid['size']), ('0', '1', 2))
+
+        interval_tier, point_tier = textgrid['tiers']
+        self.assertEqual(interval_tier['tier_name'], 'say "hi"')
+        self.assertEqual(interval_tier['tier_size'], 2)
+        self.assertEqual(
+            interval_tier['items'][0],
+            {'item_xmin': '0', 'item_xmax': '0.5',
+             'item_text': 'first "line"\nsecond " line\n[2]'}
+        )
+        self.assertEqual(point_tier['tier_class'], 'TextTier')
+        self.assertEqual(point_tier['items'], [{'item_point': '0.25', 'item_text': 'H\nL'}])
+
+    def test_read_short(self):
+        expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+        for path in sorted(self.src_dir.glob('*-SHORT*.TextGrid')):
+            for format_ in ('short', 'auto'):
+                textgrid = mytextgrid.read_textgrid(path, format_ = format_)
+                self.assertEqual(textgrid.to_dict(), expected.to_dict())
+
+        textgrid = mytextgrid.read_textgrid(
+            self.src_dir / 'text-UTF8-SHORT-CRLF.TextGrid', format_ = 'short', tiers = [0]
+        )
+        self.assertEqual(textgrid.to_dict()['tiers'], expected.to_dict()['tiers'][:1])
+
+        with self.assertRaises(ValueError):
+            mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid', format_ = 'xml')
+
+    def test_read_wrong_item(self):
+        text = SHORT_TEXTGRID.replace('0.25', '"0.25"')
+        with self.assertRaisesRegex(ValueError, 'Expected a number'):
+            text_parser.read(text)
+
 if __name__ == '__main__':
     unittest.main()
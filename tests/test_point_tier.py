@@ -49,5 +49,24 @@ class TestIntervalTier(unittest.TestCase):
         tier = self.point_tier
         time = tier.get_point_at_time(0.1)
 
+    def test_from_points(self):
+        tier = PointTier.from_points([0.1, 0.4, 0.7], ['L', 'H', 'L'], 'Tone', 0, 1)
+
+        self.assertEqual(tier.name, 'Tone')
+        self.assertEqual(len(tier), len(self.point_tier))
+        for point, expected in zip(tier, self.point_tier):
+            self.assertEqual(point.time, expected.time)
+            self.assertEqual(point.text, expected.text)
+            self.assertEqual(point.tier(), tier)
+
+        with self.assertRaises(ValueError):
+            PointTier.from_points([0.4, 0.1], ['H', 'L'])
+        with self.assertRaises(ValueError):
+            PointTier.from_points([0.1, 0.1], ['H', 'L'])
+        with self.assertRaises(ValueError):
+            PointTier.from_points([0.1, 2], ['H', 'L'], xmin = 0, xmax = 1)
+        with self.assertRaises(ValueError):
+            PointTier.from_points([0.1], ['H', 'L'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,50 @@
+import sys
+import unittest
+from pathlib import Path
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io.info import TierInfo
+
+class TestReadTextGridInfo(unittest.TestCase):
+    """
+    Test read_textgrid_info() with all the TextGrid formats.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+        self.fnames = [
+            ('text-UTF8-BIN.TextGrid', 'binary', None),
+            ('text-UTF16-BIN.TextGrid', 'binary', None),
+            ('text-UTF8-LONG-CRLF.TextGrid', 'long', 'utf-8'),
+            ('text-UTF16LE-LONG-LF.TextGrid', 'long', 'utf-16le'),
+            ('text-UTF8-SHORT-CR.TextGrid', 'short', 'utf-8'),
+            ('text-UTF16BE-SHORT-LF.TextGrid', 'short', 'utf-16be'),
+            ('text-ISO_Latin_1-SHORT.TextGrid', 'short', 'windows-1252'),
+        ]
+
+    def test_read_textgrid_info(self):
+        for fname, format_, encoding in self.fnames:
+            path = self.src_dir / fname
+            info = mytextgrid.read_textgrid_info(path)
+
+            self.assertEqual(info.path, path)
+            self.assertEqual(info.format, format_)
+            self.assertEqual(info.encoding, encoding)
+            self.assertEqual((info.xmin, info.xmax), (0, 1))
+            self.assertEqual(
+                info.tiers,
+                [
+                    TierInfo('Mary', 'IntervalTier', 0, 1, 10),
+                    TierInfo('John', 'IntervalTier', 0, 1, 10),
+                    TierInfo('bell', 'TextTier', 0, 1, 9),
+                ]
+            )
+
+    def test_read_textgrid_info_not_textgrid(self):
+        with self.assertRaises(OSError):
+            mytextgrid.read_textgrid_info(self.src_dir / 'empty_file')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import builtins
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+package_dir = Path(__file__).parent.parent.joinpath('src')
+sys.path.insert(0, str(package_dir))
+
+import mytextgrid
+from mytextgrid.io.source import read_source
+from mytextgrid.io.utils import detect_textgrid_encoding
+
+class TestSource(unittest.TestCase):
+    """
+    Test reading a TextGrid file once for detection, decoding and parsing.
+    """
+    def setUp(self):
+        self.src_dir = Path(__file__).parent / 'files/encodings'
+
+    def test_read_source(self):
+        for path in sorted(self.src_dir.glob('*.TextGrid')):
+            source = read_source(path)
+            fname = path.name.upper()
+            if '-BIN' in fname:
+                self.assertEqual(source.format, 'binary')
+                self.assertIsNone(source.encoding)
+                self.assertIsInstance(source.content, bytes)
+                continue
+
+            self.assertEqual(source.format, 'long' if '-LONG' in fname else 'short')
+            self.assertEqual(source.encoding, detect_textgrid_encoding(path))
+            self.assertTrue(source.content.startswith('File type = "ooTextFile"\nObject'))
+            self.assertNotIn('\r', source.content)
+            self.assertIn('ñoz', source.content)
+
+        source = read_source(self.src_dir / 'empty_file')
+        self.assertEqual(source.format, '')
+
+    def test_read_once(self):
+        expected = mytextgrid.read_textgrid(self.src_dir / 'text-UTF8-LONG-LF.TextGrid')
+        for fname in ['text-UTF8-LONG-CRLF.TextGrid', 'text-UTF16LE-SHORT-CR.TextGrid',
+                      'text-ISO_Latin_1-SHORT.TextGrid', 'text-UTF16-BIN.TextGrid']:
+            with mock.patch('builtins.open', wraps = builtins.open) as open_:
+                textgrid = mytextgrid.read_textgrid(self.src_dir / fname, format_ = 'auto')
+            self.assertEqual(open_.call_count, 1)
+            self.assertEqual(textgrid.to_dict(), expected.to_dict())
+
+        with self.assertRaises(OSError):
+            mytextgrid.read_textgrid(self.src_dir / 'empty_file', format_ = 'auto')
+
+if __name__ == '__main__':
+    unittest.main()
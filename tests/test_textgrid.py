@@ -88,6 +88,27 @@ class TestTextGrid(unittest.TestCase):
         tg = create_textgrid(0, 10)
         tg.write(output_dir / 'empty.TextGrid')
 
+    def test_write_quotes(self):
+        output_dir = Path(__file__).parent / 'results'
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        tg = create_textgrid(0, 1)
+        tier = tg.insert_tier('say "hi"')
+        tier.insert_boundary(0.5)
+        tier.set_text_at_index(0, 'a "b"\n"c"', '"')
+        tg.insert_tier('tone', False).insert_point(0.5, '""')
+
+        for format_ in ('long', 'short'):
+            path_out = output_dir / f'quotes-{format_}.TextGrid'
+            tg.write(path_out, format_)
+
+            # Praat doubles the quotes inside strings.
+            text = path_out.read_text(encoding = 'utf-8')
+            self.assertIn('"say ""hi"""', text)
+            self.assertIn('"a ""b""\n""c"""', text)
+            self.assertIn('""""""', text)
+            self.assertEqual(read_textgrid(path_out, format_).to_dict(), tg.to_dict())
+
     def test_parent_child_item(self):
         """
         Verify that the interval and point items return their textgrid
@@ -1,4 +1,5 @@
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -6,6 +7,7 @@ package_dir = Path(__file__).parent.parent.joinpath('src')
 sys.path.insert(0, str(package_dir))
 
 from mytextgrid import io
+from mytextgrid.io.utils import detect_textgrid_encoding
 
 class TestTextGrid(unittest.TestCase):
 
@@ -27,10 +29,30 @@ class TestTextGrid(unittest.TestCase):
         pass
 
     def test_read_long_latin_1(self):
-        pass
+        path = Path(__file__).parent / 'files/encodings/text-ISO_Latin_1-LONG.TextGrid'
+        self.assertEqual(detect_textgrid_encoding(path), 'windows-1252')
+        tg = io.read_textgrid(path)
+        self.assertEqual(tg[0][4].text, 'ñoz')
 
     def test_read_long_macroman(self):
         pass
 
+    def test_read_long_legacy_codepage(self):
+        # Not valid Windows-1252: the encoding is guessed by chardet.
+        labels = ['こんにちは。', '今日は良い天気ですね、散歩に行きましょう。', 'ありがとうございました。']
+        tg = io.create_textgrid(0, 3)
+        tier = tg.insert_tier('日本語')
+        tier.insert_boundaries(1, 2)
+        for interval, label in zip(tier, labels):
+            interval.text = label
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'shift_jis.TextGrid'
+            tg.write(path, encoding = 'shift_jis')
+            self.assertIn(detect_textgrid_encoding(path), ('shift_jis', 'cp932'))
+            for tg_new in (io.read_textgrid(path), io.read_textgrid(path, lazy = True)):
+                self.assertEqual(tg_new[0].name, '日本語')
+                self.assertEqual([interval.text for interval in tg_new[0]], labels)
+
 if __name__ == '__main__':
     unittest.main()